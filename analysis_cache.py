@@ -0,0 +1,168 @@
+"""
+LLM 분석 결과 캐시 모듈 (SQLite 기반, 내용 주소 지정)
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisCache:
+    """
+    분석 입력의 해시를 키로 분석 결과 JSON을 저장하는 디스크 캐시
+
+    TTL이 지난 항목은 조회 시 무시되고, 항목 수가 max_entries를 넘으면
+    가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        ttl: int = None,
+        max_entries: int = None
+    ):
+        self.db_path = db_path or Config.ANALYSIS_CACHE_DB_PATH
+        self.ttl = ttl if ttl is not None else Config.ANALYSIS_CACHE_TTL
+        self.max_entries = max_entries or Config.ANALYSIS_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect().execute("""
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._connect().execute(
+            'CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed ON analysis_cache (accessed_at)'
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        """
+        분석 입력으로 캐시 키 생성
+
+        Args:
+            **parts: 분석 결과에 영향을 주는 값들 (diff, 모델, 프롬프트 버전 등)
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key()로 만든 키
+
+        Returns:
+            Dict: 저장된 분석 결과 (없거나 만료되면 None)
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT value, created_at FROM analysis_cache WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl and now - row[1] > self.ttl:
+                conn.execute('DELETE FROM analysis_cache WHERE key = ?', (key,))
+                row = None
+
+            if row is not None:
+                conn.execute(
+                    'UPDATE analysis_cache SET accessed_at = ? WHERE key = ?',
+                    (now, key)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 분석 캐시 조회 실패: {e}")
+            row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict):
+        """
+        캐시 저장 (저장 후 용량 초과분 정리)
+
+        Args:
+            key: make_key()로 만든 키
+            value: 분석 결과
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO analysis_cache (key, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 분석 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        if self.ttl:
+            conn.execute(
+                'DELETE FROM analysis_cache WHERE created_at < ?',
+                (now - self.ttl,)
+            )
+
+        count = conn.execute('SELECT COUNT(*) FROM analysis_cache').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                """
+                DELETE FROM analysis_cache WHERE key IN (
+                    SELECT key FROM analysis_cache ORDER BY accessed_at LIMIT ?
+                )
+                """,
+                (overflow,)
+            )
+
+    def stats(self) -> Dict:
+        """캐시 적중 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
@@ -0,0 +1,138 @@
+"""
+코드 리뷰 분석 결과 스키마 검증 모듈
+
+LLM 응답을 summary/risks/suggestions/positive_points/overall_rating 구조에 맞춥니다.
+타입이 조금 어긋난 값(문자열로 온 위험 요소, 영문 심각도, 숫자 평점 등)은 그 자리에서 고치고,
+분석 결과로 쓸 수 없는 응답만 AnalysisSchemaError로 알립니다.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ANALYSIS_FIELDS = ('summary', 'risks', 'suggestions', 'positive_points', 'overall_rating')
+
+# 프롬프트에서 벗어난 표기 → 프롬프트 표기
+SEVERITY_ALIASES = {
+    '높음': '높음', 'high': '높음', 'critical': '높음', '심각': '높음', '치명적': '높음',
+    '중간': '중간', 'medium': '중간', 'moderate': '중간', '보통': '중간',
+    '낮음': '낮음', 'low': '낮음', 'minor': '낮음', 'info': '낮음',
+}
+PRIORITY_ALIASES = {
+    '필수': '필수', 'required': '필수', 'must': '필수', 'high': '필수',
+    '권장': '권장', 'recommended': '권장', 'should': '권장', 'medium': '권장',
+    '선택': '선택', 'optional': '선택', 'nice-to-have': '선택', 'low': '선택',
+}
+
+
+class AnalysisSchemaError(ValueError):
+    """분석 결과로 쓸 수 없는 응답 (객체가 아니거나 분석 필드가 하나도 없음)"""
+
+
+def validate_analysis(data: Any) -> Tuple[Dict, List[str]]:
+    """
+    파싱한 LLM 응답을 분석 결과 스키마에 맞춤
+
+    누락된 필드는 빈 값으로 채우고, 설명이 없는 위험 요소/제안처럼 쓸 수 없는 항목은 버립니다.
+    스키마 밖의 필드는 그대로 둡니다.
+
+    Args:
+        data: 파싱한 LLM 응답
+
+    Returns:
+        Tuple[Dict, List[str]]: (스키마에 맞춘 분석 결과, 고친 내용 설명)
+
+    Raises:
+        AnalysisSchemaError: 객체가 아니거나 분석 필드가 하나도 없는 경우
+    """
+    if not isinstance(data, dict):
+        raise AnalysisSchemaError(f"분석 결과가 JSON 객체가 아님 ({type(data).__name__})")
+    if not any(field in data for field in ANALYSIS_FIELDS):
+        raise AnalysisSchemaError(f"분석 필드가 없음 (키: {', '.join(list(data)[:5]) or '없음'})")
+
+    fixes: List[str] = []
+    result = dict(data)
+    missing = [field for field in ANALYSIS_FIELDS if field not in data]
+    if missing:
+        fixes.append(f"누락된 필드 {', '.join(missing)}")
+
+    result['summary'] = _text(data.get('summary'), 'summary', fixes)
+    result['risks'] = _items(data.get('risks'), 'risks', _risk, fixes)
+    result['suggestions'] = _items(data.get('suggestions'), 'suggestions', _suggestion, fixes)
+    result['positive_points'] = _items(data.get('positive_points'), 'positive_points', _point, fixes)
+    result['overall_rating'] = _rating(data.get('overall_rating'), fixes)
+    return result, fixes
+
+
+def _text(value: Any, field: str, fixes: List[str]) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value.strip()
+    fixes.append(f"{field} 타입 ({type(value).__name__})")
+    if isinstance(value, list):
+        return ' '.join(str(item).strip() for item in value if item is not None)
+    return str(value)
+
+
+def _items(
+    value: Any,
+    field: str,
+    normalize: Callable[[Any], Optional[Any]],
+    fixes: List[str]
+) -> List:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        fixes.append(f"{field} 타입 ({type(value).__name__})")
+        value = [value]
+
+    items = [normalize(item) for item in value]
+    dropped = sum(1 for item in items if item is None)
+    if dropped:
+        fixes.append(f"{field} 항목 {dropped}개 제외")
+    return [item for item in items if item is not None]
+
+
+def _risk(item: Any) -> Optional[Dict]:
+    if isinstance(item, str):
+        item = {'description': item}
+    if not isinstance(item, dict) or not str(item.get('description') or '').strip():
+        return None
+    severity = str(item.get('severity') or '').strip()
+    return {
+        **item,
+        'severity': SEVERITY_ALIASES.get(severity.lower(), '중간'),
+        'category': str(item.get('category') or '기타').strip(),
+        'description': str(item['description']).strip(),
+        'location': str(item.get('location') or 'N/A').strip()
+    }
+
+
+def _suggestion(item: Any) -> Optional[Dict]:
+    if isinstance(item, str):
+        item = {'description': item}
+    if not isinstance(item, dict) or not str(item.get('description') or '').strip():
+        return None
+    priority = str(item.get('priority') or '').strip()
+    return {
+        **item,
+        'priority': PRIORITY_ALIASES.get(priority.lower(), '권장'),
+        'description': str(item['description']).strip(),
+        'example': str(item.get('example') or '')
+    }
+
+
+def _point(item: Any) -> Optional[str]:
+    if isinstance(item, dict):
+        item = item.get('description') or next(iter(item.values()), None)
+    text = str(item).strip() if item is not None else ''
+    return text or None
+
+
+def _rating(value: Any, fixes: List[str]) -> str:
+    if value is None or value == '':
+        return 'N/A'
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        fixes.append(f"overall_rating 타입 ({type(value).__name__})")
+        return 'N/A'
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
@@ -1,15 +1,30 @@
 """
 PR 자동 분석 AI Agent - 메인 애플리케이션
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+import json
 import logging
 from datetime import datetime
+from typing import Callable
 
 from utils.config import Config
-from utils.webhook_validator import verify_github_signature
+from utils.webhook_validator import PayloadTooLarge, read_signed_body, scan_action
+from utils.job_queue import JobQueue, RetryLater, WorkerPool
+from utils.rate_limit import RateLimitExceeded
+from utils.model_router import ModelRouter
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.review_state import ReviewStateStore
+from utils.review_history import ReviewHistoryStore
+from utils.timing import StageTimer
+from utils.delivery_store import DeliveryDeduplicator
+from utils.llm_scheduler import pr_priority
+from utils.metrics import REGISTRY
 from services.github_service import GitHubService
 from services.llm_service import LLMService
 from services.slack_service import SlackService
+from services.slack_dispatcher import SlackDispatcher
+from services import review_pipeline
+from services.review_pipeline import review_key
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -29,16 +44,51 @@ logger = logging.getLogger(__name__)
 github_service = GitHubService()
 llm_service = LLMService()
 slack_service = SlackService()
+slack_dispatcher = SlackDispatcher(slack_service)
+review_state = ReviewStateStore()
+review_history = ReviewHistoryStore() if Config.REVIEW_HISTORY_ENABLED else None
+deliveries = DeliveryDeduplicator() if Config.WEBHOOK_DEDUP_ENABLED else None
+
+# 작업 큐 (워커 풀은 파일 하단에서 시작)
+job_queue = JobQueue()
+REVIEW_JOB = 'pr_review'
+
+# 리뷰를 실행하는 pull_request 액션
+REVIEW_ACTIONS = frozenset(['opened', 'synchronize', 'reopened'])
+# 연속으로 올 수 있어 REVIEW_DEBOUNCE_SECONDS 동안 모아서 처리하는 액션 (opened/reopened는 바로 처리)
+DEBOUNCED_ACTIONS = frozenset(['synchronize'])
+# action을 찾기 위해 먼저 읽는 본문 앞부분 크기
+WEBHOOK_SCAN_BYTES = 256
 
 
 @app.route('/', methods=['GET'])
 def health_check():
     """헬스 체크 엔드포인트"""
-    return jsonify({
+    status = {
         'status': 'healthy',
         'service': 'PR Review Agent',
         'timestamp': datetime.now().isoformat()
-    })
+    }
+    if llm_service.cache:
+        status['analysis_cache'] = llm_service.cache.stats()
+    status['github_rate_limit'] = GitHubService.rate_limiter.snapshot()
+    status['github_etag_hits'] = GitHubService.etag_cache.hits
+    status['slack_outbox'] = slack_dispatcher.stats()
+    status['model_routes'] = ModelRouter.stats()
+    status['llm_hedging'] = LLMService.hedge_policy.stats()
+    if Config.LLM_SCHEDULER_ENABLED:
+        status['llm_scheduler'] = LLMService.scheduler.stats()
+    if review_history:
+        status['review_history'] = review_history.stats()
+    if deliveries:
+        status['webhook_deliveries'] = deliveries.stats()
+    return jsonify(status)
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus 메트릭 엔드포인트 (프로세스 단위 집계)"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
 
 
 @app.route('/webhook/github', methods=['POST'])
@@ -46,124 +96,255 @@ def github_webhook():
     """
     GitHub Webhook 핸들러
     PR이 생성되면 자동으로 분석 실행
-    """
-    # 서명 검증
-    signature = request.headers.get('X-Hub-Signature-256')
-    if not verify_github_signature(
-        request.data,
-        signature,
-        Config.GITHUB_WEBHOOK_SECRET
-    ):
-        logger.warning("⚠️ Invalid webhook signature")
-        return jsonify({'error': 'Invalid signature'}), 401
     
-    # 이벤트 타입 확인
+    처리하지 않는 이벤트/액션은 서명 검증과 JSON 파싱 전에 헤더와 본문 앞부분만 보고 응답합니다.
+    (무시하는 요청은 본문 전체를 읽지 않으며 어떤 상태도 바꾸지 않음)
+    """
+    # 1. 이벤트 타입 확인 (헤더만 사용)
     event_type = request.headers.get('X-GitHub-Event')
-    
     if event_type != 'pull_request':
-        logger.info(f"ℹ️ Ignoring event type: {event_type}")
+        logger.debug(f"ℹ️ Ignoring event type: {event_type}")
         return jsonify({'message': 'Event type not supported'}), 200
     
-    # 페이로드 파싱
-    payload = request.json
-    action = payload.get('action')
+    # 2. 본문 크기 제한 (Content-Length가 있으면 읽기 전에 거절)
+    if (request.content_length or 0) > Config.WEBHOOK_MAX_BODY_BYTES:
+        logger.warning(f"⚠️ Webhook 본문이 너무 큼: {request.content_length} bytes")
+        return jsonify({'error': 'Payload too large'}), 413
     
-    # PR이 새로 생성된 경우에만 처리
-    if action not in ['opened', 'synchronize', 'reopened']:
-        logger.info(f"ℹ️ Ignoring PR action: {action}")
+    # 3. 본문 앞부분의 action만 보고 처리하지 않는 액션은 바로 응답
+    stream = request.stream
+    head = b''
+    while len(head) < WEBHOOK_SCAN_BYTES:
+        chunk = stream.read(WEBHOOK_SCAN_BYTES - len(head))
+        if not chunk:
+            break
+        head += chunk
+    action = scan_action(head)
+    if action is not None and action not in REVIEW_ACTIONS:
+        logger.debug(f"ℹ️ Ignoring PR action: {action}")
         return jsonify({'message': f'Action {action} not processed'}), 200
     
+    # 4. 나머지 본문을 읽으면서 서명 검증
     try:
-        # PR 정보 추출
+        body = read_signed_body(
+            stream,
+            request.headers.get('X-Hub-Signature-256'),
+            Config.GITHUB_WEBHOOK_SECRET,
+            Config.WEBHOOK_MAX_BODY_BYTES,
+            head=head
+        )
+    except PayloadTooLarge as e:
+        logger.warning(f"⚠️ {e}")
+        return jsonify({'error': 'Payload too large'}), 413
+    if body is None:
+        logger.warning("⚠️ Invalid webhook signature")
+        return jsonify({'error': 'Invalid signature'}), 401
+    
+    # GitHub 재전달(같은 delivery ID)은 후속 처리 없이 바로 응답
+    delivery_id = request.headers.get('X-GitHub-Delivery')
+    if deliveries and delivery_id and not deliveries.claim(delivery_id):
+        logger.info(f"♻️ 중복 전달 무시: {delivery_id}")
+        return jsonify({'message': 'Duplicate delivery ignored', 'delivery_id': delivery_id}), 200
+    
+    try:
+        # 5. 페이로드 파싱 (action이 맨 앞에 없던 경우 여기서 다시 확인)
+        payload = json.loads(body)
+        action = payload.get('action')
+        if action not in REVIEW_ACTIONS:
+            logger.debug(f"ℹ️ Ignoring PR action: {action}")
+            return jsonify({'message': f'Action {action} not processed'}), 200
+        
+        # PR 정보 추출 (워커는 작업 payload의 PR 정보를 쓰므로 API를 다시 조회하지 않음)
         pr = payload['pull_request']
         pr_number = pr['number']
         repo_full_name = payload['repository']['full_name']
-        pr_url = pr['html_url']
-        
-        pr_info = {
-            'number': pr_number,
-            'title': pr['title'],
-            'author': pr['user']['login'],
-            'base_branch': pr['base']['ref'],
-            'head_branch': pr['head']['ref'],
-            'description': pr.get('body', ''),
-            'url': pr_url,
-            'repo': repo_full_name
-        }
+        pr_info = github_service.build_pr_info(repo_full_name, pr)
         
         logger.info(f"🔔 새 PR 감지: {repo_full_name}#{pr_number}")
         
-        # 백그라운드에서 처리 (실제 프로덕션에서는 큐 사용 권장)
-        process_pr_review(pr_info)
+        # 큐에 넣고 즉시 응답 (GitHub 타임아웃 방지)
+        # 같은 PR의 연속 push는 quiet window 동안 하나의 작업으로 합침 (새 PR의 첫 리뷰는 기다리지 않음)
+        job_id = job_queue.enqueue(
+            REVIEW_JOB,
+            pr_info,
+            coalesce_key=review_key(pr_info),
+            delay=Config.REVIEW_DEBOUNCE_SECONDS if action in DEBOUNCED_ACTIONS else 0,
+            priority=pr_priority(pr_info),
+            tenant=repo_full_name
+        )
+        worker_pool.notify()
+        
+        # 진행 상황 모드면 리뷰 대기 메시지를 outbox로 게시 (같은 PR이면 기존 메시지 갱신)
+        slack_dispatcher.send_placeholder(pr_info)
         
         return jsonify({
-            'message': 'PR review started',
-            'pr_number': pr_number
-        }), 200
+            'message': 'PR review queued',
+            'pr_number': pr_number,
+            'job_id': job_id
+        }), 202
         
     except Exception as e:
         logger.error(f"❌ Webhook 처리 중 오류: {e}", exc_info=True)
+        # 처리하지 못했으므로 GitHub의 재전달은 받아들이도록 등록 취소
+        if deliveries and delivery_id:
+            deliveries.release(delivery_id)
         return jsonify({'error': str(e)}), 500
 
 
-def process_pr_review(pr_info: dict):
+def record_review(
+    pr_info: dict,
+    status: str,
+    analysis: dict = None,
+    timer: StageTimer = None,
+    error: str = None
+):
+    """리뷰 결과를 메트릭과 이력 저장소에 기록 (review_pipeline.record_review 참고)"""
+    review_pipeline.record_review(review_history, pr_info, status, analysis, timer, error)
+
+
+def process_pr_review(
+    pr_info: dict,
+    notify_errors: bool = True,
+    is_cancelled: Callable[[], bool] = None,
+    deadline: Deadline = None
+) -> bool:
     """
     PR 리뷰 프로세스 실행
     
+    단계 사이의 판단은 review_pipeline 모듈을 사용하며 AsyncReviewEngine과 같습니다.
+    
     Args:
         pr_info: PR 정보 딕셔너리
+        notify_errors: 실패 시 Slack 에러 알림 전송 여부
+        is_cancelled: 더 새로운 head가 들어와 이 리뷰가 무의미해졌는지 확인하는 함수
+        deadline: 작업 전체 마감 시간 (기본값: 지금부터 Config.REVIEW_DEADLINE_SECONDS)
+        
+    Returns:
+        bool: 성공 여부 (False면 재시도 대상)
     """
+    is_cancelled = is_cancelled or (lambda: False)
+    deadline = deadline or Deadline(Config.REVIEW_DEADLINE_SECONDS)
+    pr_label = review_key(pr_info)
+    progress = slack_service.start_progress(pr_info)
+    timer = StageTimer()
+    
     try:
-        logger.info(f"🚀 PR 분석 시작: {pr_info['repo']}#{pr_info['number']}")
+        logger.info(f"🚀 PR 분석 시작: {pr_label}")
+        progress.update("📥 Diff 가져오는 중")
         
-        # 1. GitHub에서 diff 가져오기
-        logger.info("📥 Diff 가져오는 중...")
-        diff = github_service.get_pr_diff(
-            pr_info['repo'],
-            pr_info['number']
-        )
+        # 1. GitHub에서 diff 가져오기 (이전에 분석한 head가 있으면 그 이후 바뀐 파일만)
+        with timer.stage('diff'):
+            state = review_state.get(pr_label) if Config.INCREMENTAL_REVIEW_ENABLED else None
+            base_sha = review_pipeline.incremental_base(state, pr_info)
+            parsed = None
+            if base_sha:
+                logger.info(f"📥 {base_sha[:7]} 이후 변경분 가져오는 중...")
+                parsed = github_service.get_compare_diff_files(
+                    pr_info['repo'],
+                    base_sha,
+                    pr_info['head_sha'],
+                    max_bytes=Config.DIFF_MAX_BYTES,
+                    max_lines=Config.DIFF_MAX_LINES
+                )
+            incremental = parsed is not None
+            
+            if not incremental:
+                logger.info("📥 Diff 가져오는 중...")
+                parsed = github_service.get_pr_diff_files(
+                    pr_info['repo'],
+                    pr_info['number'],
+                    max_bytes=Config.DIFF_MAX_BYTES,
+                    max_lines=Config.DIFF_MAX_LINES
+                )
         
-        if not diff:
-            error_msg = "Failed to fetch PR diff"
+        if not parsed or not (parsed[0] or incremental):
+            error_msg = review_pipeline.FETCH_DIFF_FAILED
             logger.error(f"❌ {error_msg}")
-            slack_service.send_error_notification(error_msg, pr_info['url'])
-            return
-        
-        # Diff 크기 확인 (너무 크면 잘라내기)
-        formatted_diff = github_service.format_diff_for_analysis(diff, max_lines=500)
-        logger.info(f"✅ Diff 가져오기 완료 ({len(diff.split(chr(10)))} 라인)")
-        
-        # 2. LLM으로 분석
-        logger.info("🤖 LLM 분석 중...")
-        analysis = llm_service.analyze_pr(
-            title=pr_info['title'],
-            author=pr_info['author'],
-            base_branch=pr_info['base_branch'],
-            head_branch=pr_info['head_branch'],
-            description=pr_info['description'],
-            diff=formatted_diff
+            record_review(pr_info, 'error', timer=timer, error=error_msg)
+            if notify_errors:
+                slack_dispatcher.send_error_notification(error_msg, pr_info['url'])
+            return False
+        
+        diff_files, diff_stats = parsed
+        logger.info(
+            f"✅ Diff 가져오기 완료 ({diff_stats.files}개 파일, {diff_stats.lines} 라인, {diff_stats.bytes} bytes)"
         )
+        if diff_stats.truncated:
+            logger.warning("⚠️ Diff 크기 제한 도달, 이후 내용은 읽지 않음")
+        changes = review_pipeline.diff_changes(diff_files)
         
-        if not analysis:
-            logger.warning("⚠️ LLM 분석 실패, fallback 사용")
-            analysis = llm_service.create_fallback_analysis(
-                "LLM API 응답 실패"
+        with timer.stage('filter'):
+            # 생성/vendored/바이너리 파일은 LLM에 보내기 전에 요약하거나 제외
+            # (.gitattributes는 베이스 브랜치 기준: PR이 스스로 리뷰 대상을 빼지 못하게 하고 캐시 키를 고정)
+            gitattributes = None
+            if Config.DIFF_FILTER_ENABLED and Config.DIFF_FILTER_USE_GITATTRIBUTES:
+                gitattributes = github_service.get_file_content(
+                    pr_info['repo'], '.gitattributes', pr_info['base_branch']
+                )
+            # 파일/hunk 단위로 토큰 예산에 맞게 분할
+            chunks, coverage = review_pipeline.plan_chunks(
+                diff_files,
+                gitattributes,
+                llm_service.diff_token_budget(pr_info['title'], pr_info['description'])
             )
+            del diff_files
+        
+        if is_cancelled():
+            logger.info(f"⏭️ 새 push로 대체되어 분석 취소: {pr_label}")
+            return True
         
-        logger.info("✅ 분석 완료")
+        # 2. LLM으로 분석 (요청 타임아웃은 남은 시간 이하로 제한)
+        deadline.check("LLM 분석")
+        logger.info(f"🤖 LLM 분석 중... (남은 시간 {deadline.remaining():.0f}초)")
+        progress.analysis_started(len(chunks), f"{diff_stats.files}개 파일, {diff_stats.lines} 라인")
+        with timer.stage('llm'):
+            chunk_results = llm_service.analyze_chunks(
+                title=pr_info['title'],
+                author=pr_info['author'],
+                base_branch=pr_info['base_branch'],
+                head_branch=pr_info['head_branch'],
+                description=pr_info['description'],
+                chunks=chunks,
+                on_event=progress.on_llm_event,
+                deadline=deadline,
+                # 호출 한도는 저장소 간에 나눠 쓰고 보호 브랜치 대상 PR을 먼저 분석
+                tenant=pr_info['repo'],
+                priority=pr_priority(pr_info)
+            )
         
-        # 3. Slack으로 결과 전송
-        logger.info("📤 Slack 전송 중...")
-        success = slack_service.send_pr_review(
-            pr_info=pr_info,
-            analysis=analysis,
-            pr_url=pr_info['url']
+        # 파일별 결과로 나눠 두고, 증분 분석이면 이번 diff에 포함된 파일의 이전 결과를 교체
+        analysis, review_status, file_results = review_pipeline.build_analysis(
+            llm_service, chunks, chunk_results, diff_stats, coverage, deadline,
+            state=state, incremental=incremental, changes=changes
         )
         
-        if success:
-            logger.info(f"✅ PR 리뷰 완료: {pr_info['repo']}#{pr_info['number']}")
-        else:
-            logger.error(f"❌ Slack 전송 실패: {pr_info['repo']}#{pr_info['number']}")
+        logger.info(f"✅ 분석 완료 (모델 라우트: {', '.join(analysis.get('model_routes') or ['-'])})")
+        
+        if is_cancelled():
+            logger.info(f"⏭️ 새 push로 대체되어 전송 취소: {pr_label}")
+            return True
+        
+        # 모든 구간을 분석한 경우에만 다음 push의 증분 분석 기준으로 저장
+        if file_results is not None:
+            count = review_pipeline.next_incremental_count(
+                chunk_results, coverage, diff_stats, state, incremental
+            )
+            if count is not None:
+                review_state.put(pr_label, pr_info['head_sha'], file_results, count)
+            else:
+                review_state.delete(pr_label)
+        
+        # 3. Slack 전송 대기열에 추가 (속도 제한/재시도는 디스패처가 담당)
+        progress.close()
+        logger.info("📤 Slack 전송 대기열에 추가")
+        with timer.stage('slack'):
+            slack_dispatcher.send_pr_review(
+                pr_info=pr_info,
+                analysis=analysis,
+                pr_url=pr_info['url']
+            )
+        logger.info(f"✅ PR 리뷰 완료: {pr_label}")
+        record_review(pr_info, review_status, analysis, timer)
         
         # 4. (선택사항) GitHub PR에도 코멘트 남기기
         # github_service.post_pr_comment(
@@ -172,12 +353,46 @@ def process_pr_review(pr_info: dict):
         #     "🤖 AI 코드 리뷰가 Slack으로 전송되었습니다!"
         # )
         
+        return True
+        
+    except RateLimitExceeded as e:
+        # GitHub 호출 한도 소진: 실패로 세지 않고 한도 초기화 이후로 연기
+        logger.warning(f"⏸️ GitHub 호출 한도 소진: {e}")
+        raise RetryLater(e.retry_after, str(e))
+    except DeadlineExceeded as e:
+        logger.warning(f"⏱️ {e}: {pr_label}")
+        record_review(pr_info, 'error', timer=timer, error=str(e))
+        if notify_errors:
+            slack_dispatcher.send_error_notification(f"PR 분석 시간 초과: {e}", pr_info.get('url'))
+        return False
     except Exception as e:
         logger.error(f"❌ PR 리뷰 처리 중 오류: {e}", exc_info=True)
-        slack_service.send_error_notification(
-            f"PR 분석 중 오류 발생: {str(e)}",
-            pr_info.get('url')
-        )
+        record_review(pr_info, 'error', timer=timer, error=str(e))
+        if notify_errors:
+            slack_dispatcher.send_error_notification(
+                f"PR 분석 중 오류 발생: {str(e)}",
+                pr_info.get('url')
+            )
+        return False
+
+
+def handle_review_job(job: dict) -> bool:
+    """
+    큐 워커용 PR 리뷰 작업 핸들러
+    
+    Args:
+        job: JobQueue.claim()으로 받은 작업
+        
+    Returns:
+        bool: 성공 여부
+    """
+    # 마지막 시도에서만 Slack 에러 알림 전송
+    is_last_attempt = job['attempts'] >= job['max_attempts']
+    return process_pr_review(
+        job['payload'],
+        notify_errors=is_last_attempt,
+        is_cancelled=lambda: job_queue.is_superseded(job)
+    )
 
 
 @app.route('/test/analyze', methods=['POST'])
@@ -203,35 +418,160 @@ def test_analyze():
         pr_number = data['pr_number']
         
         # PR 정보 가져오기
-        pr_details = github_service.get_pr_details(repo, pr_number)
+        try:
+            pr_details = github_service.get_pr_details(repo, pr_number)
+        except RateLimitExceeded as e:
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = str(int(e.retry_after))
+            return response, 503
         
         if not pr_details:
             return jsonify({'error': 'PR not found'}), 404
         
-        pr_info = {
-            'number': pr_number,
-            'title': pr_details['title'],
-            'author': pr_details['user']['login'],
-            'base_branch': pr_details['base']['ref'],
-            'head_branch': pr_details['head']['ref'],
-            'description': pr_details.get('body', ''),
-            'url': pr_details['html_url'],
-            'repo': repo
-        }
+        pr_info = github_service.build_pr_info(repo, pr_details)
         
-        # 분석 실행
-        process_pr_review(pr_info)
+        # 분석 작업 큐에 추가
+        job_id = job_queue.enqueue(
+            REVIEW_JOB,
+            pr_info,
+            coalesce_key=review_key(pr_info),
+            priority=pr_priority(pr_info),
+            tenant=repo
+        )
+        worker_pool.notify()
+        slack_dispatcher.send_placeholder(pr_info)
         
         return jsonify({
-            'message': 'Analysis started',
-            'pr_info': pr_info
-        }), 200
+            'message': 'Analysis queued',
+            'pr_info': pr_info,
+            'job_id': job_id
+        }), 202
         
     except Exception as e:
         logger.error(f"❌ 수동 분석 중 오류: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/reviews', methods=['GET'])
+def list_reviews():
+    """
+    리뷰 이력 조회 엔드포인트
+    
+    Query Parameters:
+        repo: 저장소 전체 이름 (owner/repo)
+        since: 이 시각 이후 기록만 (unix timestamp 또는 ISO 8601)
+        pr: PR 번호
+        head_sha: head 커밋 SHA
+        limit: 페이지 크기 (최대 500, 기본 100)
+        cursor: 이전 응답의 next_cursor
+        include: 'analysis'면 분석 결과 포함
+    """
+    if review_history is None:
+        return jsonify({'error': 'Review history is disabled'}), 404
+    
+    args = request.args
+    try:
+        since = args.get('since')
+        if since:
+            try:
+                since = float(since)
+            except ValueError:
+                since = datetime.fromisoformat(since).timestamp()
+        pr_number = int(args['pr']) if args.get('pr') else None
+        limit = int(args.get('limit', 100))
+        reviews, next_cursor = review_history.query(
+            repo=args.get('repo'),
+            since=since,
+            pr_number=pr_number,
+            head_sha=args.get('head_sha'),
+            limit=limit,
+            cursor=args.get('cursor'),
+            include_analysis=args.get('include') == 'analysis'
+        )
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
+    
+    return jsonify({'reviews': reviews, 'next_cursor': next_cursor})
+
+
+# /metrics 조회 시점에 읽어오는 값 (큐 길이, 캐시 적중 수)
+QUEUE_JOBS = REGISTRY.gauge('job_queue_jobs', '작업 큐 상태별 작업 수', ('queue', 'status'))
+CACHE_LOOKUPS = REGISTRY.counter('cache_lookups_total', '캐시 조회 결과별 누적 횟수', ('cache', 'result'))
+WEBHOOK_DELIVERIES = REGISTRY.counter('webhook_deliveries_total', 'webhook 전달 처리 결과별 누적 횟수', ('result',))
+
+
+def collect_service_metrics():
+    for status, count in job_queue.stats().items():
+        QUEUE_JOBS.set(count, queue='review', status=status)
+    for status, count in slack_dispatcher.stats().items():
+        QUEUE_JOBS.set(count, queue='slack_outbox', status=status)
+    
+    caches = [llm_service.cache, getattr(getattr(worker_pool, 'llm_service', None), 'cache', None)]
+    analysis_hits = sum(cache.hits for cache in caches if cache)
+    analysis_misses = sum(cache.misses for cache in caches if cache)
+    CACHE_LOOKUPS.set(analysis_hits, cache='analysis', result='hit')
+    CACHE_LOOKUPS.set(analysis_misses, cache='analysis', result='miss')
+    CACHE_LOOKUPS.set(GitHubService.etag_cache.hits, cache='github_etag', result='hit')
+    CACHE_LOOKUPS.set(GitHubService.repo_files.hits, cache='repo_file', result='hit')
+    CACHE_LOOKUPS.set(GitHubService.repo_files.misses, cache='repo_file', result='miss')
+    
+    if deliveries:
+        delivery_stats = deliveries.stats()
+        WEBHOOK_DELIVERIES.set(delivery_stats['accepted'], result='accepted')
+        WEBHOOK_DELIVERIES.set(delivery_stats['duplicates'], result='duplicate')
+
+
+REGISTRY.add_collector(collect_service_metrics)
+
+# 큐 워커 (PIPELINE_MODE=async면 단일 이벤트 루프에서 처리)
+if Config.PIPELINE_MODE == 'async':
+    from services.async_pipeline import AsyncReviewEngine
+    worker_pool = AsyncReviewEngine(job_queue, slack_dispatcher=slack_dispatcher, review_history=review_history)
+else:
+    worker_pool = WorkerPool(job_queue, handle_review_job)
+
+# 프로세스가 처리할 수 있는 큐 ('review': PR 리뷰, 'slack': Slack outbox 전송)
+WORKER_QUEUES = ('review', 'slack')
+
+
+def start_workers(queues=WORKER_QUEUES):
+    """
+    이 프로세스에서 큐 처리 시작
+    
+    Args:
+        queues: 처리할 큐 이름 목록
+    """
+    if 'review' in queues:
+        worker_pool.start()
+    if 'slack' in queues:
+        slack_dispatcher.start()
+
+
+def shutdown(timeout: float = None):
+    """
+    큐 처리 중지 (SIGTERM 시 호출)
+    
+    새 작업은 더 가져가지 않고 진행 중인 작업이 끝나기를 기다립니다.
+    시간 안에 끝나지 않은 작업은 큐에 반납되어 다른 프로세스가 이어서 처리합니다.
+    
+    Args:
+        timeout: 전체 최대 대기 시간(초) (기본값: Config.SHUTDOWN_GRACE_SECONDS)
+    """
+    deadline = Deadline(timeout if timeout is not None else Config.SHUTDOWN_GRACE_SECONDS)
+    # 리뷰가 끝나면서 넣은 Slack 메시지와 이력까지 내보내도록 리뷰 → Slack → 이력 순서로 중지
+    worker_pool.stop(deadline.remaining())
+    slack_dispatcher.stop(deadline.remaining())
+    if review_history:
+        review_history.stop(deadline.remaining())
+    logger.info("👋 큐 처리 중지 완료")
+
+
+# PROCESS_ROLE=web이면 요청 수신과 큐 추가만 하고 처리는 worker.py 프로세스에 맡김
+# (gunicorn은 preload 없이 워커 프로세스마다 이 모듈을 import하므로 fork 이후에 스레드가 시작됨)
+if Config.PROCESS_ROLE == 'all':
+    start_workers()
+
+
 if __name__ == '__main__':
     # 환경변수 검증
     try:
@@ -245,6 +585,8 @@ if __name__ == '__main__':
     logger.info(f"   Host: {Config.HOST}")
     logger.info(f"   Port: {Config.PORT}")
     logger.info(f"   Debug: {Config.DEBUG}")
+    logger.info(f"   Pipeline: {Config.PIPELINE_MODE} (동시 처리 {worker_pool.concurrency})")
+    logger.info(f"   Role: {Config.PROCESS_ROLE}")
     
     # Flask 앱 실행
     app.run(
@@ -0,0 +1,349 @@
+"""
+asyncio 기반 PR 리뷰 실행 엔진
+
+하나의 이벤트 루프에서 작업 큐를 소비하며 여러 리뷰를 동시에 진행합니다.
+Config.PIPELINE_MODE = 'async'일 때 WorkerPool 대신 사용됩니다.
+"""
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from typing import Callable, Dict, Optional
+
+from utils.config import Config
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.review_state import ReviewStateStore
+from utils.review_history import ReviewHistoryStore
+from utils.timing import StageTimer
+from utils.job_queue import JobQueue, RetryLater
+from utils.rate_limit import RateLimitExceeded
+from utils.llm_scheduler import pr_priority
+from services.async_services import AsyncGitHubService, AsyncLLMService, AsyncSlackService
+from services.slack_dispatcher import SlackDispatcher
+from services import review_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncReviewEngine:
+    """
+    작업 큐를 소비하는 비동기 리뷰 엔진 (WorkerPool과 같은 start/notify/stop 인터페이스)
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        max_in_flight: int = None,
+        poll_interval: float = None,
+        slack_dispatcher: Optional[SlackDispatcher] = None,
+        review_history: Optional[ReviewHistoryStore] = None
+    ):
+        """
+        Args:
+            queue: 작업 큐
+            max_in_flight: 동시에 진행할 최대 리뷰 수 (기본값: Config.ASYNC_MAX_IN_FLIGHT)
+            poll_interval: 큐가 비었을 때 대기 시간(초)
+            slack_dispatcher: Slack 전송 outbox (없으면 AsyncSlackService로 직접 전송)
+            review_history: 리뷰 이력 저장소 (없으면 기록하지 않음)
+        """
+        self.queue = queue
+        self.concurrency = max_in_flight or Config.ASYNC_MAX_IN_FLIGHT
+        self.poll_interval = poll_interval or Config.QUEUE_POLL_INTERVAL
+        self.github_service = AsyncGitHubService()
+        self.llm_service = AsyncLLMService()
+        self.slack_service = AsyncSlackService()
+        self.slack_dispatcher = slack_dispatcher
+        self.review_state = ReviewStateStore()
+        self.review_history = review_history
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._worker_id = f"{os.getpid()}-async-{uuid.uuid4().hex[:6]}"
+
+    def start(self):
+        """이벤트 루프 스레드 시작"""
+        if self._thread:
+            return
+
+        self.queue.maintain()
+
+        self._stopping = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete,
+            args=(self._consume(),),
+            name='async-review-engine',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"⚡ 비동기 리뷰 엔진 시작 (최대 {self.concurrency}개 동시 처리)")
+
+    def notify(self):
+        """새 작업이 추가되었음을 알림"""
+        if self._loop and self._wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def stop(self, timeout: float = None):
+        """
+        엔진 중지 (진행 중인 리뷰는 끝날 때까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간(초), 넘기면 진행 중인 작업을 큐에 반납
+        """
+        self._stopping = True
+        self.notify()
+        if self._thread:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                # 다른 프로세스가 lease 만료를 기다리지 않고 바로 이어서 처리
+                released = self.queue.release([self._worker_id])
+                if released:
+                    logger.warning(f"↩️ 종료 시간 초과로 작업 {released}개 반납")
+        self._thread = None
+
+    async def _consume(self):
+        self._wakeup = asyncio.Event()
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks = set()
+
+        while not self._stopping:
+            await slots.acquire()
+            if self.queue.maintenance_due():
+                await asyncio.to_thread(self.queue.maintain)
+            try:
+                job = await asyncio.to_thread(self.queue.claim, self._worker_id)
+            except Exception as e:
+                logger.error(f"❌ 작업 가져오기 실패: {e}")
+                job = None
+
+            if job is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            task = asyncio.create_task(self._execute(job))
+            tasks.add(task)
+            task.add_done_callback(lambda t: (tasks.discard(t), slots.release()))
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for service in (self.github_service, self.llm_service, self.slack_service):
+            await service.close()
+
+    async def _execute(self, job: Dict):
+        error = None
+        try:
+            is_last_attempt = job['attempts'] >= job['max_attempts']
+            success = await self.process_pr_review(
+                job['payload'],
+                notify_errors=is_last_attempt,
+                is_cancelled=lambda: self.queue.is_superseded(job)
+            )
+        except RetryLater as e:
+            await asyncio.to_thread(self.queue.defer, job, e.delay, str(e))
+            return
+        except Exception as e:
+            logger.error(f"❌ 작업 처리 중 오류 ({job['id']}): {e}", exc_info=True)
+            success = False
+            error = str(e)
+
+        await asyncio.to_thread(self.queue.settle, job, success, error)
+
+    async def process_pr_review(
+        self,
+        pr_info: dict,
+        notify_errors: bool = True,
+        is_cancelled: Callable[[], bool] = None,
+        deadline: Deadline = None
+    ) -> bool:
+        """
+        PR 리뷰 프로세스 실행 (app.process_pr_review의 비동기 버전)
+
+        I/O만 비동기로 수행하고 단계 사이의 판단은 review_pipeline 모듈을 동기 버전과 함께 사용합니다.
+
+        Args:
+            pr_info: PR 정보 딕셔너리
+            notify_errors: 실패 시 Slack 에러 알림 전송 여부
+            is_cancelled: 더 새로운 head가 들어와 이 리뷰가 무의미해졌는지 확인하는 함수
+            deadline: 작업 전체 마감 시간 (기본값: 지금부터 Config.REVIEW_DEADLINE_SECONDS)
+
+        Returns:
+            bool: 성공 여부 (False면 재시도 대상)
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        deadline = deadline or Deadline(Config.REVIEW_DEADLINE_SECONDS)
+        pr_label = review_pipeline.review_key(pr_info)
+        progress = self.slack_service.start_progress(pr_info)
+        loop = asyncio.get_running_loop()
+        timer = StageTimer()
+
+        try:
+            logger.info(f"🚀 PR 분석 시작 (async): {pr_label}")
+            await asyncio.to_thread(progress.update, "📥 Diff 가져오는 중")
+
+            # 1. GitHub에서 diff 가져오기 (이전에 분석한 head가 있으면 그 이후 바뀐 파일만)
+            with timer.stage('diff'):
+                state = None
+                if Config.INCREMENTAL_REVIEW_ENABLED:
+                    state = await asyncio.to_thread(self.review_state.get, pr_label)
+                base_sha = review_pipeline.incremental_base(state, pr_info)
+                parsed = None
+                if base_sha:
+                    parsed = await self.github_service.get_compare_diff_files(
+                        pr_info['repo'],
+                        base_sha,
+                        pr_info['head_sha'],
+                        max_bytes=Config.DIFF_MAX_BYTES,
+                        max_lines=Config.DIFF_MAX_LINES
+                    )
+                incremental = parsed is not None
+
+                if not incremental:
+                    parsed = await self.github_service.get_pr_diff_files(
+                        pr_info['repo'],
+                        pr_info['number'],
+                        max_bytes=Config.DIFF_MAX_BYTES,
+                        max_lines=Config.DIFF_MAX_LINES
+                    )
+
+            if not parsed or not (parsed[0] or incremental):
+                error_msg = review_pipeline.FETCH_DIFF_FAILED
+                logger.error(f"❌ {error_msg}")
+                self._record(pr_info, 'error', timer=timer, error=error_msg)
+                if notify_errors:
+                    await self._send_error(error_msg, pr_info['url'])
+                return False
+
+            diff_files, diff_stats = parsed
+            logger.info(f"✅ Diff 가져오기 완료 ({diff_stats.files}개 파일, {diff_stats.lines} 라인)")
+            if diff_stats.truncated:
+                logger.warning("⚠️ Diff 크기 제한 도달, 이후 내용은 읽지 않음")
+            changes = review_pipeline.diff_changes(diff_files)
+
+            with timer.stage('filter'):
+                gitattributes = None
+                if Config.DIFF_FILTER_ENABLED and Config.DIFF_FILTER_USE_GITATTRIBUTES:
+                    gitattributes = await self.github_service.get_file_content(
+                        pr_info['repo'], '.gitattributes', pr_info['base_branch']
+                    )
+                chunks, coverage = review_pipeline.plan_chunks(
+                    diff_files,
+                    gitattributes,
+                    self.llm_service.diff_token_budget(pr_info['title'], pr_info['description'])
+                )
+                del diff_files
+
+            if await asyncio.to_thread(is_cancelled):
+                logger.info(f"⏭️ 새 push로 대체되어 분석 취소: {pr_label}")
+                return True
+
+            # 2. LLM으로 분석 (요청 타임아웃은 남은 시간 이하로 제한)
+            deadline.check("LLM 분석")
+            await asyncio.to_thread(
+                progress.analysis_started,
+                len(chunks),
+                f"{diff_stats.files}개 파일, {diff_stats.lines} 라인"
+            )
+            with timer.stage('llm'):
+                chunk_results = await self.llm_service.analyze_chunks(
+                    title=pr_info['title'],
+                    author=pr_info['author'],
+                    base_branch=pr_info['base_branch'],
+                    head_branch=pr_info['head_branch'],
+                    description=pr_info['description'],
+                    chunks=chunks,
+                    # Slack 갱신은 블로킹 호출이므로 이벤트 루프 밖에서 실행
+                    on_event=lambda key, value: loop.run_in_executor(None, progress.on_llm_event, key, value),
+                    deadline=deadline,
+                    # 호출 한도는 저장소 간에 나눠 쓰고 보호 브랜치 대상 PR을 먼저 분석
+                    tenant=pr_info['repo'],
+                    priority=pr_priority(pr_info)
+                )
+
+            # 파일별 결과로 나눠 두고, 증분 분석이면 이번 diff에 포함된 파일의 이전 결과를 교체
+            analysis, review_status, file_results = review_pipeline.build_analysis(
+                self.llm_service, chunks, chunk_results, diff_stats, coverage, deadline,
+                state=state, incremental=incremental, changes=changes
+            )
+
+            if await asyncio.to_thread(is_cancelled):
+                logger.info(f"⏭️ 새 push로 대체되어 전송 취소: {pr_label}")
+                return True
+
+            # 모든 구간을 분석한 경우에만 다음 push의 증분 분석 기준으로 저장
+            if file_results is not None:
+                count = review_pipeline.next_incremental_count(
+                    chunk_results, coverage, diff_stats, state, incremental
+                )
+                if count is not None:
+                    await asyncio.to_thread(
+                        self.review_state.put, pr_label, pr_info['head_sha'], file_results, count
+                    )
+                else:
+                    await asyncio.to_thread(self.review_state.delete, pr_label)
+
+            # 3. Slack으로 결과 전송
+            await asyncio.to_thread(progress.close)
+            with timer.stage('slack'):
+                success = await self._send_review(pr_info, analysis)
+
+            if success:
+                logger.info(f"✅ PR 리뷰 완료: {pr_label}")
+                self._record(pr_info, review_status, analysis, timer)
+            else:
+                logger.error(f"❌ Slack 전송 실패: {pr_label}")
+                self._record(pr_info, 'error', analysis, timer, error="Slack 전송 실패")
+            return success
+
+        except RateLimitExceeded as e:
+            logger.warning(f"⏸️ GitHub 호출 한도 소진: {e}")
+            raise RetryLater(e.retry_after, str(e))
+        except DeadlineExceeded as e:
+            logger.warning(f"⏱️ {e}: {pr_label}")
+            self._record(pr_info, 'error', timer=timer, error=str(e))
+            if notify_errors:
+                await self._send_error(f"PR 분석 시간 초과: {e}", pr_info.get('url'))
+            return False
+        except Exception as e:
+            logger.error(f"❌ PR 리뷰 처리 중 오류: {e}", exc_info=True)
+            self._record(pr_info, 'error', timer=timer, error=str(e))
+            if notify_errors:
+                await self._send_error(f"PR 분석 중 오류 발생: {str(e)}", pr_info.get('url'))
+            return False
+
+    def _record(
+        self,
+        pr_info: dict,
+        status: str,
+        analysis: Dict = None,
+        timer: StageTimer = None,
+        error: str = None
+    ):
+        """리뷰 결과를 메트릭과 이력 저장소에 기록 (큐에 넣기만 하므로 이벤트 루프를 막지 않음)"""
+        review_pipeline.record_review(self.review_history, pr_info, status, analysis, timer, error)
+
+
+    async def _send_review(self, pr_info: dict, analysis: Dict) -> bool:
+        if self.slack_dispatcher:
+            return await asyncio.to_thread(
+                self.slack_dispatcher.send_pr_review, pr_info, analysis, pr_info['url']
+            )
+        return await self.slack_service.send_pr_review(
+            pr_info=pr_info,
+            analysis=analysis,
+            pr_url=pr_info['url']
+        )
+
+    async def _send_error(self, error_message: str, pr_url: str = None) -> bool:
+        if self.slack_dispatcher:
+            return await asyncio.to_thread(
+                self.slack_dispatcher.send_error_notification, error_message, pr_url
+            )
+        return await self.slack_service.send_error_notification(error_message, pr_url)
@@ -0,0 +1,674 @@
+"""
+asyncio 기반 서비스 모듈 (aiohttp 사용)
+
+동기 서비스 클래스를 상속하여 프롬프트/메시지 포맷팅 로직은 그대로 재사용하고
+네트워크 I/O만 비동기로 수행합니다.
+"""
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from utils.config import Config
+from utils.diff_parser import DiffFile, DiffStats, parse_diff
+from services.github_service import GitHubService
+from services.llm_service import LLMService
+from services.slack_service import SlackService
+from utils.http_client import IDEMPOTENT_METHODS, RETRY_STATUS_CODES
+from utils.json_stream import IncrementalJSONParser
+from utils.analysis_schema import AnalysisSchemaError
+from utils.model_router import ModelRoute
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.llm_scheduler import PRIORITY_NORMAL, SchedulerTimeout
+from utils.metrics import LLM_OUTPUT_REPAIRS, observe_http
+
+
+class AsyncHTTPMixin:
+    """aiohttp 세션 관리와 5xx/429 재시도 (요청마다 지연 시간/크기/재시도 횟수 기록)"""
+
+    _client: Optional[aiohttp.ClientSession] = None
+
+    def _get_client(self) -> aiohttp.ClientSession:
+        # 세션은 실행 중인 이벤트 루프 안에서 생성해야 함
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=Config.HTTP_POOL_MAXSIZE)
+            self._client = aiohttp.ClientSession(connector=connector)
+        return self._client
+
+    def _client_timeout(self, timeout: Tuple[float, float] = None) -> aiohttp.ClientTimeout:
+        connect, read = timeout or self.timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        timeout: Tuple[float, float] = None,
+        **kwargs
+    ) -> aiohttp.ClientResponse:
+        """
+        요청 전송 (재시도 대상 응답/연결 실패 시 jitter 포함 지수 backoff)
+
+        POST 같은 비멱등 요청은 연결 자체가 안 된 경우만 재시도합니다
+        (5xx/429와 응답 도중 끊긴 요청은 중복 실행될 수 있으므로 outbox/스케줄러가 재시도).
+
+        Args:
+            timeout: (connect, read) 타임아웃 (기본값: self.timeout)
+
+        Returns:
+            aiohttp.ClientResponse: 본문을 읽지 않은 응답 (호출자가 release 필요)
+        """
+        client = self._get_client()
+        retries = Config.HTTP_MAX_RETRIES
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        backoff = Config.HTTP_RETRY_BACKOFF
+
+        # 본문 크기를 알 수 있도록 JSON은 한 번만 직렬화해서 전송 (재시도 때도 재사용)
+        if 'json' in kwargs:
+            kwargs['data'] = json.dumps(kwargs.pop('json')).encode('utf-8')
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Content-Type': 'application/json'}
+        data = kwargs.get('data')
+        request_bytes = len(data) if isinstance(data, (bytes, str)) else None
+
+        for attempt in range(retries + 1):
+            started = time.monotonic()
+            try:
+                response = await client.request(
+                    method, url, timeout=self._client_timeout(timeout), **kwargs
+                )
+            except aiohttp.ClientConnectionError as e:
+                if attempt >= retries or not (idempotent or isinstance(e, aiohttp.ClientConnectorError)):
+                    raise
+                await asyncio.sleep(backoff * (2 ** attempt) + random.uniform(0, backoff))
+                continue
+
+            if response.status not in RETRY_STATUS_CODES or attempt >= retries or not idempotent:
+                observe_http(
+                    self.SERVICE_NAME,
+                    method,
+                    response.status,
+                    time.monotonic() - started,
+                    request_bytes,
+                    response.content_length,
+                    attempt
+                )
+                return response
+
+            retry_after = response.headers.get('Retry-After')
+            response.release()
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = backoff * (2 ** attempt) + random.uniform(0, backoff)
+            await asyncio.sleep(delay)
+
+        return response
+
+    async def close(self):
+        """aiohttp 세션 종료"""
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+
+
+class AsyncGitHubService(AsyncHTTPMixin, GitHubService):
+    """GitHub API 비동기 연동 클래스"""
+
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    async def get_pr_diff_files(
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        max_bytes: int = None,
+        max_lines: int = None
+    ) -> Optional[Tuple[List[DiffFile], DiffStats]]:
+        """
+        PR diff를 스트리밍으로 받아 파일 단위 객체로 반환
+
+        Args:
+            repo_full_name: 저장소 전체 이름
+            pr_number: PR 번호
+            max_bytes: 읽을 최대 바이트 수 (도달 시 이후 내용은 받지 않음)
+            max_lines: 읽을 최대 라인 수
+
+        Returns:
+            Tuple[List[DiffFile], DiffStats]: 파일 목록과 파싱 통계
+        """
+        url = f"{self.api_url}/repos/{repo_full_name}/pulls/{pr_number}"
+        headers = {
+            **self.headers,
+            'Accept': 'application/vnd.github.v3.diff'
+        }
+
+        cache_key = (url, headers['Accept'])
+        cached = self.etag_cache.get(cache_key)
+        headers.update(self.etag_cache.conditional_headers(cached))
+
+        wait = await asyncio.to_thread(self.rate_limiter.reserve, self.rate_limit_key)
+        if wait:
+            await asyncio.sleep(wait)
+
+        lines: List[bytes] = []
+        try:
+            response = await self._send('GET', url, headers=headers)
+            async with response:
+                await asyncio.to_thread(
+                    self.rate_limiter.update, self.rate_limit_key, response.status, response.headers
+                )
+                if response.status == 304 and cached:
+                    self.etag_cache.record_hit()
+                    lines = cached['body'].split(b'\n')
+                else:
+                    response.raise_for_status()
+                    complete = await self._read_lines(response, lines, max_bytes, max_lines)
+                    size = sum(len(line) + 1 for line in lines)
+                    if complete and size <= self.etag_cache.max_body_bytes:
+                        self.etag_cache.store(cache_key, response.headers, b'\n'.join(lines))
+        except aiohttp.ClientError as e:
+            print(f"❌ PR diff 가져오기 실패: {e}")
+            return None
+        except asyncio.TimeoutError:
+            print("❌ PR diff 가져오기 실패: timeout")
+            return None
+
+        stats = DiffStats()
+        files = list(parse_diff(lines, max_bytes=max_bytes, max_lines=max_lines, stats=stats))
+        return files, stats
+
+    async def get_file_content(self, repo_full_name: str, path: str, ref: str = None) -> Optional[str]:
+        """
+        저장소 파일 내용 가져오기 (GitHubService.get_file_content의 비동기 버전)
+
+        Returns:
+            str: 파일 내용 (파일이 없거나 실패하면 None)
+        """
+        found, content = self.repo_files.get(repo_full_name, ref, path)
+        if found:
+            return content
+
+        url, headers = self._file_request(repo_full_name, path, ref)
+        try:
+            content = (await self._conditional_get(url, headers)).decode('utf-8', errors='replace')
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                print(f"❌ 파일 가져오기 실패 ({path}): {e!r}")
+                return None
+            content = None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"❌ 파일 가져오기 실패 ({path}): {e!r}")
+            return None
+
+        self.repo_files.put(repo_full_name, ref, path, content)
+        return content
+
+    async def get_compare_diff_files(
+        self,
+        repo_full_name: str,
+        base_sha: str,
+        head_sha: str,
+        max_bytes: int = None,
+        max_lines: int = None
+    ) -> Optional[Tuple[List[DiffFile], DiffStats]]:
+        """
+        두 커밋 사이에 바뀐 파일만 diff로 가져오기 (GitHubService.get_compare_diff_files의 비동기 버전)
+
+        Returns:
+            Tuple[List[DiffFile], DiffStats]: 바뀐 파일 목록과 파싱 통계 (증분 분석이 불가능하면 None)
+        """
+        url = f"{self.api_url}/repos/{repo_full_name}/compare/{base_sha}...{head_sha}"
+
+        try:
+            comparison = json.loads(await self._conditional_get(url, self.headers))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"❌ 커밋 비교 실패: {e!r}")
+            return None
+
+        return self.parse_comparison(comparison, max_bytes=max_bytes, max_lines=max_lines)
+
+    async def _conditional_get(self, url: str, headers: Dict) -> bytes:
+        """
+        ETag/Last-Modified 조건부 GET (GitHubService._conditional_get의 비동기 버전)
+
+        Raises:
+            aiohttp.ClientResponseError: 오류 응답 (404 포함)
+        """
+        headers = dict(headers)
+        cache_key = (url, headers.get('Accept'))
+        cached = self.etag_cache.get(cache_key)
+        headers.update(self.etag_cache.conditional_headers(cached))
+
+        wait = await asyncio.to_thread(self.rate_limiter.reserve, self.rate_limit_key)
+        if wait:
+            await asyncio.sleep(wait)
+
+        response = await self._send('GET', url, headers=headers)
+        async with response:
+            await asyncio.to_thread(
+                self.rate_limiter.update, self.rate_limit_key, response.status, response.headers
+            )
+            if response.status == 304 and cached:
+                self.etag_cache.record_hit()
+                return cached['body']
+            response.raise_for_status()
+            body = await response.read()
+            self.etag_cache.store(cache_key, response.headers, body)
+            return body
+
+    async def _read_lines(
+        self,
+        response: aiohttp.ClientResponse,
+        lines: List[bytes],
+        max_bytes: int,
+        max_lines: int
+    ) -> bool:
+        # 예산을 한 줄 넘길 때까지만 읽음 (초과 여부는 parse_diff가 판정)
+        # 끝까지 읽었으면 True
+        total = 0
+        buffer = b''
+        async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+            buffer += chunk
+            *complete, buffer = buffer.split(b'\n')
+            for line in complete:
+                lines.append(line.rstrip(b'\r'))
+                total += len(line) + 1
+                if (max_bytes and total > max_bytes) or (max_lines and len(lines) > max_lines):
+                    return False
+        if buffer:
+            lines.append(buffer.rstrip(b'\r'))
+        return True
+
+
+class AsyncLLMService(AsyncHTTPMixin, LLMService):
+    """Upstage Solar Pro 비동기 연동 클래스"""
+
+    async def analyze_pr(
+        self,
+        title: str,
+        author: str,
+        base_branch: str,
+        head_branch: str,
+        description: str,
+        diff: str,
+        on_event: Callable[[str, Any], None] = None,
+        deadline: Optional[Deadline] = None,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL
+    ) -> Optional[Dict]:
+        """
+        PR 분석 실행 (LLMService.analyze_pr의 비동기 버전)
+
+        Returns:
+            Dict: 분석 결과
+        """
+        route = self.router.route(diff)
+        cache_key = self.cache_key_for(title, description, diff, route)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("✅ 캐시된 분석 결과 사용")
+                return {**cached, 'usage': {'prompt_tokens': 0, 'completion_tokens': 0}}
+
+        payload = self.build_payload(title, author, base_branch, head_branch, description, diff, route)
+        content = None
+
+        try:
+            if Config.LLM_STREAMING:
+                analysis_result, partial = await self._scheduled(
+                    payload, tenant, priority, deadline,
+                    lambda: self._request_streaming(payload, on_event, deadline, route),
+                    lambda result: result[0].get('usage')
+                )
+            else:
+                content, usage = await self._scheduled(
+                    payload, tenant, priority, deadline,
+                    lambda: self._complete(payload, deadline, tenant, priority, route.name),
+                    lambda result: result[1]
+                )
+                try:
+                    analysis_result, partial = self.parse_analysis(content)
+                except (json.JSONDecodeError, AnalysisSchemaError) as e:
+                    analysis_result, partial, repair_usage = await self._repair(
+                        content, e, route, deadline, tenant, priority
+                    )
+                    usage = self.total_usage([{'usage': usage}, {'usage': repair_usage}])
+                if partial:
+                    analysis_result['risks'].append(self.truncated_risk())
+                analysis_result['usage'] = usage
+
+            analysis_result['model_routes'] = [route.name]
+            analysis_result['models'] = [route.model]
+            if cache_key and not partial:
+                self.cache.set(cache_key, analysis_result)
+            return analysis_result
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"❌ LLM API 요청 실패: {e!r}")
+            return None
+        except (json.JSONDecodeError, AnalysisSchemaError) as e:
+            print(f"❌ JSON 파싱 실패: {e}")
+            print(f"응답 내용: {content}")
+            return None
+        except DeadlineExceeded as e:
+            print(f"⏱️ 분석 생략: {e}")
+            return None
+        except SchedulerTimeout as e:
+            print(f"⏳ 분석 생략: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ 예상치 못한 오류: {e}")
+            return None
+
+    async def _repair(
+        self,
+        content: str,
+        error: ValueError,
+        route: ModelRoute,
+        deadline: Optional[Deadline],
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL,
+        scheduled: bool = True
+    ) -> Tuple[Dict, bool, Dict[str, int]]:
+        """
+        깨진 필드만 보내 JSON 문법을 고쳐 받음 (LLMService._repair의 비동기 버전)
+
+        Returns:
+            Tuple[Dict, bool, Dict[str, int]]: (분석 결과, 부분 결과 여부, 복구 요청 토큰 사용량)
+        """
+        request = self.build_repair_request(content, error, route)
+        if request is None:
+            raise error
+        payload, salvaged = request
+
+        print(f"🩹 응답 형식 오류, 깨진 부분만 다시 요청: {error}")
+        try:
+            if scheduled:
+                repaired, usage = await self._scheduled(
+                    payload, tenant, priority, deadline,
+                    lambda: self._post_completion(payload, deadline),
+                    lambda result: result[1]
+                )
+            else:
+                repaired, usage = await self._post_completion(payload, deadline)
+        except (aiohttp.ClientError, asyncio.TimeoutError, DeadlineExceeded, SchedulerTimeout) as e:
+            LLM_OUTPUT_REPAIRS.inc(method='request', result='failed')
+            print(f"❌ 복구 요청 실패: {e!r}")
+            raise error
+
+        result, partial = self.finish_repair(salvaged, repaired, error)
+        return result, partial, usage
+
+    async def _scheduled(
+        self,
+        payload: Dict,
+        tenant: str,
+        priority: int,
+        deadline: Optional[Deadline],
+        send: Callable[[], Awaitable[Any]],
+        usage_of: Callable[[Any], Optional[Dict[str, int]]]
+    ) -> Any:
+        """
+        스케줄러 슬롯을 받은 뒤 요청 실행 (LLMService._scheduled의 비동기 버전)
+
+        Returns:
+            send()의 반환값
+        """
+        scheduler = self.scheduler if Config.LLM_SCHEDULER_ENABLED else None
+        tokens = self.reserved_tokens(payload)
+        # 429와 5xx는 따로 셈 (retry_delay() 참고)
+        throttles = errors = 0
+        while True:
+            ticket = None
+            if scheduler is not None:
+                ticket = await scheduler.acquire_async(tenant, priority, tokens, self.scheduler_timeout(deadline))
+            try:
+                result = await send()
+            except aiohttp.ClientResponseError as e:
+                throttled, retry_after = self.rate_limit_status(e.status, e.headers)
+                if ticket is not None:
+                    scheduler.release(ticket, throttled=throttled, retry_after=retry_after)
+                attempt = throttles if throttled else errors
+                delay = self.retry_delay(e.status, retry_after, attempt, deadline, scheduled=scheduler is not None)
+                if delay is None:
+                    raise
+                throttles, errors = (throttles + 1, errors) if throttled else (throttles, errors + 1)
+                print(f"🔁 LLM API 응답 {e.status}, {delay:.1f}초 후 재시도 ({attempt + 1}회)")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if ticket is not None:
+                    scheduler.release(ticket)
+                raise
+
+            if ticket is not None:
+                usage = usage_of(result)
+                scheduler.release(ticket, sum(usage.values()) if usage else None)
+            return result
+
+    async def _post_completion(
+        self,
+        payload: Dict,
+        deadline: Optional[Deadline] = None,
+        hedge_key: Optional[str] = None
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        요청 하나를 보내고 (응답 본문, 토큰 사용량) 반환 (마감 시간이 있으면 전체 소요 시간도 제한)
+        hedge_key가 있으면 지연 시간을 그 키로 헤지 정책에 기록
+        """
+        timeout = self.request_timeout(deadline)
+        started = time.monotonic()
+
+        async def post() -> Dict:
+            response = await self._send(
+                'POST', self.api_url, timeout=timeout, headers=self.headers, json=payload
+            )
+            async with response:
+                response.raise_for_status()
+                return await response.json()
+
+        if deadline is None:
+            result = await post()
+        else:
+            result = await asyncio.wait_for(post(), timeout=deadline.remaining())
+
+        content = result['choices'][0]['message']['content']
+        if hedge_key is not None:
+            self.hedge_policy.record(time.monotonic() - started, hedge_key)
+        return content, self.response_usage(payload, content, result.get('usage'))
+
+    async def _complete(
+        self,
+        payload: Dict,
+        deadline: Optional[Deadline] = None,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL,
+        hedge_key: str = ''
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        응답 본문 요청 (LLMService._complete의 비동기 버전, 늦은 쪽 요청은 취소)
+
+        헤지가 먼저 응답하면 첫 요청이 취소되어 끝날 때까지 헤지의 슬롯을 대신 잡아 둡니다.
+
+        Returns:
+            Tuple[str, Dict[str, int]]: (모델이 생성한 텍스트, 토큰 사용량)
+        """
+        delay = self.hedge_policy.hedge_delay(hedge_key) if Config.LLM_HEDGE_ENABLED else None
+        if delay is None or (deadline and deadline.remaining() <= delay):
+            return await self._post_completion(payload, deadline, hedge_key)
+
+        primary = asyncio.ensure_future(self._post_completion(payload, deadline, hedge_key))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return await primary
+        allowed, ticket = self._acquire_hedge(payload, tenant, priority)
+        if not allowed:
+            return await primary
+
+        print(f"🔀 {delay:.1f}초 안에 응답이 없어 헤지 요청 추가")
+        hedge = asyncio.ensure_future(self._post_completion(payload, deadline, hedge_key))
+
+        def release_slot(task: asyncio.Future):
+            error = None if task.cancelled() else task.exception()
+            self._release_ticket(
+                ticket,
+                task.result()[1] if not task.cancelled() and error is None else None,
+                getattr(error, 'status', None),
+                getattr(error, 'headers', None)
+            )
+
+        def finish_hedge(task: asyncio.Future):
+            self.hedge_policy.release()
+            if not task.cancelled() and task.exception() is None and not primary.done():
+                primary.add_done_callback(release_slot)
+            else:
+                release_slot(task)
+
+        hedge.add_done_callback(finish_hedge)
+
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = None
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_policy.won()
+                        return task.result()
+                    failed = task
+                if not pending:
+                    return failed.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _request_streaming(
+        self,
+        payload: Dict,
+        on_event: Callable[[str, Any], None] = None,
+        deadline: Optional[Deadline] = None,
+        route: ModelRoute = None
+    ) -> Tuple[Dict, bool]:
+        """
+        스트리밍 모드 요청 (LLMService._request_streaming의 비동기 버전)
+
+        Returns:
+            Tuple[Dict, bool]: (분석 결과, 부분 결과 여부)
+        """
+        parser = IncrementalJSONParser()
+        try:
+            response = await self._send(
+                'POST',
+                self.api_url,
+                timeout=self.request_timeout(deadline),
+                headers=self.headers,
+                json={**payload, "stream": True}
+            )
+            async with response:
+                response.raise_for_status()
+                async for raw in response.content:
+                    delta = self.stream_delta(raw.decode('utf-8', errors='replace').strip())
+                    if delta is None:
+                        break
+                    self.emit_events(parser.feed(delta), on_event)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if not parser.result():
+                raise
+            print(f"⚠️ 스트리밍 중단: {e!r}")
+            result, partial, broken = self.recover_stream(parser, e)
+        else:
+            result, partial, broken = self.recover_stream(parser)
+
+        usage = self.response_usage(payload, parser.text)
+        if broken is not None and route is not None:
+            try:
+                # 이 요청이 받은 스케줄러 슬롯 안에서 이어서 보냄 (슬롯을 두 개 잡지 않도록)
+                result, partial, repair_usage = await self._repair(
+                    parser.text, broken, route, deadline, scheduled=False
+                )
+                usage = self.total_usage([{'usage': usage}, {'usage': repair_usage}])
+            except (json.JSONDecodeError, AnalysisSchemaError):
+                if result is None:
+                    raise
+        return self.finish_stream(result, partial, broken, usage), partial
+
+    async def analyze_chunks(
+        self,
+        title: str,
+        author: str,
+        base_branch: str,
+        head_branch: str,
+        description: str,
+        chunks: List[Dict],
+        max_workers: int = None,
+        on_event: Callable[[str, Any], None] = None,
+        deadline: Optional[Deadline] = None,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL
+    ) -> List[Optional[Dict]]:
+        """
+        diff 청크들을 동시에 분석 (LLMService.analyze_chunks의 비동기 버전)
+
+        Returns:
+            List[Optional[Dict]]: 청크 순서대로의 분석 결과 (실패한 청크는 None)
+        """
+        if not chunks:
+            return []
+
+        semaphore = asyncio.Semaphore(max_workers or Config.LLM_CHUNK_WORKERS)
+
+        async def analyze_chunk(chunk: Dict) -> Optional[Dict]:
+            async with semaphore:
+                return await self.analyze_pr(
+                    title=title,
+                    author=author,
+                    base_branch=base_branch,
+                    head_branch=head_branch,
+                    description=description,
+                    diff=chunk['text'],
+                    on_event=on_event,
+                    deadline=deadline,
+                    tenant=tenant,
+                    priority=priority
+                )
+
+        return list(await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks)))
+
+
+class AsyncSlackService(AsyncHTTPMixin, SlackService):
+    """Slack 비동기 전송 클래스"""
+
+    async def send_pr_review(self, pr_info: Dict, analysis: Dict, pr_url: str) -> bool:
+        """
+        PR 리뷰 결과를 Slack으로 전송
+
+        Returns:
+            bool: 전송 성공 여부
+        """
+        if self.progressive:
+            # 봇 API 경로는 호출 수가 적으므로 동기 구현을 스레드에서 실행
+            return await asyncio.to_thread(super().send_pr_review, pr_info, analysis, pr_url)
+        message = self.format_review_message(pr_info, analysis, pr_url)
+        return await self._post_webhook(message, "❌ Slack 메시지 전송 실패")
+
+    async def send_error_notification(self, error_message: str, pr_url: str = None) -> bool:
+        """
+        에러 알림 전송
+
+        Returns:
+            bool: 전송 성공 여부
+        """
+        message = self.format_error_message(error_message, pr_url)
+        return await self._post_webhook(message, "❌ 에러 알림 전송 실패")
+
+    async def _post_webhook(self, message: Dict, failure_log: str) -> bool:
+        try:
+            response = await self._send('POST', self.webhook_url, json=message)
+            async with response:
+                response.raise_for_status()
+            return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"{failure_log}: {e!r}")
+            return False
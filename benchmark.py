@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크/부하 테스트 스크립트
+
+GitHub/Upstage/Slack을 흉내 내는 로컬 mock 서버를 띄우고, 그 서버를 바라보도록 설정한
+에이전트 프로세스에 서명된 webhook을 정해진 속도로 보내 처리량과 지연 시간을 측정합니다.
+실제 API 호출 한도를 쓰지 않으므로 변경 전후 성능 비교에 사용할 수 있습니다.
+
+사용 예:
+    python benchmark.py --rate 5 --count 200
+    python benchmark.py --rate 20 --duration 60 --pipeline async --llm-latency lognormal:2,0.5
+    python benchmark.py --server-cmd "gunicorn -w 2 -b 127.0.0.1:{port} app:app" --rate 10 --count 300
+"""
+import argparse
+import hashlib
+import hmac
+import http.server
+import json
+import math
+import os
+import random
+import re
+import shlex
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+BENCH_REPO = 'bench/agent'
+BENCH_SECRET = 'benchmark-secret'
+# LLM mock 응답에 넣어 두고 Slack 메시지에서 찾아 정상 분석 여부를 판별
+SUMMARY_MARKER = 'BENCH-OK'
+# SlackService.format_progress_message()의 fallback 텍스트 앞부분
+PROGRESS_TEXT = 'PR 리뷰 진행 중'
+# 깨진 JSON 응답에 넣는 이스케이프되지 않은 따옴표
+MALFORMED_QUOTE = '"mock"'
+
+
+class LatencyModel:
+    """
+    지연 시간 분포
+
+    - fixed:0.5 → 항상 0.5초
+    - uniform:0.2,2 → 0.2~2초 균등 분포
+    - lognormal:1.5,0.4 → 중앙값 1.5초, 시그마 0.4의 로그 정규 분포
+    """
+
+    def __init__(self, spec: str):
+        kind, _, params = spec.partition(':')
+        values = [float(v) for v in params.split(',') if v]
+        if kind == 'fixed' and len(values) == 1:
+            self._sample = lambda: values[0]
+        elif kind == 'uniform' and len(values) == 2:
+            self._sample = lambda: random.uniform(values[0], values[1])
+        elif kind == 'lognormal' and len(values) == 2:
+            mu = math.log(values[0])
+            self._sample = lambda: random.lognormvariate(mu, values[1])
+        else:
+            raise ValueError(f"지원하지 않는 지연 시간 분포: {spec}")
+        self.spec = spec
+
+    def sample(self) -> float:
+        return max(self._sample(), 0.0)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """q 분위수 (nearest-rank, 값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(max(math.ceil(q * len(ordered)) - 1, 0), len(ordered) - 1)]
+
+
+class MockBackend:
+    """
+    GitHub pulls/diff, Upstage chat completions, Slack webhook/API를 흉내 내는 HTTP 서버
+
+    Slack으로 리뷰 메시지가 도착한 시각을 PR 번호별로 기록하여 종단 간 지연 시간을 계산합니다.
+    """
+
+    def __init__(
+        self,
+        llm_latency: LatencyModel,
+        llm_findings: int = 5,
+        llm_error_rate: float = 0.0,
+        llm_max_concurrency: int = 0,
+        llm_malformed_rate: float = 0.0,
+        diff_files: int = 5,
+        diff_lines: int = 40
+    ):
+        """
+        Args:
+            llm_latency: LLM 응답 지연 시간 분포
+            llm_findings: LLM 응답 하나에 넣을 위험 요소 수 (응답 크기 조절)
+            llm_error_rate: LLM 요청을 503으로 실패시킬 비율
+            llm_max_concurrency: 이보다 많은 LLM 요청이 동시에 들어오면 429로 거절 (0이면 제한 없음)
+            llm_malformed_rate: LLM 응답 JSON을 깨뜨릴 비율 (절반은 로컬 복구 가능, 절반은 복구 요청 필요)
+            diff_files: PR당 변경 파일 수
+            diff_lines: 파일당 추가 라인 수
+        """
+        self.llm_latency = llm_latency
+        self.llm_findings = llm_findings
+        self.llm_error_rate = llm_error_rate
+        self.llm_max_concurrency = llm_max_concurrency
+        self.llm_malformed_rate = llm_malformed_rate
+        self._llm_inflight = 0
+        self.diff = self._build_diff(diff_files, diff_lines)
+
+        self.counts = {
+            'github': 0, 'llm': 0, 'llm_errors': 0, 'llm_throttled': 0,
+            'llm_malformed': 0, 'llm_repairs': 0, 'slack': 0, 'slack_posts': 0
+        }
+        self.completions: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[http.server.ThreadingHTTPServer] = None
+
+    @staticmethod
+    def _build_diff(files: int, lines: int) -> bytes:
+        parts = []
+        for i in range(files):
+            path = f"src/module_{i}.py"
+            added = '\n'.join(f"+    value_{j} = compute({j})  # line {j}" for j in range(lines))
+            parts.append(
+                f"diff --git a/{path} b/{path}\n"
+                f"--- a/{path}\n+++ b/{path}\n"
+                f"@@ -1,1 +1,{lines + 1} @@\n def handler():\n{added}"
+            )
+        return ('\n'.join(parts) + '\n').encode('utf-8')
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        backend = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                backend.handle_github(self)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if self.path.startswith('/llm'):
+                    backend.handle_llm(self, body)
+                elif self.path.startswith('/slack'):
+                    backend.handle_slack(self, body)
+                else:
+                    backend.send(self, 404, b'{"message":"Not Found"}')
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='mock-backend', daemon=True).start()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    @staticmethod
+    def send(handler, status: int, body: bytes, content_type: str = 'application/json', headers: Dict = None):
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def handle_github(self, handler):
+        with self._lock:
+            self.counts['github'] += 1
+        rate_headers = {
+            'X-RateLimit-Limit': '5000',
+            'X-RateLimit-Remaining': '5000',
+            'X-RateLimit-Reset': str(int(time.time()) + 3600)
+        }
+        match = re.match(r'^/repos/([^/]+/[^/]+)/pulls/(\d+)$', handler.path.split('?')[0])
+        if not match:
+            # .gitattributes, compare 등은 없는 것으로 응답 (에이전트는 전체 diff로 진행)
+            return self.send(handler, 404, b'{"message":"Not Found"}', headers=rate_headers)
+
+        if 'diff' in handler.headers.get('Accept', ''):
+            return self.send(handler, 200, self.diff, 'text/plain; charset=utf-8', rate_headers)
+        number = int(match.group(2))
+        pr = build_pull_request(number, uuid.uuid4().hex)
+        return self.send(handler, 200, json.dumps(pr).encode('utf-8'), headers=rate_headers)
+
+    def handle_llm(self, handler, body: bytes):
+        with self._lock:
+            self.counts['llm'] += 1
+            throttled = bool(self.llm_max_concurrency) and self._llm_inflight >= self.llm_max_concurrency
+            if throttled:
+                self.counts['llm_throttled'] += 1
+            else:
+                self._llm_inflight += 1
+        if throttled:
+            return self.send(handler, 429, b'{"error":"rate limited"}', headers={'Retry-After': '1'})
+        try:
+            return self._respond_llm(handler, body)
+        finally:
+            with self._lock:
+                self._llm_inflight -= 1
+
+    def _respond_llm(self, handler, body: bytes):
+        time.sleep(self.llm_latency.sample())
+        if self.llm_error_rate and random.random() < self.llm_error_rate:
+            with self._lock:
+                self.counts['llm_errors'] += 1
+            return self.send(handler, 503, b'{"error":"overloaded"}')
+
+        request = json.loads(body or b'{}')
+        prompt = ''.join(message.get('content', '') for message in request.get('messages', []))
+        fragment = re.search(r'```\n(.*)\n```', prompt, re.S)
+        if fragment and 'diff --git' not in prompt:
+            # 형식 복구 요청: 깨뜨린 부분만 고쳐서 돌려줌
+            with self._lock:
+                self.counts['llm_repairs'] += 1
+            content = fragment.group(1).replace(MALFORMED_QUOTE, json.dumps(MALFORMED_QUOTE)[1:-1])
+            return self._respond_llm_content(handler, request, prompt, content)
+
+        paths = re.findall(r'diff --git a/\S+ b/(\S+)', prompt) or ['src/module_0.py']
+        analysis = {
+            'summary': f"{SUMMARY_MARKER} {len(paths)}개 파일 분석",
+            'risks': [
+                {
+                    'severity': '중간',
+                    'category': '품질',
+                    'description': f"벤치마크 위험 요소 {i}",
+                    'location': f"{paths[i % len(paths)]}:{i + 1}"
+                }
+                for i in range(self.llm_findings)
+            ],
+            'suggestions': [
+                {'priority': '권장', 'description': f"벤치마크 제안 {i}"}
+                for i in range(self.llm_findings)
+            ],
+            'positive_points': ['벤치마크 응답'],
+            'overall_rating': '7'
+        }
+        content = json.dumps(analysis, ensure_ascii=False)
+        if self.llm_malformed_rate and random.random() < self.llm_malformed_rate:
+            with self._lock:
+                self.counts['llm_malformed'] += 1
+            content = self._malform(content)
+        return self._respond_llm_content(handler, request, prompt, content)
+
+    @staticmethod
+    def _malform(content: str) -> str:
+        if random.random() < 0.5:
+            # 끝 쉼표와 문자열 안의 개행: 로컬에서 복구 가능
+            return content.replace('벤치마크 응답', '벤치마크\n응답')[:-1] + ',}'
+        # summary 안의 이스케이프되지 않은 따옴표: 복구 요청 필요
+        return content.replace(f'"{SUMMARY_MARKER} ', f'"{SUMMARY_MARKER} {MALFORMED_QUOTE} ', 1)
+
+    def _respond_llm_content(self, handler, request: Dict, prompt: str, content: str):
+        if request.get('stream'):
+            handler.send_response(200)
+            handler.send_header('Content-Type', 'text/event-stream')
+            handler.send_header('Connection', 'close')
+            handler.end_headers()
+            for i in range(0, len(content), 64):
+                chunk = {'choices': [{'delta': {'content': content[i:i + 64]}}]}
+                handler.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+            handler.wfile.write(b'data: [DONE]\n\n')
+            handler.close_connection = True
+            return
+
+        response = {
+            'choices': [{'message': {'content': content}}],
+            'usage': {'prompt_tokens': len(prompt) // 4, 'completion_tokens': len(content) // 4}
+        }
+        return self.send(handler, 200, json.dumps(response).encode('utf-8'))
+
+    def handle_slack(self, handler, body: bytes):
+        received = time.time()
+        with self._lock:
+            self.counts['slack'] += 1
+
+        text = body.decode('utf-8', errors='replace')
+        progressive = handler.path.startswith('/slack/api')
+        final = True
+        if progressive:
+            # 봇 API(chat.postMessage/update)는 진행 상황 메시지가 아닌 최종 결과만 완료로 기록
+            if handler.path.endswith('chat.postMessage'):
+                with self._lock:
+                    self.counts['slack_posts'] += 1
+            try:
+                final = not json.loads(text).get('text', '').startswith(PROGRESS_TEXT)
+            except ValueError:
+                final = False
+
+        match = re.search(r'/pull/(\d+)', text)
+        if match and final:
+            number = int(match.group(1))
+            with self._lock:
+                self.completions.setdefault(number, {
+                    'time': received,
+                    'ok': SUMMARY_MARKER in text
+                })
+        if progressive:
+            return self.send(handler, 200, json.dumps({'ok': True, 'channel': 'C0BENCH', 'ts': f"{received:.6f}"}).encode())
+        return self.send(handler, 200, b'ok', 'text/plain')
+
+
+def build_pull_request(number: int, head_sha: str) -> Dict:
+    """webhook/API 응답용 PR 객체"""
+    return {
+        'number': number,
+        'title': f"Benchmark PR #{number}",
+        'user': {'login': 'bench-bot'},
+        'base': {'ref': 'main'},
+        'head': {'ref': f"bench/{number}", 'sha': head_sha},
+        'body': '벤치마크용 PR입니다.',
+        'html_url': f"https://github.com/{BENCH_REPO}/pull/{number}",
+        'draft': False
+    }
+
+
+class AgentProcess:
+    """mock 서버를 바라보도록 설정한 에이전트 서버 프로세스"""
+
+    def __init__(self, command: str, app_dir: str, port: int, env: Dict[str, str]):
+        self.command = shlex.split(command.format(port=port, python=sys.executable))
+        self.app_dir = app_dir
+        self.url = f"http://127.0.0.1:{port}"
+        self.env = {**os.environ, **env}
+        self.log_path = os.path.join(env.get('BENCH_DATA_DIR') or tempfile.gettempdir(), 'agent.log')
+        self.process: Optional[subprocess.Popen] = None
+        self.peak_rss: Dict[int, int] = {}
+        self._sampling = False
+
+    def start(self, timeout: float = 30.0):
+        with open(self.log_path, 'wb') as log:
+            self.process = subprocess.Popen(
+                self.command,
+                cwd=self.app_dir,
+                env=self.env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True
+            )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(
+                    f"서버가 바로 종료됨 (exit {self.process.returncode}): {' '.join(self.command)}\n{self.log_tail()}"
+                )
+            try:
+                if requests.get(f"{self.url}/", timeout=1).ok:
+                    break
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(0.2)
+        else:
+            self.stop()
+            raise RuntimeError(f"서버가 {timeout:.0f}초 안에 준비되지 않음")
+
+        self._sampling = True
+        threading.Thread(target=self._sample_memory, name='rss-sampler', daemon=True).start()
+
+    def log_tail(self, lines: int = 20) -> str:
+        """에이전트 출력의 마지막 몇 줄"""
+        try:
+            with open(self.log_path, encoding='utf-8', errors='replace') as f:
+                return ''.join(f.readlines()[-lines:])
+        except OSError:
+            return ''
+
+    def _sample_memory(self):
+        while self._sampling:
+            for pid, rss in process_tree_rss(self.process.pid).items():
+                self.peak_rss[pid] = max(self.peak_rss.get(pid, 0), rss)
+            time.sleep(0.5)
+
+    def stop(self):
+        self._sampling = False
+        if self.process and self.process.poll() is None:
+            os.killpg(self.process.pid, signal.SIGTERM)
+            try:
+                self.process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                os.killpg(self.process.pid, signal.SIGKILL)
+                self.process.wait()
+
+
+def process_tree_rss(root_pid: int) -> Dict[int, int]:
+    """
+    프로세스와 자식 프로세스(gunicorn 워커 등)의 RSS (Linux /proc 기준)
+
+    Returns:
+        Dict[int, int]: PID → RSS(bytes) (/proc가 없으면 빈 딕셔너리)
+    """
+    result = {}
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        result[pid] = int(line.split()[1]) * 1024
+                        break
+            for task in os.listdir(f"/proc/{pid}/task"):
+                with open(f"/proc/{pid}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return result
+
+
+class LoadGenerator:
+    """
+    서명된 pull_request webhook을 일정한 속도로 전송
+
+    전송 시각은 미리 정한 일정(open loop)을 따르므로 서버가 느려져도 보내는 속도는 줄지 않습니다.
+    """
+
+    def __init__(self, target_url: str, secret: str, rate: float, concurrency: int = 64):
+        self.target_url = target_url.rstrip('/') + '/webhook/github'
+        self.secret = secret.encode('utf-8')
+        self.rate = rate
+        self.sent: Dict[int, float] = {}
+        self.statuses: Dict[int, int] = {}
+        self.ack_latencies: List[float] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._session = requests.Session()
+        self._session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=concurrency))
+
+    def run(self, count: int, first_number: int = 1):
+        started = time.monotonic()
+        for i in range(count):
+            delay = started + i / self.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._executor.submit(self._deliver, first_number + i)
+        self._executor.shutdown(wait=True)
+
+    def _deliver(self, number: int):
+        body = json.dumps({
+            'action': 'opened',
+            'number': number,
+            'pull_request': build_pull_request(number, uuid.uuid4().hex),
+            'repository': {'full_name': BENCH_REPO},
+            'sender': {'login': 'bench-bot', 'type': 'User'}
+        }).encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json',
+            'X-GitHub-Event': 'pull_request',
+            'X-GitHub-Delivery': str(uuid.uuid4()),
+            'X-Hub-Signature-256': 'sha256=' + hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        }
+
+        sent_at = time.time()
+        start = time.monotonic()
+        try:
+            status = self._session.post(self.target_url, data=body, headers=headers, timeout=30).status_code
+        except requests.exceptions.RequestException:
+            status = 0
+        with self._lock:
+            self.sent[number] = sent_at
+            self.statuses[number] = status
+            self.ack_latencies.append(time.monotonic() - start)
+
+
+def build_report(load: LoadGenerator, backend: MockBackend, agent: Optional[AgentProcess], elapsed: float) -> Dict:
+    """측정 결과 요약"""
+    accepted = [n for n, status in load.statuses.items() if 200 <= status < 300]
+    latencies, degraded = [], 0
+    last_completion = None
+    for number in accepted:
+        done = backend.completions.get(number)
+        if done is None:
+            continue
+        latencies.append(done['time'] - load.sent[number])
+        last_completion = max(last_completion or 0, done['time'])
+        if not done['ok']:
+            degraded += 1
+
+    first_sent = min(load.sent.values()) if load.sent else None
+    window = (last_completion - first_sent) if (last_completion and first_sent) else None
+
+    def summary(values: List[float]) -> Dict:
+        return {
+            'p50': percentile(values, 0.5),
+            'p95': percentile(values, 0.95),
+            'p99': percentile(values, 0.99),
+            'max': max(values) if values else None
+        }
+
+    report = {
+        'sent': len(load.statuses),
+        'accepted': len(accepted),
+        'rejected': len(load.statuses) - len(accepted),
+        'completed': len(latencies),
+        'degraded': degraded,
+        'elapsed_seconds': round(elapsed, 2),
+        'throughput_per_second': round(len(latencies) / window, 3) if window else None,
+        'end_to_end_seconds': summary(latencies),
+        'webhook_ack_seconds': summary(load.ack_latencies),
+        'backend_requests': dict(backend.counts)
+    }
+    if agent is not None:
+        report['peak_rss_mb'] = {str(pid): round(rss / 1024 / 1024, 1) for pid, rss in sorted(agent.peak_rss.items())}
+    return report
+
+
+def print_report(report: Dict):
+    def fmt(value: Optional[float]) -> str:
+        return f"{value:.3f}s" if value is not None else '-'
+
+    print("\n📊 벤치마크 결과")
+    print(f"   전송 {report['sent']} / 접수 {report['accepted']} / 완료 {report['completed']}"
+          f" (fallback {report['degraded']}, 거부 {report['rejected']})")
+    print(f"   처리량: {report['throughput_per_second'] or '-'} PR/s (총 {report['elapsed_seconds']}초)")
+    for label, key in (('종단 간 지연', 'end_to_end_seconds'), ('webhook 응답', 'webhook_ack_seconds')):
+        stats = report[key]
+        print(f"   {label}: p50 {fmt(stats['p50'])}  p95 {fmt(stats['p95'])}"
+              f"  p99 {fmt(stats['p99'])}  max {fmt(stats['max'])}")
+    print(f"   mock 호출 수: {report['backend_requests']}")
+    for pid, rss in (report.get('peak_rss_mb') or {}).items():
+        print(f"   최대 메모리 (PID {pid}): {rss} MB")
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='PR Review Agent 오프라인 벤치마크')
+    parser.add_argument('--rate', type=float, default=5.0, help='초당 webhook 전송 수')
+    parser.add_argument('--count', type=int, help='전송할 webhook 수')
+    parser.add_argument('--duration', type=float, default=30.0, help='--count가 없을 때 전송 시간(초)')
+    parser.add_argument('--drain-timeout', type=float, default=300.0, help='전송 후 완료를 기다릴 최대 시간(초)')
+    parser.add_argument('--pipeline', choices=['sync', 'async'], help='PIPELINE_MODE')
+    parser.add_argument('--server-cmd', default='{python} app.py',
+                        help='에이전트 실행 명령 ({port}, {python} 치환)')
+    parser.add_argument('--server-url', help='이미 실행 중인 에이전트 주소 (지정하면 프로세스를 띄우지 않음)')
+    parser.add_argument('--app-dir', default=os.path.dirname(os.path.abspath(__file__)), help='에이전트 실행 디렉터리')
+    parser.add_argument('--port', type=int, default=5055, help='에이전트 포트')
+    parser.add_argument('--env', action='append', default=[], metavar='KEY=VALUE', help='에이전트 환경변수 추가')
+    parser.add_argument('--llm-latency', default='lognormal:1.0,0.5', help='LLM 지연 분포 (fixed:/uniform:/lognormal:)')
+    parser.add_argument('--llm-findings', type=int, default=5, help='LLM 응답의 위험 요소/제안 수')
+    parser.add_argument('--llm-error-rate', type=float, default=0.0, help='LLM 503 응답 비율')
+    parser.add_argument('--llm-max-concurrency', type=int, default=0,
+                        help='mock LLM 동시 요청 한도 (넘으면 429, 0이면 제한 없음)')
+    parser.add_argument('--llm-malformed-rate', type=float, default=0.0,
+                        help='깨진 JSON으로 응답할 비율 (절반은 로컬 복구, 절반은 복구 요청 대상)')
+    parser.add_argument('--diff-files', type=int, default=5, help='PR당 변경 파일 수')
+    parser.add_argument('--diff-lines', type=int, default=40, help='파일당 추가 라인 수')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--seed', type=int, help='난수 시드')
+    return parser.parse_args(argv)
+
+
+def agent_env(args: argparse.Namespace, backend: MockBackend, data_dir: str) -> Dict[str, str]:
+    """mock 서버를 바라보고 데이터는 임시 디렉터리에 쓰도록 하는 환경변수"""
+    env = {
+        'PORT': str(args.port),
+        'HOST': '127.0.0.1',
+        'GITHUB_TOKEN': 'bench-token',
+        'UPSTAGE_API_KEY': 'bench-key',
+        'GITHUB_WEBHOOK_SECRET': BENCH_SECRET,
+        'GITHUB_API_URL': backend.url,
+        'UPSTAGE_API_URL': f"{backend.url}/llm/v1/chat/completions",
+        'SLACK_WEBHOOK_URL': f"{backend.url}/slack/webhook",
+        'SLACK_API_URL': f"{backend.url}/slack/api",
+        'REVIEW_DEBOUNCE_SECONDS': '0',
+        # mock Slack은 한도가 없으므로 전송 속도 제한이 측정을 가리지 않게 충분히 크게
+        'SLACK_RATE_LIMIT': '1000',
+        'SLACK_RATE_BURST': '1000',
+        'BENCH_DATA_DIR': data_dir
+    }
+    for name in ('QUEUE', 'ANALYSIS_CACHE', 'SLACK_MESSAGE', 'SLACK_OUTBOX', 'REVIEW_STATE', 'REVIEW_HISTORY'):
+        env[f"{name}_DB_PATH"] = os.path.join(data_dir, f"{name.lower()}.db")
+    if args.pipeline:
+        env['PIPELINE_MODE'] = args.pipeline
+    for item in args.env:
+        key, _, value = item.partition('=')
+        env[key] = value
+    return env
+
+
+def main(argv: List[str] = None) -> int:
+    """메인 함수"""
+    args = parse_args(argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+    count = args.count or max(int(args.rate * args.duration), 1)
+
+    backend = MockBackend(
+        LatencyModel(args.llm_latency),
+        llm_findings=args.llm_findings,
+        llm_error_rate=args.llm_error_rate,
+        llm_max_concurrency=args.llm_max_concurrency,
+        llm_malformed_rate=args.llm_malformed_rate,
+        diff_files=args.diff_files,
+        diff_lines=args.diff_lines
+    )
+    backend.start()
+    print(f"🧪 mock 서버 시작: {backend.url} (LLM 지연 {args.llm_latency})")
+
+    agent = None
+    with tempfile.TemporaryDirectory(prefix='pr-agent-bench-') as data_dir:
+        try:
+            if args.server_url:
+                target = args.server_url
+                print(f"🎯 외부 에이전트 사용: {target} (mock 서버 주소로 설정되어 있어야 함)")
+            else:
+                agent = AgentProcess(args.server_cmd, args.app_dir, args.port, agent_env(args, backend, data_dir))
+                agent.start()
+                target = agent.url
+                print(f"🚀 에이전트 시작: {' '.join(agent.command)} (PID {agent.process.pid})")
+
+            print(f"📨 webhook {count}개 전송 (초당 {args.rate})")
+            load = LoadGenerator(target, BENCH_SECRET, args.rate)
+            started = time.monotonic()
+            load.run(count)
+
+            accepted = {n for n, status in load.statuses.items() if 200 <= status < 300}
+            deadline = time.monotonic() + args.drain_timeout
+            while time.monotonic() < deadline and not accepted.issubset(backend.completions):
+                time.sleep(0.2)
+            elapsed = time.monotonic() - started
+
+            report = build_report(load, backend, agent, elapsed)
+        finally:
+            if agent is not None:
+                agent.stop()
+            backend.stop()
+
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 결과 저장: {args.json_path}")
+    return 0 if report['completed'] == report['accepted'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,22 +13,153 @@ class Config:
     
     # Upstage API
     UPSTAGE_API_KEY = os.getenv('UPSTAGE_API_KEY')
-    UPSTAGE_API_URL = 'https://api.upstage.ai/v1/solar/chat/completions'
+    UPSTAGE_API_URL = os.getenv('UPSTAGE_API_URL', 'https://api.upstage.ai/v1/solar/chat/completions')
     
     # GitHub
     GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
     GITHUB_WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET')
-    GITHUB_API_URL = 'https://api.github.com'
+    GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com')  # GitHub Enterprise/벤치마크용 mock 서버
+    GITHUB_RATE_LIMIT_RESERVE = int(os.getenv('GITHUB_RATE_LIMIT_RESERVE', 100))  # 항상 남겨둘 호출 수
+    GITHUB_RATE_LIMIT_MAX_WAIT = float(os.getenv('GITHUB_RATE_LIMIT_MAX_WAIT', 30))  # 초, 넘으면 작업 연기
+    RATE_LIMIT_SHARED = os.getenv('RATE_LIMIT_SHARED', 'True').lower() == 'true'  # GitHub/Slack 호출 한도를 모든 프로세스가 나눠 씀
+    RATE_LIMIT_DB_PATH = os.getenv('RATE_LIMIT_DB_PATH', 'data/rate_limits.db')  # 워커 프로세스 간 공유
+    GITHUB_ETAG_CACHE_SIZE = int(os.getenv('GITHUB_ETAG_CACHE_SIZE', 1000))
+    GITHUB_ETAG_CACHE_MAX_BODY = int(os.getenv('GITHUB_ETAG_CACHE_MAX_BODY', 1024 * 1024))  # bytes
+    GITHUB_FILE_CACHE_SIZE = int(os.getenv('GITHUB_FILE_CACHE_SIZE', 1000))  # .gitattributes 등 저장소 파일 LRU 크기
+    GITHUB_FILE_CACHE_TTL = int(os.getenv('GITHUB_FILE_CACHE_TTL', 300))  # 초 (파일이 없다는 결과도 캐시)
+    
+    # Webhook Intake
+    WEBHOOK_MAX_BODY_BYTES = int(os.getenv('WEBHOOK_MAX_BODY_BYTES', 25 * 1024 * 1024))  # GitHub webhook 최대 크기(25MB)
+    WEBHOOK_DEDUP_ENABLED = os.getenv('WEBHOOK_DEDUP_ENABLED', 'True').lower() == 'true'  # X-GitHub-Delivery 중복 무시
+    WEBHOOK_DEDUP_DB_PATH = os.getenv('WEBHOOK_DEDUP_DB_PATH', 'data/deliveries.db')  # 워커 프로세스 간 공유
+    WEBHOOK_DEDUP_TTL = int(os.getenv('WEBHOOK_DEDUP_TTL', 3 * 24 * 3600))  # 초
+    WEBHOOK_DEDUP_MEMORY_SIZE = int(os.getenv('WEBHOOK_DEDUP_MEMORY_SIZE', 10000))  # 메모리에 둘 최근 ID 수
     
     # Slack
     SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
     SLACK_BOT_TOKEN = os.getenv('SLACK_BOT_TOKEN')
+    SLACK_API_URL = os.getenv('SLACK_API_URL', 'https://slack.com/api')
+    SLACK_CHANNEL = os.getenv('SLACK_CHANNEL')  # 봇이 메시지를 올릴 채널 ID
+    SLACK_PROGRESSIVE_UPDATES = os.getenv('SLACK_PROGRESSIVE_UPDATES', 'False').lower() == 'true'  # PR당 메시지 하나를 단계별로 갱신
+    SLACK_UPDATE_INTERVAL = float(os.getenv('SLACK_UPDATE_INTERVAL', 1.5))  # 초, 중간 진행 상황 갱신 최소 간격
+    SLACK_MESSAGE_DB_PATH = os.getenv('SLACK_MESSAGE_DB_PATH', 'data/slack_messages.db')
+    SLACK_RATE_LIMIT = float(os.getenv('SLACK_RATE_LIMIT', 1))  # 대상(웹훅/채널)별 초당 메시지 수
+    SLACK_RATE_BURST = int(os.getenv('SLACK_RATE_BURST', 3))  # 순간 최대 전송 수
+    SLACK_DIGEST_WINDOW = float(os.getenv('SLACK_DIGEST_WINDOW', 0))  # 초, 0이면 PR마다 개별 전송
+    SLACK_OUTBOX_DB_PATH = os.getenv('SLACK_OUTBOX_DB_PATH', 'data/slack_outbox.db')
+    SLACK_OUTBOX_MAX_ATTEMPTS = int(os.getenv('SLACK_OUTBOX_MAX_ATTEMPTS', 5))
+    SLACK_DISPATCH_WORKERS = int(os.getenv('SLACK_DISPATCH_WORKERS', 2))
+    
+    # HTTP
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))  # 초
+    GITHUB_READ_TIMEOUT = float(os.getenv('GITHUB_READ_TIMEOUT', 30))
+    LLM_READ_TIMEOUT = float(os.getenv('LLM_READ_TIMEOUT', 60))
+    SLACK_READ_TIMEOUT = float(os.getenv('SLACK_READ_TIMEOUT', 10))
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 20))  # 호스트당 keep-alive 연결 수
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 3))  # 5xx/429 재시도 횟수
+    HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', 0.5))  # 초
     
     # Server
     PORT = int(os.getenv('PORT', 5000))
     HOST = os.getenv('HOST', '0.0.0.0')
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
     
+    # Process Model
+    PROCESS_ROLE = os.getenv('PROCESS_ROLE', 'all').lower()  # 'all' | 'web' (수신만) | 'worker' (큐 처리만)
+    WEB_WORKERS = int(os.getenv('WEB_WORKERS', 2))  # gunicorn HTTP 워커 프로세스 수
+    WEB_THREADS = int(os.getenv('WEB_THREADS', 4))  # HTTP 워커 프로세스당 요청 처리 스레드 수
+    WEB_TIMEOUT = int(os.getenv('WEB_TIMEOUT', 30))  # 초
+    WORKER_PROCESSES = int(os.getenv('WORKER_PROCESSES', 0))  # worker.py 프로세스 수 (0이면 CPU 코어 수)
+    WORKER_QUEUES = os.getenv('WORKER_QUEUES', 'review,slack')  # worker.py가 처리할 큐
+    WORKER_METRICS_PORT = int(os.getenv('WORKER_METRICS_PORT', 0))  # 워커별 /metrics 시작 포트 (0이면 사용 안 함)
+    SHUTDOWN_GRACE_SECONDS = float(os.getenv('SHUTDOWN_GRACE_SECONDS', 30))  # SIGTERM 후 진행 중 작업 대기 시간
+    
+    # Job Queue
+    QUEUE_DB_PATH = os.getenv('QUEUE_DB_PATH', 'data/jobs.db')
+    QUEUE_WORKERS = int(os.getenv('QUEUE_WORKERS', 4))
+    QUEUE_MAX_ATTEMPTS = int(os.getenv('QUEUE_MAX_ATTEMPTS', 3))
+    QUEUE_RETRY_BACKOFF = float(os.getenv('QUEUE_RETRY_BACKOFF', 5))  # 초
+    QUEUE_VISIBILITY_TIMEOUT = int(os.getenv('QUEUE_VISIBILITY_TIMEOUT', 300))  # 초
+    QUEUE_POLL_INTERVAL = float(os.getenv('QUEUE_POLL_INTERVAL', 1))  # 초
+    QUEUE_MAINTENANCE_INTERVAL = float(os.getenv('QUEUE_MAINTENANCE_INTERVAL', 60))  # 초, 만료 lease 복구/오래된 작업 삭제 주기
+    QUEUE_RETENTION_SECONDS = int(os.getenv('QUEUE_RETENTION_SECONDS', 7 * 24 * 3600))  # 완료/실패 작업 보관 시간
+    REVIEW_DEBOUNCE_SECONDS = float(os.getenv('REVIEW_DEBOUNCE_SECONDS', 30))  # 같은 PR 연속 push(synchronize) 대기 시간
+    REVIEW_DEADLINE_SECONDS = float(os.getenv('REVIEW_DEADLINE_SECONDS', 240))  # 작업 하나의 전체 처리 시간 (visibility timeout보다 짧게)
+    
+    # Pipeline
+    PIPELINE_MODE = os.getenv('PIPELINE_MODE', 'sync').lower()  # 'sync' | 'async'
+    ASYNC_MAX_IN_FLIGHT = int(os.getenv('ASYNC_MAX_IN_FLIGHT', 200))  # async 모드 동시 리뷰 수
+    
+    # Analysis Cache
+    ANALYSIS_CACHE_ENABLED = os.getenv('ANALYSIS_CACHE_ENABLED', 'True').lower() == 'true'
+    ANALYSIS_CACHE_DB_PATH = os.getenv('ANALYSIS_CACHE_DB_PATH', 'data/analysis_cache.db')
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', 7 * 24 * 3600))  # 초
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', 5000))
+    
+    # Token Budget
+    TOKEN_COUNTER = os.getenv('TOKEN_COUNTER', 'approx').lower()  # 'approx' | 'tiktoken'
+    LLM_CONTEXT_WINDOW = int(os.getenv('LLM_CONTEXT_WINDOW', 32768))
+    LLM_MIN_RESPONSE_TOKENS = int(os.getenv('LLM_MIN_RESPONSE_TOKENS', 768))
+    LLM_MAX_RESPONSE_TOKENS = int(os.getenv('LLM_MAX_RESPONSE_TOKENS', 2000))
+    
+    # Chunked Analysis
+    LLM_CHUNK_TOKEN_BUDGET = int(os.getenv('LLM_CHUNK_TOKEN_BUDGET', 6000))  # 청크당 diff 토큰 수
+    LLM_CHUNK_WORKERS = int(os.getenv('LLM_CHUNK_WORKERS', 4))  # 동시 LLM 호출 수
+    LLM_MAX_CHUNKS = int(os.getenv('LLM_MAX_CHUNKS', 40))  # PR당 최대 청크 수
+    DIFF_MAX_BYTES = int(os.getenv('DIFF_MAX_BYTES', 2 * 1024 * 1024))  # 스트리밍으로 읽을 최대 diff 크기
+    DIFF_MAX_LINES = int(os.getenv('DIFF_MAX_LINES', 50000))
+    
+    # Incremental Review
+    INCREMENTAL_REVIEW_ENABLED = os.getenv('INCREMENTAL_REVIEW_ENABLED', 'True').lower() == 'true'  # 새 push는 바뀐 파일만 분석
+    INCREMENTAL_MAX_PUSHES = int(os.getenv('INCREMENTAL_MAX_PUSHES', 10))  # 이 횟수마다 전체 diff로 다시 분석
+    REVIEW_STATE_DB_PATH = os.getenv('REVIEW_STATE_DB_PATH', 'data/review_state.db')
+    REVIEW_STATE_TTL = int(os.getenv('REVIEW_STATE_TTL', 30 * 24 * 3600))  # 초
+    
+    # Review History
+    REVIEW_HISTORY_ENABLED = os.getenv('REVIEW_HISTORY_ENABLED', 'True').lower() == 'true'  # 리뷰 결과/소요 시간 기록
+    REVIEW_HISTORY_DB_PATH = os.getenv('REVIEW_HISTORY_DB_PATH', 'data/reviews.db')
+    REVIEW_HISTORY_BATCH_SIZE = int(os.getenv('REVIEW_HISTORY_BATCH_SIZE', 100))  # 한 트랜잭션에 쓸 최대 기록 수
+    REVIEW_HISTORY_FLUSH_INTERVAL = float(os.getenv('REVIEW_HISTORY_FLUSH_INTERVAL', 1.0))  # 기록을 모으는 최대 시간(초)
+    REVIEW_HISTORY_MAX_PENDING = int(os.getenv('REVIEW_HISTORY_MAX_PENDING', 10000))  # 초과 시 기록을 버림
+    
+    # LLM Scheduler
+    LLM_SCHEDULER_ENABLED = os.getenv('LLM_SCHEDULER_ENABLED', 'True').lower() == 'true'  # LLM 요청 전에 슬롯 배정
+    LLM_SCHEDULER_SHARED = os.getenv('LLM_SCHEDULER_SHARED', 'True').lower() == 'true'  # 한도를 모든 프로세스가 나눠 씀
+    LLM_SCHEDULER_DB_PATH = os.getenv('LLM_SCHEDULER_DB_PATH', 'data/llm_scheduler.db')  # 워커 프로세스 간 공유
+    LLM_SCHEDULER_LEASE_TTL = float(os.getenv('LLM_SCHEDULER_LEASE_TTL', 600))  # 초, 죽은 프로세스의 슬롯을 회수
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 16))  # 동시 LLM 요청 수 (공유하지 않으면 프로세스당)
+    LLM_TOKENS_PER_MINUTE = int(os.getenv('LLM_TOKENS_PER_MINUTE', 0))  # 분당 토큰 예산 (0이면 제한 없음, 공유하지 않으면 프로세스당)
+    LLM_PROTECTED_BRANCHES = os.getenv('LLM_PROTECTED_BRANCHES', 'main,master')  # 이 브랜치 대상 PR을 먼저 분석
+    LLM_PRIORITY_AGING = float(os.getenv('LLM_PRIORITY_AGING', 60))  # 초, 기다린 만큼 우선순위를 한 단계씩 올림
+    LLM_SCHEDULER_MAX_WAIT = float(os.getenv('LLM_SCHEDULER_MAX_WAIT', 180))  # 초, 넘으면 해당 청크 분석 실패
+    LLM_RATE_LIMIT_PAUSE = float(os.getenv('LLM_RATE_LIMIT_PAUSE', 5))  # 초, 429에 Retry-After가 없을 때 멈출 시간
+    
+    # LLM Routing
+    LLM_ROUTING_ENABLED = os.getenv('LLM_ROUTING_ENABLED', 'False').lower() == 'true'  # diff 특성으로 모델 선택
+    LLM_ROUTES_FILE = os.getenv('LLM_ROUTES_FILE', '')  # 라우팅 규칙 JSON 파일 (비어 있으면 기본 규칙)
+    
+    # LLM Hedging
+    LLM_HEDGE_ENABLED = os.getenv('LLM_HEDGE_ENABLED', 'False').lower() == 'true'  # 느린 요청에 두 번째 요청 추가
+    LLM_HEDGE_QUANTILE = float(os.getenv('LLM_HEDGE_QUANTILE', 0.9))  # 이 분위수 지연 시간이 지나면 헤지
+    LLM_HEDGE_MIN_SAMPLES = int(os.getenv('LLM_HEDGE_MIN_SAMPLES', 20))  # 헤지 시작 전 필요한 지연 시간 표본 수
+    LLM_HEDGE_MAX_RATIO = float(os.getenv('LLM_HEDGE_MAX_RATIO', 0.1))  # 요청 대비 헤지 비율 상한
+    LLM_HEDGE_MAX_INFLIGHT = int(os.getenv('LLM_HEDGE_MAX_INFLIGHT', 2))  # 동시 헤지 요청 수 상한
+    
+    # LLM Streaming
+    LLM_STREAMING = os.getenv('LLM_STREAMING', 'False').lower() == 'true'  # 완성된 항목부터 처리, 끊긴 응답 부분 복구
+    
+    # LLM Output Repair
+    LLM_REPAIR_ENABLED = os.getenv('LLM_REPAIR_ENABLED', 'True').lower() == 'true'  # 로컬에서 못 고친 응답은 깨진 부분만 다시 요청
+    LLM_REPAIR_MAX_TOKENS = int(os.getenv('LLM_REPAIR_MAX_TOKENS', 1500))  # 이보다 큰 조각은 복구 요청 없이 분석 실패
+    
+    # Diff Filter
+    DIFF_FILTER_ENABLED = os.getenv('DIFF_FILTER_ENABLED', 'True').lower() == 'true'
+    DIFF_FILTER_MODE = os.getenv('DIFF_FILTER_MODE', 'summarize').lower()  # 'summarize' | 'drop'
+    DIFF_FILTER_EXTRA_PATTERNS = [
+        p.strip() for p in os.getenv('DIFF_FILTER_EXTRA_PATTERNS', '').split(',') if p.strip()
+    ]  # 추가 제외 경로 glob
+    DIFF_FILTER_USE_GITATTRIBUTES = os.getenv('DIFF_FILTER_USE_GITATTRIBUTES', 'True').lower() == 'true'
+    
     @classmethod
     def validate(cls):
         """필수 환경변수 검증"""
@@ -47,6 +178,9 @@ class Config:
                 f".env 파일을 확인해주세요."
             )
         
+        if cls.PROCESS_ROLE not in ('all', 'web', 'worker'):
+            raise ValueError(f"PROCESS_ROLE은 all, web, worker 중 하나여야 합니다: {cls.PROCESS_ROLE}")
+        
         return True
 
 
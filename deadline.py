@@ -0,0 +1,60 @@
+"""
+리뷰 작업 마감 시간 모듈
+
+작업 하나에 주어진 전체 시간을 단계(diff 수신 → LLM 분석 → 전송)마다 넘겨
+각 단계가 남은 시간 안에서만 기다리도록 합니다.
+"""
+import time
+from typing import Tuple
+
+
+class DeadlineExceeded(Exception):
+    """마감 시간이 지나 다음 단계를 시작할 수 없음"""
+
+
+class Deadline:
+    """
+    monotonic 시계 기준 마감 시각
+
+    작업을 가져온 시점에 만들어 process_pr_review부터 LLM 요청까지 그대로 전달합니다.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Args:
+            seconds: 지금부터 허용할 시간(초)
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """남은 시간(초), 지났으면 0"""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str):
+        """
+        단계 시작 전 마감 확인
+
+        Args:
+            stage: 로그/오류 메시지에 쓸 단계 이름
+
+        Raises:
+            DeadlineExceeded: 이미 마감 시간이 지난 경우
+        """
+        if self.expired():
+            raise DeadlineExceeded(f"{stage} 단계 시작 전 마감 시간({self.seconds:.0f}초) 초과")
+
+    def cap_timeout(self, timeout: Tuple[float, float], stage: str = "요청") -> Tuple[float, float]:
+        """
+        (connect, read) 타임아웃을 남은 시간 이하로 제한
+
+        Raises:
+            DeadlineExceeded: 이미 마감 시간이 지난 경우
+        """
+        self.check(stage)
+        remaining = self.remaining()
+        connect, read = timeout
+        return min(connect, remaining), min(read, remaining)
@@ -0,0 +1,140 @@
+"""
+Webhook 중복 전달 방지 모듈 (X-GitHub-Delivery 기준)
+
+GitHub은 응답이 늦으면 같은 webhook을 같은 delivery ID로 다시 보냅니다.
+최근 ID는 프로세스 메모리에서 바로 걸러내고, 처음 보는 ID는 SQLite에 기록하여
+같은 파일을 쓰는 다른 워커 프로세스가 받은 중복도 걸러냅니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict
+
+from utils.config import Config
+
+
+class DeliveryDeduplicator:
+    """
+    delivery ID 중복 판별기
+
+    - 메모리: 최근 max_memory개 ID (LRU)
+    - SQLite: ttl 동안 모든 ID (PRIMARY KEY 충돌로 워커 간 경쟁 없이 한 번만 등록)
+    """
+
+    # 이 횟수만큼 등록할 때마다 만료된 ID 정리
+    PURGE_EVERY = 1000
+
+    def __init__(self, db_path: str = None, ttl: float = None, max_memory: int = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: Config.WEBHOOK_DEDUP_DB_PATH)
+            ttl: delivery ID 보관 시간(초) (기본값: Config.WEBHOOK_DEDUP_TTL)
+            max_memory: 메모리에 둘 최근 ID 수 (기본값: Config.WEBHOOK_DEDUP_MEMORY_SIZE)
+        """
+        self.db_path = db_path or Config.WEBHOOK_DEDUP_DB_PATH
+        self.ttl = ttl if ttl is not None else Config.WEBHOOK_DEDUP_TTL
+        self.max_memory = max_memory or Config.WEBHOOK_DEDUP_MEMORY_SIZE
+        self._recent: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._registered = 0
+
+        self.accepted = 0
+        self.duplicates = 0
+        self.memory_hits = 0
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS deliveries (
+                delivery_id TEXT PRIMARY KEY,
+                received_at REAL NOT NULL
+            )
+        """)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_deliveries_received ON deliveries (received_at)')
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _remember(self, delivery_id: str, now: float):
+        with self._lock:
+            self._recent[delivery_id] = now
+            self._recent.move_to_end(delivery_id)
+            while len(self._recent) > self.max_memory:
+                self._recent.popitem(last=False)
+
+    def claim(self, delivery_id: str) -> bool:
+        """
+        delivery ID 등록
+
+        Args:
+            delivery_id: X-GitHub-Delivery 헤더 값
+
+        Returns:
+            bool: 처음 받은 전달이면 True, 이미 받은 전달(중복)이면 False
+        """
+        now = time.time()
+        with self._lock:
+            seen_at = self._recent.get(delivery_id)
+            if seen_at is not None and seen_at > now - self.ttl:
+                self.duplicates += 1
+                self.memory_hits += 1
+                return False
+
+        conn = self._connect()
+        inserted = conn.execute(
+            'INSERT OR IGNORE INTO deliveries (delivery_id, received_at) VALUES (?, ?)',
+            (delivery_id, now)
+        ).rowcount == 1
+        if not inserted:
+            # 만료된 기록이면 새 전달로 보고 시각 갱신
+            inserted = conn.execute(
+                'UPDATE deliveries SET received_at = ? WHERE delivery_id = ? AND received_at <= ?',
+                (now, delivery_id, now - self.ttl)
+            ).rowcount == 1
+
+        self._remember(delivery_id, now)
+        with self._lock:
+            if inserted:
+                self.accepted += 1
+                self._registered += 1
+                purge = self._registered % self.PURGE_EVERY == 0
+            else:
+                self.duplicates += 1
+                purge = False
+
+        if purge:
+            conn.execute('DELETE FROM deliveries WHERE received_at <= ?', (now - self.ttl,))
+        return inserted
+
+    def release(self, delivery_id: str):
+        """
+        등록 취소 (처리에 실패해 GitHub의 재전달을 다시 받아야 하는 경우)
+
+        Args:
+            delivery_id: X-GitHub-Delivery 헤더 값
+        """
+        with self._lock:
+            self._recent.pop(delivery_id, None)
+        self._connect().execute('DELETE FROM deliveries WHERE delivery_id = ?', (delivery_id,))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'accepted': self.accepted,
+                'duplicates': self.duplicates,
+                'memory_hits': self.memory_hits,
+                'memory_entries': len(self._recent)
+            }
@@ -0,0 +1,146 @@
+"""
+Unified diff를 LLM 분석 단위(청크)로 나누는 모듈
+"""
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+from utils.diff_parser import DiffFile
+from utils.token_budget import file_priority, get_token_counter
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수 추정 (Config.TOKEN_COUNTER 설정의 계산기 사용)
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    return get_token_counter().count(text)
+
+
+# 토큰 예산을 넘어 잘라낸 라인 끝에 붙이는 표시
+TRUNCATION_MARKER = ' … (이하 생략)'
+
+
+def split_files_into_chunks(files: Iterable[DiffFile], max_tokens: int) -> List[Dict]:
+    """
+    파싱된 파일 diff들을 토큰 예산에 맞는 청크로 분리
+
+    파일은 우선순위(소스 → 테스트 → 문서/설정 → lock/생성 파일) 순으로 배치되어
+    청크 수 제한에 걸리면 우선순위가 낮은 파일부터 빠집니다.
+    작은 파일들은 한 청크로 묶고, 예산을 넘는 파일은 hunk 단위로,
+    그래도 넘는 hunk는 라인 단위로 나눕니다. 나뉜 조각에는 파일 헤더를 다시 붙입니다.
+    라인 하나가 예산을 넘으면 예산에 맞게 잘라내고 그 청크를 truncated로 표시하므로
+    어떤 청크도 max_tokens를 넘지 않습니다. 파일 헤더조차 예산에 들어가지 않는 파일은
+    청크에 넣지 않습니다 (어느 청크의 'files'에도 없으므로 호출하는 쪽에서 누락으로 보고).
+
+    Args:
+        files: diff_parser.parse_diff() 결과
+        max_tokens: 청크당 최대 토큰 수
+
+    Returns:
+        List[Dict]: {'files': [경로], 'text': diff 조각, 'tokens': 추정 토큰 수,
+            'truncated': 잘라낸 라인 포함 여부} 리스트
+    """
+    counter = get_token_counter()
+    pieces = []
+    for file in sorted(files, key=lambda f: file_priority(f.path)):
+        file_tokens = sum(counter.count_line(line) for line in file.iter_lines())
+        if file_tokens <= max_tokens:
+            pieces.append((file.path, file.text(), False))
+            continue
+
+        header = file.header_text()
+        if not file.hunks or counter.count(header) >= max_tokens:
+            logger.warning(f"⚠️ 토큰 예산({max_tokens})에 넣을 수 없어 분석에서 제외: {file.path}")
+            continue
+        for hunk in file.hunks:
+            for text, truncated in _split_hunk(list(hunk.iter_lines()), header, max_tokens):
+                pieces.append((file.path, text, truncated))
+
+    return _pack(pieces, max_tokens)
+
+
+def _truncate_line(line: str, max_tokens: int) -> str:
+    # 예산에 들어가는 가장 긴 앞부분 + 생략 표시 (표시조차 안 들어가면 앞부분만)
+    counter = get_token_counter()
+    marker = TRUNCATION_MARKER if counter.count_line(TRUNCATION_MARKER) <= max_tokens else ''
+    low, high = 0, len(line)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if counter.count_line(line[:mid] + marker) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return line[:low] + marker
+
+
+def _split_hunk(hunk: List[str], header: str, max_tokens: int) -> List[Tuple[str, bool]]:
+    text = '\n'.join(hunk)
+    header_tokens = estimate_tokens(header)
+    if header_tokens + estimate_tokens(text) <= max_tokens:
+        return [(f"{header}\n{text}" if header else text, False)]
+
+    budget = max_tokens - header_tokens
+    hunk_header = hunk[0] if hunk and hunk[0].startswith('@@') else ''
+    hunk_header_tokens = estimate_tokens(hunk_header)
+    # 이어지는 조각에 hunk 헤더를 반복할 여유가 없으면 반복하지 않음
+    if hunk_header_tokens >= budget:
+        hunk_header = ''
+        hunk_header_tokens = 0
+    parts = []
+    current = []
+    current_tokens = 0
+    truncated = False
+
+    for line in hunk:
+        line_tokens = estimate_tokens(line)
+        if current and current_tokens + line_tokens > budget:
+            parts.append((current, truncated))
+            # 이어지는 조각임을 알 수 있도록 hunk 헤더 반복
+            current = [hunk_header] if hunk_header else []
+            current_tokens = hunk_header_tokens
+            truncated = False
+        if current_tokens + line_tokens > budget:
+            line = _truncate_line(line, budget - current_tokens)
+            line_tokens = estimate_tokens(line)
+            truncated = True
+        current.append(line)
+        current_tokens += line_tokens
+
+    if current:
+        parts.append((current, truncated))
+
+    prefix = f"{header}\n" if header else ""
+    return [(prefix + '\n'.join(part), part_truncated) for part, part_truncated in parts]
+
+
+def _pack(pieces: List[tuple], max_tokens: int) -> List[Dict]:
+    chunks = []
+    current = None
+
+    for path, text, truncated in pieces:
+        tokens = estimate_tokens(text)
+        if current is None or current['tokens'] + tokens > max_tokens:
+            current = {'files': [], 'parts': [], 'tokens': 0, 'truncated': False}
+            chunks.append(current)
+        if path and path not in current['files']:
+            current['files'].append(path)
+        current['parts'].append(text)
+        current['tokens'] += tokens
+        current['truncated'] = current['truncated'] or truncated
+
+    return [
+        {
+            'files': chunk['files'],
+            'text': '\n'.join(chunk['parts']),
+            'tokens': chunk['tokens'],
+            'truncated': chunk['truncated']
+        }
+        for chunk in chunks
+    ]
@@ -0,0 +1,235 @@
+"""
+LLM 분석 전 diff 사전 필터링 모듈
+
+생성 파일, vendored 의존성, lock 파일, 바이너리 등 리뷰 가치가 낮은 파일을
+프롬프트에서 제외하거나 한 줄 요약으로 대체합니다.
+"""
+import fnmatch
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.config import Config
+from utils.diff_parser import DiffFile
+from utils.token_budget import LOW_PRIORITY_PATTERNS, get_token_counter
+
+logger = logging.getLogger(__name__)
+
+KEEP = 'keep'
+SUMMARIZE = 'summarize'
+DROP = 'drop'
+
+# 생성 코드임을 나타내는 표식 (추가된 라인 앞부분에서 검사)
+GENERATED_MARKERS = ('@generated', 'DO NOT EDIT', 'Code generated by', 'autogenerated', 'auto-generated')
+GENERATED_MARKER_SCAN_LINES = 10
+
+# minified 판정 기준
+MINIFIED_LINE_LENGTH = 1000
+
+
+def parse_gitattributes(content: str) -> List[Tuple[str, Dict[str, bool]]]:
+    """
+    .gitattributes에서 린귀스트 관련 규칙 추출
+
+    `attr`, `attr=true`는 True, `-attr`(unset), `!attr`(unspecified), `attr=false`는 False로 봅니다.
+    규칙은 파일 순서대로 반환되므로 적용하는 쪽에서 뒤의 규칙으로 덮어쓰면 git과 같이
+    마지막에 매치된 규칙이 우선합니다.
+
+    Args:
+        content: .gitattributes 파일 내용
+
+    Returns:
+        List[Tuple[str, Dict]]: (패턴, {'generated': bool, 'vendored': bool, 'binary': bool}) 리스트
+            (규칙에 나온 속성만 포함)
+    """
+    rules = []
+    for raw in content.splitlines():
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        pattern, *attrs = line.split()
+        flags = {}
+        for attr in attrs:
+            if attr[0] in '-!':
+                name, enabled = attr[1:], False
+            else:
+                name, _, value = attr.partition('=')
+                enabled = value.lower() not in ('false', '0')
+            if name == 'linguist-generated':
+                flags['generated'] = enabled
+            elif name == 'linguist-vendored':
+                flags['vendored'] = enabled
+            elif name == 'binary':
+                flags['binary'] = enabled
+            elif name == 'diff':
+                # -diff는 바이너리로 취급, diff를 다시 지정하면 텍스트 diff
+                flags['binary'] = not enabled
+
+        if flags:
+            rules.append((pattern, flags))
+    return rules
+
+
+def _gitattributes_match(pattern: str, path: str) -> bool:
+    # 슬래시가 없는 패턴은 어느 디렉토리의 파일 이름과도 매치 (git 규칙)
+    if '/' not in pattern.rstrip('/'):
+        return fnmatch.fnmatch(path.rsplit('/', 1)[-1], pattern)
+    pattern = pattern.lstrip('/')
+    if pattern.endswith('/'):
+        pattern += '**'
+    return fnmatch.fnmatch(path, pattern)
+
+
+class DiffFilter:
+    """
+    파일 단위 diff를 분류하여 LLM에 보낼 파일만 남기는 필터
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str] = None,
+        mode: str = None,
+        gitattributes: Optional[str] = None
+    ):
+        """
+        Args:
+            patterns: 요약/제외할 경로 glob (기본값: lock/생성 파일 패턴 + Config.DIFF_FILTER_EXTRA_PATTERNS)
+            mode: 저가치 파일 처리 방식 'summarize' 또는 'drop' (기본값: Config.DIFF_FILTER_MODE)
+            gitattributes: 저장소 .gitattributes 내용 (linguist-generated/vendored 규칙 적용)
+        """
+        if patterns is None:
+            patterns = LOW_PRIORITY_PATTERNS + tuple(Config.DIFF_FILTER_EXTRA_PATTERNS)
+        self.patterns = tuple(patterns)
+        self.mode = mode or Config.DIFF_FILTER_MODE
+        self.attribute_rules = parse_gitattributes(gitattributes) if gitattributes else []
+        self.counter = get_token_counter()
+
+    def classify(self, file: DiffFile) -> Tuple[str, str]:
+        """
+        파일 분류
+
+        Args:
+            file: 파일 단위 diff
+
+        Returns:
+            Tuple[str, str]: (KEEP/SUMMARIZE/DROP, 사유)
+        """
+        low_value = SUMMARIZE if self.mode == SUMMARIZE else DROP
+
+        if file.is_binary:
+            return low_value, 'binary'
+
+        flags = {}
+        for pattern, rule_flags in self.attribute_rules:
+            if _gitattributes_match(pattern, file.path):
+                flags.update(rule_flags)
+        if flags.get('binary'):
+            return low_value, 'binary (.gitattributes)'
+        if flags.get('generated'):
+            return low_value, 'linguist-generated'
+        if flags.get('vendored'):
+            return low_value, 'linguist-vendored'
+        if flags.get('generated') is False:
+            # .gitattributes에서 명시적으로 생성 파일이 아니라고 지정
+            return KEEP, ''
+
+        name = file.path.rsplit('/', 1)[-1]
+        for pattern in self.patterns:
+            if fnmatch.fnmatch(file.path, pattern) or fnmatch.fnmatch(name, pattern):
+                return low_value, f'pattern {pattern}'
+
+        return self._classify_content(file, low_value)
+
+    def _classify_content(self, file: DiffFile, low_value: str) -> Tuple[str, str]:
+        scanned = 0
+        for hunk in file.hunks:
+            for line in hunk.lines:
+                if len(line) > MINIFIED_LINE_LENGTH and line.count(' ') < len(line) // 50:
+                    return low_value, 'minified content'
+                if scanned < GENERATED_MARKER_SCAN_LINES and line.startswith('+'):
+                    scanned += 1
+                    if any(marker in line for marker in GENERATED_MARKERS):
+                        return low_value, 'generated marker'
+        return KEEP, ''
+
+    def apply(self, files: Iterable[DiffFile]) -> Tuple[List[DiffFile], Dict]:
+        """
+        필터 적용
+
+        Args:
+            files: 파일 단위 diff 목록
+
+        Returns:
+            Tuple[List[DiffFile], Dict]: (LLM에 보낼 파일 목록, 절감 통계)
+        """
+        kept: List[DiffFile] = []
+        report = {
+            'kept': 0,
+            'summarized': 0,
+            'dropped': 0,
+            'bytes_saved': 0,
+            'tokens_saved': 0,
+            'files': []
+        }
+
+        for file in files:
+            action, reason = self.classify(file)
+            if action == KEEP:
+                kept.append(file)
+                report['kept'] += 1
+                continue
+
+            original_tokens = sum(self.counter.count_line(line) for line in file.iter_lines())
+            saved_bytes = file.byte_size
+            saved_tokens = original_tokens
+
+            if action == SUMMARIZE:
+                summary = self._summarize(file, reason)
+                kept.append(summary)
+                saved_bytes -= summary.byte_size
+                saved_tokens -= self.counter.count(summary.text())
+                report['summarized'] += 1
+            else:
+                report['dropped'] += 1
+
+            report['bytes_saved'] += max(saved_bytes, 0)
+            report['tokens_saved'] += max(saved_tokens, 0)
+            report['files'].append({'path': file.path, 'action': action, 'reason': reason})
+
+        return kept, report
+
+    @staticmethod
+    def _summarize(file: DiffFile, reason: str) -> DiffFile:
+        # 파일이 바뀌었다는 사실과 규모만 남긴 대체 diff
+        summary = DiffFile(file.header_lines[0])
+        note = f"# [생략됨: {reason}] +{file.added} / -{file.removed} 라인"
+        summary.header_lines.append(note)
+        summary.line_count = 2
+        summary.byte_size = len(summary.text().encode('utf-8')) + 2
+        return summary
+
+
+def filter_diff_files(
+    files: List[DiffFile],
+    gitattributes: Optional[str] = None
+) -> Tuple[List[DiffFile], Optional[Dict]]:
+    """
+    설정에 따라 사전 필터를 적용하고 절감량을 로그로 남김
+
+    Args:
+        files: 파일 단위 diff 목록
+        gitattributes: 저장소 .gitattributes 내용
+
+    Returns:
+        Tuple[List[DiffFile], Dict]: (필터링된 파일 목록, 절감 통계 - 비활성화 시 None)
+    """
+    if not Config.DIFF_FILTER_ENABLED:
+        return files, None
+
+    kept, report = DiffFilter(gitattributes=gitattributes).apply(files)
+    if report['summarized'] or report['dropped']:
+        logger.info(
+            f"🧹 사전 필터: {report['summarized']}개 요약, {report['dropped']}개 제외 "
+            f"({report['bytes_saved']} bytes, 약 {report['tokens_saved']} 토큰 절감)"
+        )
+    return kept, report
@@ -0,0 +1,212 @@
+"""
+스트리밍 unified diff 파서 모듈
+
+전체 diff 문자열을 만들지 않고 라인 이터레이터(예: requests의 iter_lines)에서
+파일/hunk 단위 객체를 순차적으로 생성합니다.
+"""
+from typing import Iterable, Iterator, List, Optional, Union
+
+
+class DiffHunk:
+    """하나의 hunk (@@ 헤더와 변경 라인들)"""
+
+    __slots__ = ('header', 'lines', 'added', 'removed')
+
+    def __init__(self, header: str):
+        self.header = header
+        self.lines: List[str] = []
+        self.added = 0
+        self.removed = 0
+
+    def append(self, line: str):
+        self.lines.append(line)
+        if line.startswith('+'):
+            self.added += 1
+        elif line.startswith('-'):
+            self.removed += 1
+
+    def iter_lines(self) -> Iterator[str]:
+        yield self.header
+        yield from self.lines
+
+    def text(self) -> str:
+        return '\n'.join(self.iter_lines())
+
+
+class DiffFile:
+    """하나의 파일에 대한 diff (헤더 + hunk 목록)"""
+
+    __slots__ = (
+        'path', 'old_path', 'header_lines', 'hunks', 'is_binary',
+        'line_count', 'byte_size', 'truncated'
+    )
+
+    def __init__(self, header: str):
+        self.path, self.old_path = _paths_from_header(header)
+        self.header_lines: List[str] = [header]
+        self.hunks: List[DiffHunk] = []
+        self.is_binary = False
+        self.line_count = 1
+        self.byte_size = 0
+        self.truncated = False
+
+    @property
+    def added(self) -> int:
+        return sum(hunk.added for hunk in self.hunks)
+
+    @property
+    def removed(self) -> int:
+        return sum(hunk.removed for hunk in self.hunks)
+
+    @property
+    def is_deleted(self) -> bool:
+        return any(line.startswith('deleted file mode') for line in self.header_lines)
+
+    def header_text(self) -> str:
+        return '\n'.join(self.header_lines)
+
+    def iter_lines(self) -> Iterator[str]:
+        """파일 헤더와 모든 hunk 라인을 순서대로 반환"""
+        yield from self.header_lines
+        for hunk in self.hunks:
+            yield from hunk.iter_lines()
+
+    def text(self) -> str:
+        return '\n'.join(self.iter_lines())
+
+
+class DiffStats:
+    """파싱 중 누적되는 통계"""
+
+    __slots__ = ('files', 'lines', 'bytes', 'truncated')
+
+    def __init__(self):
+        self.files = 0
+        self.lines = 0
+        self.bytes = 0
+        self.truncated = False
+
+    def to_dict(self) -> dict:
+        return {
+            'files': self.files,
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'truncated': self.truncated
+        }
+
+
+def _paths_from_header(header: str):
+    # "diff --git a/old.py b/new.py" -> ("new.py", "old.py")
+    if header.startswith('diff --git '):
+        rest = header[len('diff --git '):]
+        if ' b/' in rest:
+            old, new = rest.split(' b/', 1)
+            return new, old[2:] if old.startswith('a/') else old
+        return rest, rest
+    # 헤더 없이 "--- a/foo.py"로 시작하는 diff
+    path = header[4:].strip()
+    if path.startswith(('a/', 'b/')):
+        path = path[2:]
+    return path, path
+
+
+def parse_diff(
+    lines: Iterable[Union[str, bytes]],
+    max_bytes: int = None,
+    max_lines: int = None,
+    stats: Optional[DiffStats] = None
+) -> Iterator[DiffFile]:
+    """
+    라인 이터레이터에서 파일 단위 diff 객체를 순차 생성
+
+    예산(max_bytes/max_lines)에 도달하면 더 이상 입력을 읽지 않고
+    현재 파일을 truncated로 표시해 반환한 뒤 종료합니다.
+
+    Args:
+        lines: 개행이 제거된 diff 라인 (str 또는 UTF-8 bytes)
+        max_bytes: 읽을 최대 바이트 수
+        max_lines: 읽을 최대 라인 수
+        stats: 통계를 누적할 DiffStats (선택사항)
+
+    Yields:
+        DiffFile: 파일 단위 diff
+    """
+    stats = stats if stats is not None else DiffStats()
+    current: Optional[DiffFile] = None
+    hunk: Optional[DiffHunk] = None
+
+    for raw in lines:
+        if isinstance(raw, bytes):
+            size = len(raw) + 1
+            line = raw.decode('utf-8', errors='replace')
+        else:
+            line = raw
+            size = len(line.encode('utf-8')) + 1
+
+        if (max_bytes and stats.bytes + size > max_bytes) or \
+                (max_lines and stats.lines + 1 > max_lines):
+            stats.truncated = True
+            if current is not None:
+                current.truncated = True
+            break
+
+        stats.bytes += size
+        stats.lines += 1
+
+        is_new_file = line.startswith('diff --git ') or (
+            current is None and line.startswith('--- ')
+        )
+        if is_new_file:
+            if current is not None:
+                yield current
+            current = DiffFile(line)
+            current.byte_size = size
+            hunk = None
+            stats.files += 1
+            continue
+
+        if current is None:
+            # 파일 헤더 이전 내용은 무시
+            continue
+
+        current.line_count += 1
+        current.byte_size += size
+
+        if line.startswith('@@'):
+            hunk = DiffHunk(line)
+            current.hunks.append(hunk)
+        elif hunk is not None:
+            hunk.append(line)
+        else:
+            current.header_lines.append(line)
+            if line.startswith('Binary files ') or line == 'GIT binary patch':
+                current.is_binary = True
+
+    if current is not None:
+        yield current
+
+
+def parse_diff_text(diff_text: str, **kwargs) -> Iterator[DiffFile]:
+    """
+    이미 메모리에 있는 diff 문자열 파싱 (split 없이 순회)
+
+    Args:
+        diff_text: unified diff 문자열
+        **kwargs: parse_diff() 인자
+
+    Yields:
+        DiffFile: 파일 단위 diff
+    """
+    return parse_diff(_iter_text_lines(diff_text), **kwargs)
+
+
+def _iter_text_lines(text: str) -> Iterator[str]:
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
@@ -0,0 +1,83 @@
+"""
+조건부 요청(ETag / Last-Modified)용 응답 캐시 모듈
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Mapping, Optional
+
+
+class ConditionalCache:
+    """
+    검증자(ETag, Last-Modified)와 응답 본문을 저장하는 메모리 LRU 캐시
+
+    저장된 검증자를 If-None-Match / If-Modified-Since로 보내고,
+    304 응답을 받으면 저장된 본문을 그대로 사용합니다.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_body_bytes: int = 1024 * 1024):
+        """
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 삭제)
+            max_body_bytes: 저장할 응답 본문의 최대 크기
+        """
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self.hits = 0
+        self._entries: 'OrderedDict[Hashable, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """
+        저장된 항목 조회
+
+        Returns:
+            Dict: {'etag', 'last_modified', 'body'} (없으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """
+        저장된 항목의 조건부 요청 헤더
+
+        Args:
+            entry: get() 결과
+
+        Returns:
+            Dict: If-None-Match / If-Modified-Since 헤더
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key: Hashable, headers: Mapping[str, str], body: bytes):
+        """
+        응답 저장 (검증자가 없거나 본문이 너무 크면 저장하지 않음)
+
+        Args:
+            key: 캐시 키 (예: (url, Accept))
+            headers: 응답 헤더
+            body: 응답 본문
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not (etag or last_modified) or len(body) > self.max_body_bytes:
+            return
+
+        with self._lock:
+            self._entries[key] = {'etag': etag, 'last_modified': last_modified, 'body': body}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_hit(self):
+        """304 응답으로 저장된 본문을 재사용한 횟수 기록"""
+        with self._lock:
+            self.hits += 1
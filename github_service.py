@@ -1,14 +1,42 @@
 """
 GitHub API 연동 서비스
 """
+import json
+import time
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from utils.config import Config
+from utils.http_client import get_session
+from utils.diff_parser import DiffFile, DiffStats, parse_diff
+from utils.rate_limit import RateLimitGovernor, state_store
+from utils.etag_cache import ConditionalCache
+from utils.repo_file_cache import RepoFileCache
 
 
 class GitHubService:
     """GitHub API 연동 클래스"""
     
+    # 공유 세션/메트릭 이름
+    SERVICE_NAME = 'github'
+    
+    # 모든 인스턴스가 공유 (토큰별 한도는 RATE_LIMIT_SHARED=true면 프로세스 간에도 공유)
+    rate_limiter = RateLimitGovernor(
+        reserve=Config.GITHUB_RATE_LIMIT_RESERVE,
+        max_wait=Config.GITHUB_RATE_LIMIT_MAX_WAIT,
+        store=state_store('github')
+    )
+    etag_cache = ConditionalCache(
+        max_entries=Config.GITHUB_ETAG_CACHE_SIZE,
+        max_body_bytes=Config.GITHUB_ETAG_CACHE_MAX_BODY
+    )
+    repo_files = RepoFileCache(
+        max_entries=Config.GITHUB_FILE_CACHE_SIZE,
+        ttl=Config.GITHUB_FILE_CACHE_TTL
+    )
+    
+    # compare API가 응답에 포함하는 최대 파일 수 (이 이상이면 목록이 잘림)
+    MAX_COMPARE_FILES = 300
+    
     def __init__(self):
         self.api_url = Config.GITHUB_API_URL
         self.token = Config.GITHUB_TOKEN
@@ -16,17 +44,69 @@ class GitHubService:
             'Authorization': f'token {self.token}',
             'Accept': 'application/vnd.github.v3+json'
         }
+        self.timeout = (Config.HTTP_CONNECT_TIMEOUT, Config.GITHUB_READ_TIMEOUT)
+    
+    @property
+    def session(self):
+        """프로세스 내 공유 keep-alive 세션"""
+        return get_session(self.SERVICE_NAME)
     
-    def get_pr_diff(self, repo_full_name: str, pr_number: int) -> Optional[str]:
+    @property
+    def rate_limit_key(self) -> str:
+        return self.token or 'anonymous'
+    
+    def _send(self, method: str, url: str, headers: Dict, **kwargs) -> requests.Response:
+        """
+        호출 한도를 확인한 뒤 요청 전송
+        
+        Raises:
+            RateLimitExceeded: 한도 초기화까지 오래 기다려야 하는 경우
+            requests.exceptions.RequestException: 요청 실패 시
         """
-        PR의 diff 가져오기
+        wait = self.rate_limiter.reserve(self.rate_limit_key)
+        if wait:
+            print(f"⏳ GitHub 호출 한도 소진, {wait:.0f}초 대기")
+            time.sleep(wait)
+        
+        response = self.session.request(method, url, headers=headers, timeout=self.timeout, **kwargs)
+        self.rate_limiter.update(self.rate_limit_key, response.status_code, response.headers)
+        return response
+    
+    def _conditional_get(self, url: str, headers: Dict) -> bytes:
+        """
+        ETag/Last-Modified 조건부 GET (304 응답은 호출 한도에서 차감되지 않음)
+        
+        Returns:
+            bytes: 응답 본문 (304면 캐시된 본문)
+            
+        Raises:
+            requests.exceptions.RequestException: 요청 실패 시
+        """
+        cache_key = (url, headers.get('Accept'))
+        cached = self.etag_cache.get(cache_key)
+        response = self._send('GET', url, {**headers, **self.etag_cache.conditional_headers(cached)})
+        
+        if response.status_code == 304 and cached:
+            self.etag_cache.record_hit()
+            return cached['body']
+        
+        response.raise_for_status()
+        self.etag_cache.store(cache_key, response.headers, response.content)
+        return response.content
+    
+    def iter_pr_diff_lines(self, repo_full_name: str, pr_number: int) -> Iterator[bytes]:
+        """
+        PR diff를 전체 버퍼링 없이 라인 단위로 스트리밍
         
         Args:
-            repo_full_name: 저장소 전체 이름 (예: 'owner/repo')
+            repo_full_name: 저장소 전체 이름
             pr_number: PR 번호
             
-        Returns:
-            str: PR diff 내용 (unified diff 형식)
+        Yields:
+            bytes: 개행이 제거된 diff 라인
+            
+        Raises:
+            requests.exceptions.RequestException: 요청 실패 시
         """
         url = f"{self.api_url}/repos/{repo_full_name}/pulls/{pr_number}"
         headers = {
@@ -34,34 +114,63 @@ class GitHubService:
             'Accept': 'application/vnd.github.v3.diff'
         }
         
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
+        cache_key = (url, headers['Accept'])
+        cached = self.etag_cache.get(cache_key)
+        headers.update(self.etag_cache.conditional_headers(cached))
+        
+        with self._send('GET', url, headers, stream=True) as response:
+            if response.status_code == 304 and cached:
+                self.etag_cache.record_hit()
+                yield from cached['body'].split(b'\n')
+                return
+            
             response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            print(f"❌ PR diff 가져오기 실패: {e}")
-            return None
+            
+            # 캐시 가능한 크기까지만 본문을 모아 두고, 끝까지 읽은 경우에만 저장
+            buffered = []
+            buffered_size = 0
+            # 제너레이터가 중간에 닫히면 연결도 함께 닫혀 나머지는 읽지 않음
+            for line in response.iter_lines():
+                if buffered is not None:
+                    buffered.append(line)
+                    buffered_size += len(line) + 1
+                    if buffered_size > self.etag_cache.max_body_bytes:
+                        buffered = None
+                yield line
+            
+            if buffered is not None:
+                self.etag_cache.store(cache_key, response.headers, b'\n'.join(buffered))
     
-    def get_pr_files(self, repo_full_name: str, pr_number: int) -> List[Dict]:
+    def get_pr_diff_files(
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        max_bytes: int = None,
+        max_lines: int = None
+    ) -> Optional[Tuple[List[DiffFile], DiffStats]]:
         """
-        PR의 변경된 파일 목록 가져오기
+        PR diff를 스트리밍 파싱하여 파일 단위 객체로 반환
         
         Args:
             repo_full_name: 저장소 전체 이름
             pr_number: PR 번호
+            max_bytes: 읽을 최대 바이트 수 (도달 시 이후 내용은 받지 않음)
+            max_lines: 읽을 최대 라인 수
             
         Returns:
-            List[Dict]: 변경된 파일 정보 리스트
+            Tuple[List[DiffFile], DiffStats]: 파일 목록과 파싱 통계
         """
-        url = f"{self.api_url}/repos/{repo_full_name}/pulls/{pr_number}/files"
+        stats = DiffStats()
+        lines = self.iter_pr_diff_lines(repo_full_name, pr_number)
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            files = list(parse_diff(lines, max_bytes=max_bytes, max_lines=max_lines, stats=stats))
+            return files, stats
         except requests.exceptions.RequestException as e:
-            print(f"❌ PR 파일 목록 가져오기 실패: {e}")
-            return []
+            print(f"❌ PR diff 가져오기 실패: {e}")
+            return None
+        finally:
+            lines.close()
     
     def get_pr_details(self, repo_full_name: str, pr_number: int) -> Optional[Dict]:
         """
@@ -77,12 +186,184 @@ class GitHubService:
         url = f"{self.api_url}/repos/{repo_full_name}/pulls/{pr_number}"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return json.loads(self._conditional_get(url, self.headers))
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"❌ PR 정보 가져오기 실패: {e}")
             return None
+
+    def get_file_content(self, repo_full_name: str, path: str, ref: str = None) -> Optional[str]:
+        """
+        저장소 파일 내용 가져오기 (예: .gitattributes)
+
+        결과는 (repo, ref, 경로) 단위로 Config.GITHUB_FILE_CACHE_TTL 동안 캐시되며,
+        파일이 없다는 결과(404)도 캐시합니다. 커밋마다 다른 키가 되지 않도록
+        head SHA 대신 브랜치 이름을 ref로 넘기는 것을 권장합니다.
+
+        Args:
+            repo_full_name: 저장소 전체 이름
+            path: 저장소 내 파일 경로
+            ref: 브랜치/커밋 SHA (없으면 기본 브랜치)
+
+        Returns:
+            str: 파일 내용 (파일이 없거나 실패하면 None)
+        """
+        found, content = self.repo_files.get(repo_full_name, ref, path)
+        if found:
+            return content
+
+        url, headers = self._file_request(repo_full_name, path, ref)
+        try:
+            content = self._conditional_get(url, headers).decode('utf-8', errors='replace')
+        except requests.exceptions.RequestException as e:
+            # 파일이 없는 저장소가 대부분이므로 404는 조용히 넘어가고 없다는 결과를 캐시
+            if getattr(e.response, 'status_code', None) != 404:
+                print(f"❌ 파일 가져오기 실패 ({path}): {e}")
+                return None
+            content = None
+
+        self.repo_files.put(repo_full_name, ref, path, content)
+        return content
+
+    def _file_request(self, repo_full_name: str, path: str, ref: str = None) -> Tuple[str, Dict]:
+        url = f"{self.api_url}/repos/{repo_full_name}/contents/{path}"
+        if ref:
+            url += f"?ref={ref}"
+        headers = {
+            **self.headers,
+            'Accept': 'application/vnd.github.raw'
+        }
+        return url, headers
+
+    def get_compare_diff_files(
+        self,
+        repo_full_name: str,
+        base_sha: str,
+        head_sha: str,
+        max_bytes: int = None,
+        max_lines: int = None
+    ) -> Optional[Tuple[List[DiffFile], DiffStats]]:
+        """
+        두 커밋 사이에 바뀐 파일만 diff로 가져오기 (compare API)
+        
+        Args:
+            repo_full_name: 저장소 전체 이름
+            base_sha: 이전에 분석한 head SHA
+            head_sha: 새 head SHA
+            max_bytes: 읽을 최대 바이트 수
+            max_lines: 읽을 최대 라인 수
+            
+        Returns:
+            Tuple[List[DiffFile], DiffStats]: 바뀐 파일 목록과 파싱 통계
+            (force push/merge 커밋 등으로 증분 분석이 불가능하거나 요청이 실패하면 None)
+        """
+        url = f"{self.api_url}/repos/{repo_full_name}/compare/{base_sha}...{head_sha}"
+        
+        try:
+            comparison = json.loads(self._conditional_get(url, self.headers))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"❌ 커밋 비교 실패: {e}")
+            return None
+        
+        return self.parse_comparison(comparison, max_bytes=max_bytes, max_lines=max_lines)
+    
+    @classmethod
+    def parse_comparison(
+        cls,
+        comparison: Dict,
+        max_bytes: int = None,
+        max_lines: int = None
+    ) -> Optional[Tuple[List[DiffFile], DiffStats]]:
+        """
+        compare API 응답을 파일 단위 diff로 변환
+        
+        Returns:
+            Tuple[List[DiffFile], DiffStats]: 바뀐 파일 목록과 파싱 통계 (증분 분석이 불가능하면 None)
+        """
+        status = comparison.get('status')
+        if status == 'identical':
+            return [], DiffStats()
+        if status != 'ahead':
+            # 이전 head가 새 head의 조상이 아님 (force push, rebase)
+            print(f"ℹ️ 이전 head 이후 이력이 바뀜 ({status}), 전체 diff로 분석")
+            return None
+        
+        files = comparison.get('files') or []
+        if len(files) >= cls.MAX_COMPARE_FILES:
+            print(f"ℹ️ 바뀐 파일이 너무 많음 ({len(files)}개), 전체 diff로 분석")
+            return None
+        if any(len(commit.get('parents') or []) > 1 for commit in comparison.get('commits') or []):
+            # 베이스 브랜치를 merge한 경우 compare 결과에 PR과 무관한 변경이 섞임
+            print("ℹ️ merge 커밋 포함, 전체 diff로 분석")
+            return None
+        
+        if any(file.get('patch') is None and file.get('changes') for file in files):
+            # 바이너리가 아닌데 patch가 없음 (파일 diff가 너무 커서 compare 응답에서 생략됨)
+            print("ℹ️ patch가 생략된 파일 포함, 전체 diff로 분석")
+            return None
+        
+        stats = DiffStats()
+        diff_files = list(parse_diff(
+            cls._comparison_diff_lines(files),
+            max_bytes=max_bytes,
+            max_lines=max_lines,
+            stats=stats
+        ))
+        return diff_files, stats
+    
+    @staticmethod
+    def _comparison_diff_lines(files: List[Dict]) -> Iterator[str]:
+        # compare API의 파일별 patch를 unified diff 형식으로 재구성
+        for file in files:
+            path = file['filename']
+            old_path = file.get('previous_filename') or path
+            status = file.get('status')
+            
+            yield f"diff --git a/{old_path} b/{path}"
+            if status == 'added':
+                yield "new file mode 100644"
+            elif status == 'removed':
+                yield "deleted file mode 100644"
+            elif status == 'renamed':
+                yield f"rename from {old_path}"
+                yield f"rename to {path}"
+            
+            patch = file.get('patch')
+            if patch is None:
+                # 변경 라인 없이 이름/모드만 바뀐 파일이 아니면 바이너리
+                # (patch가 생략된 큰 텍스트 파일은 parse_comparison()에서 전체 diff로 넘김)
+                if status not in ('renamed', 'changed'):
+                    yield f"Binary files a/{old_path} and b/{path} differ"
+                continue
+            
+            yield "--- /dev/null" if status == 'added' else f"--- a/{old_path}"
+            yield "+++ /dev/null" if status == 'removed' else f"+++ b/{path}"
+            yield from patch.split('\n')
+    
+    @staticmethod
+    def build_pr_info(repo_full_name: str, pr: Dict) -> Dict:
+        """
+        GitHub PR 객체에서 리뷰 파이프라인용 PR 정보 추출
+        
+        Args:
+            repo_full_name: 저장소 전체 이름
+            pr: GitHub PR 객체
+            
+        Returns:
+            Dict: PR 정보 딕셔너리
+        """
+        return {
+            'number': pr['number'],
+            'title': pr['title'],
+            'author': pr['user']['login'],
+            'base_branch': pr['base']['ref'],
+            'head_branch': pr['head']['ref'],
+            'description': pr.get('body', ''),
+            'url': pr['html_url'],
+            'repo': repo_full_name,
+            'head_sha': pr['head']['sha'],
+            'draft': pr.get('draft', False),
+            'author_type': pr['user'].get('type', 'User')
+        }
     
     def post_pr_comment(self, repo_full_name: str, pr_number: int, comment: str) -> bool:
         """
@@ -99,37 +380,14 @@ class GitHubService:
         url = f"{self.api_url}/repos/{repo_full_name}/issues/{pr_number}/comments"
         
         try:
-            response = requests.post(
+            response = self._send(
+                'POST',
                 url,
-                headers=self.headers,
-                json={'body': comment},
-                timeout=30
+                self.headers,
+                json={'body': comment}
             )
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
             print(f"❌ PR 코멘트 작성 실패: {e}")
             return False
-    
-    def format_diff_for_analysis(self, diff_text: str, max_lines: int = 500) -> str:
-        """
-        diff 텍스트를 분석용으로 포맷팅
-        
-        Args:
-            diff_text: 원본 diff 텍스트
-            max_lines: 최대 라인 수 (토큰 제한 고려)
-            
-        Returns:
-            str: 포맷팅된 diff
-        """
-        if not diff_text:
-            return ""
-        
-        lines = diff_text.split('\n')
-        
-        # 너무 긴 경우 잘라내기
-        if len(lines) > max_lines:
-            lines = lines[:max_lines]
-            lines.append(f"\n... (총 {len(diff_text.split(chr(10)))}줄 중 {max_lines}줄만 표시)")
-        
-        return '\n'.join(lines)
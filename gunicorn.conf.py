@@ -0,0 +1,45 @@
+"""
+Gunicorn 설정 (HTTP 수신 계층)
+
+    gunicorn -c gunicorn.conf.py app:app
+
+PROCESS_ROLE=web이면 webhook 수신과 큐 추가만 하고 리뷰는 worker.py 프로세스가 처리합니다.
+PROCESS_ROLE=all(기본값)이면 HTTP 워커 프로세스마다 큐 워커도 함께 실행합니다 (단일 컨테이너 배포).
+"""
+import sys
+
+from utils.config import Config
+
+bind = f"{Config.HOST}:{Config.PORT}"
+workers = Config.WEB_WORKERS
+worker_class = 'gthread'
+threads = Config.WEB_THREADS
+timeout = Config.WEB_TIMEOUT
+keepalive = 5
+
+# SIGTERM 후 진행 중인 요청과 (PROCESS_ROLE=all이면) 큐 작업을 마무리할 시간
+graceful_timeout = Config.SHUTDOWN_GRACE_SECONDS
+
+# 서비스(HTTP 세션, SQLite 연결, 큐 워커 스레드)는 fork 이후 워커 프로세스에서 만들어야 하므로
+# 마스터에서 앱을 미리 import하지 않음
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server):
+    """필수 환경변수가 없으면 워커를 띄우기 전에 중단"""
+    Config.validate()
+    server.log.info(
+        f"🚀 PR Review Agent HTTP 수신 시작 (role: {Config.PROCESS_ROLE}, "
+        f"workers: {workers} x {threads} threads)"
+    )
+
+
+def worker_exit(server, worker):
+    """HTTP 워커 종료 시 같은 프로세스에서 돌던 큐 워커를 정리 (남은 작업은 큐에 반납)"""
+    agent = sys.modules.get('app')
+    if agent is not None:
+        # 진행 중인 요청을 마무리하는 데도 graceful_timeout이 쓰이므로 절반만 사용
+        agent.shutdown(Config.SHUTDOWN_GRACE_SECONDS / 2)
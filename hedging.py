@@ -0,0 +1,135 @@
+"""
+LLM 요청 헤징(hedging) 정책 모듈
+
+첫 요청이 같은 종류(모델 라우트) 요청의 최근 지연 시간 p90 안에 응답하지 않으면
+같은 요청을 하나 더 보내고 먼저 끝난 쪽을 사용합니다. 헤지는 동시 개수와 전체 요청 대비 비율로 제한하여
+부하가 높을 때 호출량이 두 배로 늘어나지 않도록 합니다.
+"""
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+class HedgePolicy:
+    """
+    최근 지연 시간 분포와 헤지 예산 관리
+
+    지연 시간은 키(모델 라우트 이름)별로 따로 모읍니다. 큰 청크/큰 모델 요청은 원래 느리므로
+    작은 요청과 섞은 p90을 쓰면 거의 매번 헤지하게 됩니다.
+
+    예산은 토큰 버킷 방식입니다. 일반 요청 하나마다 max_ratio만큼 적립되고
+    헤지 하나에 1을 쓰므로 장기적으로 헤지 수는 요청 수의 max_ratio 배를 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.9,
+        window: int = 200,
+        min_samples: int = 20,
+        max_ratio: float = 0.1,
+        max_inflight: int = 2
+    ):
+        """
+        Args:
+            quantile: 헤지를 시작할 지연 시간 분위수
+            window: 분위수 계산에 쓸 키별 최근 지연 시간 개수
+            min_samples: 키별로 헤지를 시작하기 위한 최소 표본 수
+            max_ratio: 요청 대비 헤지 비율 상한
+            max_inflight: 동시에 진행할 수 있는 헤지 요청 수
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.max_ratio = max_ratio
+        self.max_inflight = max_inflight
+        self.window = window
+
+        self._latencies: Dict[str, deque] = {}
+        self._credit = 1.0
+        self._max_credit = max(1.0, max_ratio * window)
+        self._inflight = 0
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.rejected = 0
+
+    def record(self, latency: float, key: str = ''):
+        """
+        완료된 요청의 지연 시간 기록
+
+        Args:
+            latency: 지연 시간(초)
+            key: 요청 종류 (모델 라우트 이름)
+        """
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def hedge_delay(self, key: str = '') -> Optional[float]:
+        """
+        새 요청의 헤지 대기 시간 (요청 수 집계 포함)
+
+        Args:
+            key: 요청 종류 (모델 라우트 이름)
+
+        Returns:
+            float: 이 시간 안에 응답이 없으면 헤지 (같은 종류의 표본이 부족하면 None)
+        """
+        with self._lock:
+            self.requests += 1
+            self._credit = min(self._credit + self.max_ratio, self._max_credit)
+            samples = self._latencies.get(key) or ()
+            if len(samples) < self.min_samples:
+                return None
+            return self._quantile(samples)
+
+    def _quantile(self, samples) -> float:
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
+
+    def try_acquire(self) -> bool:
+        """
+        헤지 예산 확보
+
+        Returns:
+            bool: 헤지를 보내도 되는지 여부 (True면 요청이 끝난 뒤 release() 필요)
+        """
+        with self._lock:
+            if self._inflight >= self.max_inflight or self._credit < 1:
+                self.rejected += 1
+                return False
+            self._credit -= 1
+            self._inflight += 1
+            self.hedges += 1
+            return True
+
+    def reject(self):
+        """헤지 예산은 있지만 다른 이유(스케줄러 슬롯 부족 등)로 헤지를 보내지 않음"""
+        with self._lock:
+            self.rejected += 1
+
+    def release(self):
+        """헤지 요청 종료"""
+        with self._lock:
+            self._inflight -= 1
+
+    def won(self):
+        """헤지 요청이 먼저 응답함"""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'rejected': self.rejected,
+                'inflight': self._inflight,
+                'hedge_delay': {
+                    key: round(self._quantile(samples), 3) for key, samples in self._latencies.items() if samples
+                }
+            }
@@ -0,0 +1,131 @@
+"""
+공유 HTTP 세션 모듈 (커넥션 풀 + keep-alive + 재시도)
+"""
+import os
+import random
+import threading
+from functools import partial
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.config import Config
+from utils.metrics import observe_http
+
+# 재시도 대상 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# 응답 코드로 재시도해도 되는 메서드
+IDEMPOTENT_METHODS = frozenset(Retry.DEFAULT_ALLOWED_METHODS)
+
+_sessions: Dict[str, Tuple[int, requests.Session]] = {}
+_lock = threading.Lock()
+
+
+class JitterRetry(Retry):
+    """지수 backoff에 무작위 jitter를 더하는 Retry (동시 재시도 몰림 방지)"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return backoff + random.uniform(0, self.backoff_factor)
+
+
+def create_session(
+    pool_size: int = None,
+    max_retries: int = None,
+    backoff_factor: float = None
+) -> requests.Session:
+    """
+    커넥션 풀과 재시도가 설정된 세션 생성
+
+    Args:
+        pool_size: 호스트당 최대 연결 수 (기본값: Config.HTTP_POOL_MAXSIZE)
+        max_retries: 연결 실패 및 (멱등 요청의) 5xx/429 응답 시 재시도 횟수 (기본값: Config.HTTP_MAX_RETRIES)
+        backoff_factor: 지수 backoff 기본 간격(초) (기본값: Config.HTTP_RETRY_BACKOFF)
+
+    Returns:
+        requests.Session: 설정된 세션
+    """
+    pool_size = pool_size or Config.HTTP_POOL_MAXSIZE
+    max_retries = max_retries if max_retries is not None else Config.HTTP_MAX_RETRIES
+    backoff_factor = backoff_factor if backoff_factor is not None else Config.HTTP_RETRY_BACKOFF
+
+    retry = JitterRetry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,  # 읽기 타임아웃은 재시도하지 않음 (LLM 요청이 중복 실행되는 것 방지)
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        # POST(LLM 분석, Slack 전송)는 중복 과금/중복 메시지가 생길 수 있으므로 응답 코드로 재시도하지 않음
+        # (연결 실패는 요청이 전달되지 않았으므로 메서드와 관계없이 재시도, POST 재시도는 outbox/스케줄러가 담당)
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _record_response(service: str, response: requests.Response, *args, **kwargs) -> requests.Response:
+    """응답 훅: 지연 시간/본문 크기/재시도 횟수 기록"""
+    body = response.request.body
+    request_bytes = len(body) if isinstance(body, (bytes, str)) else None
+
+    if kwargs.get('stream'):
+        # 스트리밍 응답은 본문을 읽지 않고 Content-Length만 사용
+        length = response.headers.get('Content-Length')
+        response_bytes = int(length) if length and length.isdigit() else None
+    else:
+        response_bytes = len(response.content)
+
+    retry = getattr(response.raw, 'retries', None)
+    observe_http(
+        service,
+        response.request.method,
+        response.status_code,
+        response.elapsed.total_seconds(),
+        request_bytes,
+        response_bytes,
+        len(retry.history) if retry is not None else 0
+    )
+    return response
+
+
+def get_session(name: str, **options) -> requests.Session:
+    """
+    이름별 공유 세션 반환 (프로세스마다 별도 생성)
+
+    fork 이후 부모 프로세스의 소켓을 공유하지 않도록 PID가 바뀌면 새로 만듭니다.
+
+    Args:
+        name: 세션 이름 (예: 'github', 'upstage', 'slack')
+        **options: 세션을 처음 만들 때 create_session()에 전달할 옵션
+
+    Returns:
+        requests.Session: 공유 세션
+    """
+    pid = os.getpid()
+    entry = _sessions.get(name)
+    if entry is not None and entry[0] == pid:
+        return entry[1]
+
+    with _lock:
+        entry = _sessions.get(name)
+        if entry is None or entry[0] != pid:
+            session = create_session(**options)
+            session.hooks['response'].append(partial(_record_response, name))
+            entry = (pid, session)
+            _sessions[name] = entry
+        return entry[1]
@@ -0,0 +1,656 @@
+"""
+SQLite 기반 영속 작업 큐 모듈
+"""
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from utils.config import Config
+from utils.metrics import QUEUE_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class RetryLater(Exception):
+    """
+    작업을 실패로 세지 않고 지정한 시간 뒤로 미룰 때 핸들러가 발생시키는 예외
+    (예: 외부 API 호출 한도 소진)
+    """
+
+    def __init__(self, delay: float, reason: str = ''):
+        super().__init__(reason or f"retry after {delay:.0f}s")
+        self.delay = delay
+
+
+class JobQueue:
+    """
+    SQLite 파일에 저장되는 작업 큐
+
+    여러 스레드/프로세스가 같은 DB 파일을 공유해도 작업은 한 번에
+    하나의 워커에게만 할당됩니다. 워커가 죽으면 lease가 만료된 작업을
+    다시 대기 상태로 돌려 복구합니다.
+
+    coalesce_key가 같은 작업은 대기 중인 작업 하나로 합쳐지며(debounce),
+    실행 중인 작업은 is_superseded()로 더 새로운 작업이 들어왔는지 확인할 수 있습니다.
+
+    claim()은 도착 순서가 아니라 우선순위(작을수록 먼저, priority_aging초를 기다릴 때마다 한 단계씩 올라감),
+    같은 우선순위 안에서는 실행 중인 작업이 적은 tenant(저장소), 그다음 실행 예정 시각 순으로 작업을 고릅니다.
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    DEAD = 'dead'
+
+    def __init__(
+        self,
+        db_path: str = None,
+        visibility_timeout: int = None,
+        max_attempts: int = None,
+        retry_backoff: float = None,
+        priority_aging: float = None
+    ):
+        self.db_path = db_path or Config.QUEUE_DB_PATH
+        self.visibility_timeout = visibility_timeout or Config.QUEUE_VISIBILITY_TIMEOUT
+        self.max_attempts = max_attempts or Config.QUEUE_MAX_ATTEMPTS
+        self.retry_backoff = retry_backoff if retry_backoff is not None else Config.QUEUE_RETRY_BACKOFF
+        self.priority_aging = priority_aging if priority_aging is not None else Config.LLM_PRIORITY_AGING
+        self._local = threading.local()
+        self._maintenance_lock = threading.Lock()
+        self._last_maintenance = 0.0
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                job_type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                run_after REAL NOT NULL,
+                lease_until REAL,
+                worker_id TEXT,
+                last_error TEXT,
+                coalesce_key TEXT,
+                priority INTEGER NOT NULL DEFAULT 1,
+                tenant TEXT NOT NULL DEFAULT '',
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        # 이전 버전 DB 마이그레이션
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+        if 'coalesce_key' not in columns:
+            conn.execute('ALTER TABLE jobs ADD COLUMN coalesce_key TEXT')
+        if 'priority' not in columns:
+            conn.execute('ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 1')
+        if 'tenant' not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN tenant TEXT NOT NULL DEFAULT ''")
+
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON jobs (status, run_after)'
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_jobs_coalesce_key ON jobs (coalesce_key, status)'
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_jobs_tenant_status ON jobs (tenant, status)'
+        )
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: Dict,
+        max_attempts: int = None,
+        coalesce_key: str = None,
+        delay: float = 0,
+        priority: int = 1,
+        tenant: str = ''
+    ) -> str:
+        """
+        작업 추가
+
+        Args:
+            job_type: 작업 종류 (예: 'pr_review')
+            payload: JSON 직렬화 가능한 작업 데이터
+            max_attempts: 최대 시도 횟수 (기본값: Config.QUEUE_MAX_ATTEMPTS)
+            coalesce_key: 같은 키의 대기 중 작업이 있으면 새 payload로 교체
+            delay: 실행까지 대기 시간(초), 교체 시 대기 시간도 다시 시작
+            priority: 우선순위 (작을수록 먼저, llm_scheduler.pr_priority())
+            tenant: 공정 분배 단위 (저장소 이름, 비어 있으면 공정 분배에서 제외)
+
+        Returns:
+            str: 작업 ID (교체된 경우 기존 작업 ID)
+        """
+        conn = self._connect()
+        now = time.time()
+        payload_json = json.dumps(payload, ensure_ascii=False)
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if coalesce_key:
+                row = conn.execute(
+                    'SELECT id FROM jobs WHERE coalesce_key = ? AND status = ? LIMIT 1',
+                    (coalesce_key, self.PENDING)
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        """
+                        UPDATE jobs SET payload = ?, run_after = ?, attempts = 0,
+                                        priority = ?, tenant = ?, updated_at = ?
+                        WHERE id = ?
+                        """,
+                        (payload_json, now + delay, priority, tenant, now, row['id'])
+                    )
+                    conn.execute('COMMIT')
+                    return row['id']
+
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                """
+                INSERT INTO jobs (id, job_type, payload, status, attempts, max_attempts,
+                                  run_after, coalesce_key, priority, tenant, created_at, updated_at)
+                VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, job_type, payload_json, self.PENDING,
+                 max_attempts or self.max_attempts, now + delay, coalesce_key, priority, tenant, now, now)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        return job_id
+
+    def is_superseded(self, job: Dict) -> bool:
+        """
+        같은 coalesce_key로 더 나중에 들어온 작업이 있는지 확인
+
+        Args:
+            job: claim()으로 받은 작업 정보
+
+        Returns:
+            bool: 더 새로운 작업이 대기/실행 중이면 True
+        """
+        if not job.get('coalesce_key'):
+            return False
+
+        row = self._connect().execute(
+            """
+            SELECT 1 FROM jobs
+            WHERE coalesce_key = ? AND id != ? AND status IN (?, ?) AND created_at > ?
+            LIMIT 1
+            """,
+            (job['coalesce_key'], job['id'], self.PENDING, self.RUNNING, job['created_at'])
+        ).fetchone()
+        return row is not None
+
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """
+        실행 가능한 작업 하나를 가져와 lease 설정
+
+        (기다린 시간만큼 올린) 우선순위, tenant별 실행 중인 작업 수, 실행 예정 시각 순으로 고릅니다.
+        실행 중인 작업 수는 DB에서 세므로 여러 프로세스의 워커가 함께 가져가도 한 저장소가 독차지하지 않습니다.
+
+        Args:
+            worker_id: 작업을 가져가는 워커 식별자
+
+        Returns:
+            Dict: 작업 정보 (없으면 None)
+        """
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                """
+                SELECT * FROM jobs AS j
+                WHERE j.status = ? AND j.run_after <= ?
+                ORDER BY
+                    CASE WHEN ? > 0
+                        THEN MAX(j.priority - CAST((? - j.run_after) / ? AS INTEGER), 0)
+                        ELSE j.priority END,
+                    CASE WHEN j.tenant = '' THEN 0 ELSE (
+                        SELECT COUNT(*) FROM jobs AS r WHERE r.tenant = j.tenant AND r.status = ?
+                    ) END,
+                    j.run_after
+                LIMIT 1
+                """,
+                (self.PENDING, now, self.priority_aging, now, self.priority_aging or 1, self.RUNNING)
+            ).fetchone()
+            if row is None:
+                conn.execute('COMMIT')
+                return None
+
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = ?, attempts = attempts + 1, lease_until = ?,
+                    worker_id = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (self.RUNNING, now + self.visibility_timeout, worker_id, now, row['id'])
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['attempts'] += 1
+        job['status'] = self.RUNNING
+        job['worker_id'] = worker_id
+        QUEUE_WAIT_SECONDS.observe(max(now - job['run_after'], 0.0), job_type=job['job_type'])
+        return job
+
+    def claim_batch(self, worker_id: str, job_type: str, limit: int) -> List[Dict]:
+        """
+        특정 종류의 대기 중 작업을 실행 예정 시각과 관계없이 한꺼번에 가져옴
+        (예: 다이제스트 묶음 전송)
+
+        Args:
+            worker_id: 작업을 가져가는 워커 식별자
+            job_type: 작업 종류
+            limit: 최대 개수
+
+        Returns:
+            List[Dict]: 작업 정보 목록
+        """
+        if limit <= 0:
+            return []
+
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = conn.execute(
+                """
+                SELECT * FROM jobs
+                WHERE status = ? AND job_type = ?
+                ORDER BY created_at
+                LIMIT ?
+                """,
+                (self.PENDING, job_type, limit)
+            ).fetchall()
+            conn.executemany(
+                """
+                UPDATE jobs
+                SET status = ?, attempts = attempts + 1, lease_until = ?,
+                    worker_id = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                [(self.RUNNING, now + self.visibility_timeout, worker_id, now, row['id']) for row in rows]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            job['payload'] = json.loads(job['payload'])
+            job['attempts'] += 1
+            job['status'] = self.RUNNING
+            job['worker_id'] = worker_id
+            jobs.append(job)
+        return jobs
+
+    def _finish(self, job: Dict, assignments: str, params: tuple, action: str) -> bool:
+        """
+        claim()한 워커가 아직 작업을 잡고 있을 때만 작업 상태 변경
+
+        lease가 만료되어 다른 워커가 다시 가져갔거나 release()로 반납된 작업을
+        원래 워커가 뒤늦게 완료/실패 처리하면 새 실행 결과를 덮어쓰므로 무시합니다.
+
+        Args:
+            job: claim()으로 받은 작업 정보
+            assignments: UPDATE SET 절
+            params: SET 절 파라미터
+            action: 로그에 남길 처리 이름
+
+        Returns:
+            bool: 상태를 변경했으면 True
+        """
+        cursor = self._connect().execute(
+            f'UPDATE jobs SET {assignments} WHERE id = ? AND worker_id = ? AND status = ?',
+            (*params, job['id'], job['worker_id'], self.RUNNING)
+        )
+        if cursor.rowcount == 0:
+            logger.warning(f"⚠️ 이미 다른 워커에게 넘어간 작업이라 {action} 처리 생략 ({job['id']})")
+            return False
+        return True
+
+    def complete(self, job: Dict) -> bool:
+        """
+        작업 완료 처리
+
+        Args:
+            job: claim()으로 받은 작업 정보
+
+        Returns:
+            bool: 완료 처리되었으면 True (다른 워커에게 넘어간 작업이면 False)
+        """
+        return self._finish(
+            job, 'status = ?, lease_until = NULL, updated_at = ?', (self.DONE, time.time()), '완료'
+        )
+
+    def fail(self, job: Dict, error: str) -> bool:
+        """
+        작업 실패 처리 (재시도 가능하면 backoff 후 다시 대기 상태로)
+
+        Args:
+            job: claim()으로 받은 작업 정보
+            error: 오류 메시지
+
+        Returns:
+            bool: 재시도 예약 여부 (False면 더 이상 재시도하지 않거나 다른 워커에게 넘어간 작업)
+        """
+        now = time.time()
+        if job['attempts'] >= job['max_attempts']:
+            if self._finish(
+                job, 'status = ?, lease_until = NULL, last_error = ?, updated_at = ?',
+                (self.DEAD, error, now), '실패'
+            ):
+                logger.error(f"❌ 작업 최종 실패 ({job['id']}): {error}")
+            return False
+
+        # 지수 backoff + jitter
+        delay = self.retry_backoff * (2 ** (job['attempts'] - 1))
+        delay += random.uniform(0, self.retry_backoff)
+        if not self._finish(
+            job, 'status = ?, run_after = ?, lease_until = NULL, last_error = ?, updated_at = ?',
+            (self.PENDING, now + delay, error, now), '재시도 예약'
+        ):
+            return False
+        logger.warning(
+            f"🔁 작업 재시도 예약 ({job['id']}, {job['attempts']}/{job['max_attempts']})"
+        )
+        return True
+
+    def settle(self, job: Dict, success: bool, error: str = None):
+        """
+        핸들러 실행 결과에 따라 완료 또는 실패(재시도) 처리
+        (lease가 만료되어 다른 워커가 가져간 작업이면 아무것도 바꾸지 않음)
+
+        Args:
+            job: claim()으로 받은 작업 정보
+            success: 처리 성공 여부
+            error: 실패 시 오류 메시지
+        """
+        if success:
+            self.complete(job)
+            return
+
+        if self.is_superseded(job):
+            # 더 새로운 작업이 있으므로 재시도하지 않음
+            if self.complete(job):
+                logger.info(f"⏭️ 새 작업으로 대체되어 재시도 생략 ({job['id']})")
+            return
+
+        self.fail(job, error or 'handler returned failure')
+
+    def defer(self, job: Dict, delay: float, reason: str = ''):
+        """
+        작업을 시도 횟수 차감 없이 delay초 뒤로 연기
+
+        Args:
+            job: claim()으로 받은 작업 정보
+            delay: 연기할 시간(초)
+            reason: 연기 사유
+        """
+        now = time.time()
+        if self._finish(
+            job,
+            'status = ?, run_after = ?, attempts = attempts - 1, lease_until = NULL, last_error = ?, updated_at = ?',
+            (self.PENDING, now + delay, reason, now), '연기'
+        ):
+            logger.info(f"⏸️ 작업 연기 ({job['id']}, {delay:.0f}초): {reason}")
+
+    def release(self, worker_ids: List[str]) -> int:
+        """
+        종료하는 워커가 잡고 있던 작업을 바로 대기 상태로 되돌림
+        (lease 만료를 기다리지 않고 다른 프로세스가 이어서 처리, 시도 횟수는 차감하지 않음)
+
+        Args:
+            worker_ids: 작업을 반납할 워커 식별자 목록
+
+        Returns:
+            int: 반납된 작업 수
+        """
+        if not worker_ids:
+            return 0
+        now = time.time()
+        placeholders = ','.join('?' * len(worker_ids))
+        cursor = self._connect().execute(
+            f"""
+            UPDATE jobs SET status = ?, attempts = attempts - 1, lease_until = NULL, updated_at = ?
+            WHERE status = ? AND worker_id IN ({placeholders})
+            """,
+            (self.PENDING, now, self.RUNNING, *worker_ids)
+        )
+        return cursor.rowcount
+
+    def recover_expired(self) -> int:
+        """
+        lease가 만료된 실행 중 작업을 대기 상태로 복구 (워커 크래시 대응)
+
+        이미 최대 시도 횟수만큼 가져간 작업은 다시 대기시키지 않고 dead로 옮깁니다
+        (워커를 죽이는 작업이 끝없이 재시도되지 않도록).
+
+        Returns:
+            int: 대기 상태로 복구된 작업 수
+        """
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            dead = conn.execute(
+                """
+                UPDATE jobs SET status = ?, lease_until = NULL, last_error = ?, updated_at = ?
+                WHERE status = ? AND lease_until < ? AND attempts >= max_attempts
+                """,
+                (self.DEAD, 'lease expired (worker crashed or timed out)', now, self.RUNNING, now)
+            ).rowcount
+            recovered = conn.execute(
+                """
+                UPDATE jobs SET status = ?, lease_until = NULL, updated_at = ?
+                WHERE status = ? AND lease_until < ?
+                """,
+                (self.PENDING, now, self.RUNNING, now)
+            ).rowcount
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        if dead:
+            logger.error(f"❌ 최대 시도 횟수를 넘긴 만료 작업 {dead}개를 실패 처리")
+        return recovered
+
+    def purge_finished(self, older_than: float = None) -> int:
+        """
+        오래된 완료/실패 작업 삭제
+
+        Args:
+            older_than: 마지막 갱신 후 보관 시간(초) (기본값: Config.QUEUE_RETENTION_SECONDS)
+
+        Returns:
+            int: 삭제된 작업 수
+        """
+        if older_than is None:
+            older_than = Config.QUEUE_RETENTION_SECONDS
+        cursor = self._connect().execute(
+            'DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?',
+            (self.DONE, self.DEAD, time.time() - older_than)
+        )
+        return cursor.rowcount
+
+    def maintenance_due(self) -> bool:
+        """maintain()을 실행할 때가 되었는지 (DB 접근 없이 확인)"""
+        return time.time() - self._last_maintenance >= Config.QUEUE_MAINTENANCE_INTERVAL
+
+    def maintain(self):
+        """
+        만료된 lease 복구와 오래된 작업 삭제 (워커 루프에서 반복 호출)
+
+        Config.QUEUE_MAINTENANCE_INTERVAL마다 한 번만 실제로 실행되며,
+        여러 워커 스레드가 동시에 호출해도 한 스레드만 실행합니다.
+        """
+        if not self.maintenance_due() or not self._maintenance_lock.acquire(blocking=False):
+            return
+        try:
+            if not self.maintenance_due():
+                return
+            self._last_maintenance = time.time()
+            recovered = self.recover_expired()
+            if recovered:
+                logger.info(f"♻️ 만료된 작업 {recovered}개 복구")
+            purged = self.purge_finished()
+            if purged:
+                logger.info(f"🧹 오래된 완료/실패 작업 {purged}개 삭제")
+        except sqlite3.Error as e:
+            logger.error(f"❌ 작업 큐 정리 실패: {e}")
+        finally:
+            self._maintenance_lock.release()
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = self._connect().execute(
+            'SELECT status, COUNT(*) AS cnt FROM jobs GROUP BY status'
+        ).fetchall()
+        counts = {self.PENDING: 0, self.RUNNING: 0, self.DONE: 0, self.DEAD: 0}
+        counts.update({row['status']: row['cnt'] for row in rows})
+        return counts
+
+
+class WorkerPool:
+    """
+    JobQueue를 소비하는 워커 스레드 풀
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: Callable[[Dict], bool],
+        concurrency: int = None,
+        poll_interval: float = None
+    ):
+        """
+        Args:
+            queue: 작업 큐
+            handler: 작업 처리 함수 (성공 시 True, 재시도가 필요하면 False 반환 또는 예외)
+            concurrency: 워커 스레드 수 (기본값: Config.QUEUE_WORKERS)
+            poll_interval: 큐가 비었을 때 대기 시간(초)
+        """
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency or Config.QUEUE_WORKERS
+        self.poll_interval = poll_interval or Config.QUEUE_POLL_INTERVAL
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._prefix = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self._threads:
+            return
+
+        self.queue.maintain()
+
+        self._stop_event.clear()
+        for i in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._run,
+                args=(f"{self._prefix}-{i}",),
+                name=f"review-worker-{i}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"👷 워커 {self.concurrency}개 시작")
+
+    def notify(self):
+        """새 작업이 추가되었음을 알려 대기 중인 워커를 깨움"""
+        self._wakeup.set()
+
+    def stop(self, timeout: float = None):
+        """
+        워커 중지 (진행 중인 작업은 끝날 때까지 대기)
+
+        Args:
+            timeout: 전체 최대 대기 시간(초), 넘기면 진행 중인 작업을 큐에 반납
+        """
+        self._stop_event.set()
+        self._wakeup.set()
+        deadline = time.time() + timeout if timeout is not None else None
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.time()) if deadline is not None else None)
+
+        # 시간 안에 끝나지 않은 작업은 다른 프로세스가 바로 가져가도록 반납
+        unfinished = [
+            f"{self._prefix}-{i}" for i, thread in enumerate(self._threads) if thread.is_alive()
+        ]
+        released = self.queue.release(unfinished)
+        if released:
+            logger.warning(f"↩️ 종료 시간 초과로 작업 {released}개 반납")
+        self._threads = []
+
+    def _run(self, worker_id: str):
+        while not self._stop_event.is_set():
+            # 주기적으로 다른 프로세스에서 죽은 작업 복구, 오래된 작업 삭제
+            self.queue.maintain()
+
+            try:
+                job = self.queue.claim(worker_id)
+            except sqlite3.Error as e:
+                logger.error(f"❌ 작업 가져오기 실패: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._execute(job)
+
+    def _execute(self, job: Dict):
+        try:
+            success = self.handler(job)
+            error = None if success else 'handler returned failure'
+        except RetryLater as e:
+            self.queue.defer(job, e.delay, str(e))
+            return
+        except Exception as e:
+            logger.error(f"❌ 작업 처리 중 오류 ({job['id']}): {e}", exc_info=True)
+            success = False
+            error = str(e)
+
+        self.queue.settle(job, success, error)
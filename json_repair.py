@@ -0,0 +1,240 @@
+"""
+LLM 응답용 관대한 JSON 파서 모듈
+
+모델이 생성한 JSON에서 자주 나오는 문법 오류(코드 펜스, 앞뒤 설명 문장, 끝 쉼표,
+문자열 안의 개행/탭, max_tokens에서 끊긴 배열/객체)를 로컬에서 고쳐 파싱합니다.
+그래도 파싱되지 않으면 최상위 필드 단위로 나눠 깨진 필드만 따로 다룰 수 있게 합니다.
+"""
+import json
+from typing import Any, List, Optional, Tuple
+
+# 문자열 안에 그대로 들어온 제어 문자 → 이스케이프 표기
+_CONTROL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+_CLOSERS = {'{': '}', '[': ']'}
+
+
+def strip_code_fence(text: str) -> str:
+    """
+    ```json ... ``` 코드 펜스 제거
+
+    Args:
+        text: 모델이 생성한 텍스트
+
+    Returns:
+        str: 펜스를 뗀 텍스트
+    """
+    text = (text or '').strip()
+    if text.startswith('```json'):
+        text = text[7:]
+    if text.startswith('```'):
+        text = text[3:]
+    if text.endswith('```'):
+        text = text[:-3]
+    return text.strip()
+
+
+def _drop_trailing_comma(out: List[str]) -> bool:
+    # 닫는 괄호 직전의 공백과 쉼표 하나 제거
+    i = len(out)
+    while i and out[i - 1].isspace():
+        i -= 1
+    if i and out[i - 1] == ',':
+        del out[i - 1:]
+        return True
+    return False
+
+
+def _parses(text: str) -> bool:
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+def repair_json(text: str) -> Tuple[str, List[str]]:
+    """
+    흔한 문법 오류를 고친 JSON 텍스트 생성
+
+    첫 '{'(없으면 '[') 이전과 최상위 값이 닫힌 뒤의 텍스트는 버립니다.
+    응답이 중간에 끊겼으면 열린 문자열/괄호를 닫아 보고, 안 되면 마지막으로 완성된
+    값 뒤에서 잘라 닫습니다 (끊긴 배열 항목 하나는 버려짐).
+
+    Args:
+        text: 모델이 생성한 텍스트 (코드 펜스 제거 후)
+
+    Returns:
+        Tuple[str, List[str]]: (고친 텍스트, 적용한 수정 종류
+            'trailing_comma' | 'control_char' | 'bracket' | 'truncated')
+    """
+    # 설명 문장 안의 '[' 보다 객체 시작을 우선
+    start = text.find('{')
+    if start < 0:
+        start = text.find('[')
+    if start < 0:
+        return text, []
+
+    fixes: List[str] = []
+
+    def fixed(kind: str):
+        if kind not in fixes:
+            fixes.append(kind)
+
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    # 끊긴 응답을 잘라낼 위치 (완성된 값 바로 뒤): (out 길이, 그때 닫아야 할 괄호)
+    cut: Tuple[int, List[str]] = (0, [])
+
+    for ch in text[start:]:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            elif ch in _CONTROL_ESCAPES:
+                out.append(_CONTROL_ESCAPES[ch])
+                fixed('control_char')
+                continue
+            out.append(ch)
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+            out.append(ch)
+            cut = (len(out), list(stack))
+            continue
+        elif ch in '}]':
+            if not stack:
+                break
+            if ch not in stack:
+                # 열린 적 없는 닫는 괄호는 버림
+                fixed('bracket')
+                continue
+            if _drop_trailing_comma(out):
+                fixed('trailing_comma')
+            # 안쪽 괄호가 닫히지 않은 채 바깥 괄호가 닫히면 빠진 괄호를 채움 (예: [1, 2} → [1, 2]})
+            while stack[-1] != ch:
+                out.append(stack.pop())
+                fixed('bracket')
+            out.append(stack.pop())
+            if not stack:
+                return ''.join(out), fixes
+            cut = (len(out), list(stack))
+            continue
+        elif ch == ',':
+            cut = (len(out), list(stack))
+        out.append(ch)
+
+    if not stack:
+        return ''.join(out), fixes
+
+    fixed('truncated')
+    # 끊긴 문자열 값은 닫아서 살리고 (예: 긴 summary), 안 되면 마지막 완성된 값까지만 사용
+    if not escape:
+        candidate = out + (['"'] if in_string else [])
+        _drop_trailing_comma(candidate)
+        repaired = ''.join(candidate) + ''.join(reversed(stack))
+        if _parses(repaired):
+            return repaired, fixes
+
+    length, closers = cut
+    candidate = out[:length]
+    _drop_trailing_comma(candidate)
+    return ''.join(candidate) + ''.join(reversed(closers)), fixes
+
+
+def loads_tolerant(text: str) -> Tuple[Any, List[str]]:
+    """
+    엄격한 파싱을 먼저 시도하고, 실패하면 repair_json()으로 고쳐서 파싱
+
+    Args:
+        text: 모델이 생성한 텍스트
+
+    Returns:
+        Tuple[Any, List[str]]: (파싱한 값, 적용한 수정 종류 (엄격한 파싱에 성공하면 빈 목록))
+
+    Raises:
+        json.JSONDecodeError: 고쳐도 파싱할 수 없는 경우 (원래 오류 위치)
+    """
+    text = strip_code_fence(text)
+    try:
+        return json.loads(text), []
+    except json.JSONDecodeError as e:
+        error = e
+
+    repaired, fixes = repair_json(text)
+    try:
+        return json.loads(repaired), fixes
+    except json.JSONDecodeError:
+        raise error
+
+
+def split_fields(text: str) -> Optional[List[Tuple[str, str]]]:
+    """
+    최상위 객체를 (키, 값 원문) 목록으로 분리 (값은 파싱하지 않음)
+
+    깨진 필드만 골라 다시 요청할 때 사용합니다. 끊긴 응답의 마지막 필드는 끝까지를 값으로 봅니다.
+
+    Args:
+        text: 모델이 생성한 텍스트
+
+    Returns:
+        List[Tuple[str, str]]: 필드 목록 (최상위 객체가 없거나 키를 읽을 수 없으면 None)
+    """
+    text = strip_code_fence(text)
+    start = text.find('{')
+    if start < 0:
+        return None
+
+    fields: List[Tuple[str, str]] = []
+    depth = 0
+    in_string = False
+    escape = False
+    key: Optional[str] = None
+    key_start = 0
+    value_start: Optional[int] = None
+    end = len(text)
+
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+                if depth == 1 and key is None:
+                    try:
+                        key = json.loads(text[key_start:i + 1], strict=False)
+                    except ValueError:
+                        return None
+            continue
+
+        if ch == '"':
+            in_string = True
+            if depth == 1 and key is None:
+                key_start = i
+        elif ch == ':' and depth == 1 and key is not None and value_start is None:
+            value_start = i + 1
+        elif ch in '{[':
+            depth += 1
+        elif ch in '}]':
+            depth -= 1
+            if depth == 0:
+                end = i
+                break
+        elif ch == ',' and depth == 1 and value_start is not None:
+            fields.append((key, text[value_start:i].strip()))
+            key = None
+            value_start = None
+
+    if key is not None and value_start is not None:
+        fields.append((key, text[value_start:end].strip()))
+    return fields
@@ -0,0 +1,193 @@
+"""
+스트리밍 LLM 응답용 증분 JSON 파서 모듈
+
+모델이 토큰 단위로 생성하는 JSON 객체에서 최상위 필드와 배열 항목을
+완성되는 즉시 꺼내고, 응답이 중간에 끊겨도 완성된 부분은 복구합니다.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class IncrementalJSONParser:
+    """
+    최상위 JSON 객체를 위한 증분 파서
+
+    feed()로 텍스트 조각을 넣으면 완성된 (키, 값) 이벤트를 반환합니다.
+    최상위 값이 배열이면 배열 전체 대신 항목 하나하나가 (키, 항목)으로 반환됩니다.
+    첫 '{' 이전의 텍스트(예: ```json 코드 펜스)와 마지막 '}' 이후는 무시합니다.
+
+    받은 조각은 목록에 모아 두고 새 조각만 훑으며, 완성된 키/값/항목을 꺼낼 때만
+    그 부분의 조각을 합치므로 긴 응답에서도 조각마다 전체 텍스트를 다시 복사하지 않습니다.
+    키를 해석할 수 없으면 failed로 표시하고 더 이상 이벤트를 만들지 않습니다
+    (호출자는 전체 텍스트를 json_repair.loads_tolerant()로 다시 파싱).
+    """
+
+    def __init__(self):
+        self.complete = False
+        self.failed = False
+        self._chunks: List[str] = []
+        self._result: Dict[str, Any] = {}
+        # 아직 완성되지 않은 키/값/항목이 있는 조각 (_base는 첫 조각의 전체 텍스트 기준 위치)
+        self._pending: List[str] = []
+        self._base = 0
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._expect_key = True
+        self._key: Optional[str] = None
+        self._key_start: Optional[int] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트"""
+        if len(self._chunks) > 1:
+            self._chunks = [''.join(self._chunks)]
+        return self._chunks[0] if self._chunks else ''
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        텍스트 조각 추가
+
+        Args:
+            chunk: 새로 받은 텍스트
+
+        Returns:
+            List[Tuple[str, Any]]: 이번 조각으로 완성된 (키, 값 또는 배열 항목) 목록
+        """
+        self._chunks.append(chunk)
+        events: List[Tuple[str, Any]] = []
+        if self.complete or self.failed:
+            return events
+
+        self._pending.append(chunk)
+        offset = self._pos
+        for j, ch in enumerate(chunk):
+            i = offset + j
+
+            if not self._stack:
+                if ch == '{':
+                    self._stack.append(ch)
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        try:
+                            self._key = json.loads(self._slice(self._key_start, i + 1))
+                        except ValueError:
+                            self.failed = True
+                            return events
+                        self._key_start = None
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if len(self._stack) == 1 and self._expect_key:
+                    self._key_start = i
+            elif ch == ':' and len(self._stack) == 1:
+                self._expect_key = False
+                self._value_start = i + 1
+            elif ch == ',':
+                if len(self._stack) == 1:
+                    self._flush_value(i, events)
+                    self._expect_key = True
+                elif len(self._stack) == 2 and self._stack[1] == '[':
+                    self._flush_item(i, events)
+                    self._item_start = i + 1
+            elif ch in '{[':
+                self._stack.append(ch)
+                if len(self._stack) == 2 and ch == '[':
+                    # 배열은 항목 단위로 반환하므로 값 전체는 보관하지 않음
+                    self._result[self._key] = []
+                    self._value_start = None
+                    self._item_start = i + 1
+            elif ch in '}]':
+                if len(self._stack) == 2 and self._stack[1] == '[':
+                    self._flush_item(i, events)
+                    self._item_start = None
+                elif len(self._stack) == 1 and not self._expect_key:
+                    self._flush_value(i, events)
+                self._stack.pop()
+                if not self._stack:
+                    self.complete = True
+                    self._pending = []
+                    self._pos = i + 1
+                    return events
+
+        self._pos = offset + len(chunk)
+        self._trim()
+        return events
+
+    def result(self) -> Dict[str, Any]:
+        """
+        지금까지 완성된 필드와 배열 항목으로 이루어진 객체
+
+        Returns:
+            Dict: 부분(또는 전체) 결과
+        """
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in self._result.items()
+        }
+
+    def _slice(self, start: int, end: int) -> str:
+        # start 이전은 다시 쓰지 않으므로 합칠 때 버림
+        text = ''.join(self._pending)[start - self._base:]
+        self._pending = [text]
+        self._base = start
+        return text[:end - start]
+
+    def _trim(self):
+        # 완성되지 않은 키/값/항목의 시작 이전에 끝나는 조각은 더 이상 필요 없음
+        starts = [pos for pos in (self._key_start, self._value_start, self._item_start) if pos is not None]
+        keep = min(starts) if starts else self._pos
+        while self._pending and self._base + len(self._pending[0]) <= keep:
+            self._base += len(self._pending.pop(0))
+
+    def _flush_value(self, end: int, events: List[Tuple[str, Any]]):
+        if self._key is None or self._value_start is None:
+            # 배열 값은 항목 단위로 이미 반환됨
+            return
+        raw = self._slice(self._value_start, end).strip()
+        self._value_start = None
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+        self._result[self._key] = value
+        events.append((self._key, value))
+
+    def _flush_item(self, end: int, events: List[Tuple[str, Any]]):
+        raw = self._slice(self._item_start, end).strip()
+        if not raw or self._key is None:
+            return
+        try:
+            item = json.loads(raw)
+        except ValueError:
+            # 깨진 항목 하나 때문에 나머지를 버리지 않음
+            return
+        self._result[self._key].append(item)
+        events.append((self._key, item))
+
+
+def sse_data(line: str) -> Optional[str]:
+    """
+    Server-Sent Events 라인에서 data 필드 추출
+
+    Args:
+        line: 응답 라인 (개행 제외)
+
+    Returns:
+        str: data 내용 (data 라인이 아니면 None)
+    """
+    if not line.startswith('data:'):
+        return None
+    return line[5:].strip()
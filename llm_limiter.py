@@ -0,0 +1,308 @@
+"""
+LLM 요청 한도 모듈
+
+LLMScheduler는 대기 중인 요청의 순서(우선순위, 저장소 간 공정 분배)를 정하고,
+요청을 지금 내보내도 되는지(동시 요청 수, 분당 토큰 예산, 429 일시 정지)는 여기서 판단합니다.
+
+- LocalLimiter: 프로세스 메모리 안의 한도
+- SharedLimiter: SQLite 파일에 한도를 두어 같은 파일을 쓰는 모든 프로세스(gunicorn 워커, worker.py)가 나눠 씀
+"""
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Tuple
+
+
+class LocalLimiter:
+    """
+    프로세스 안에서만 유효한 동시 요청 수/분당 토큰 예산
+
+    동시 요청 수 상한은 429를 받으면 절반으로 줄이고 성공할 때마다 조금씩 되돌립니다 (AIMD).
+    """
+
+    # 한도가 비기를 기다리는 요청이 상태를 다시 확인하는 간격(초)
+    poll_interval = 1.0
+    # 호출이 파일 I/O를 하는지 여부 (이벤트 루프에서는 스레드로 넘겨 호출)
+    blocking = False
+
+    def __init__(self, max_concurrency: int = 16, tokens_per_minute: int = 0, rate_limit_pause: float = 5):
+        """
+        Args:
+            max_concurrency: 동시에 진행할 수 있는 요청 수 상한
+            tokens_per_minute: 분당 토큰 예산 (0이면 제한 없음)
+            rate_limit_pause: 429 응답에 Retry-After가 없을 때 새 요청을 멈출 시간(초)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.rate_limit_pause = rate_limit_pause
+
+        self._limit = float(self.max_concurrency)
+        self._inflight = 0
+        self._tokens = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, cost: int) -> Tuple[Optional[object], Optional[float]]:
+        """
+        요청 하나를 위한 한도 확보 (기다리지 않음)
+
+        Args:
+            cost: 예약할 토큰 수 (분당 예산 이하로 맞춘 값)
+
+        Returns:
+            Tuple[Optional[object], Optional[float]]: (lease (확보하지 못하면 None),
+                예산/일시 정지 때문에 실패했다면 다시 시도할 때까지의 시간(초))
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return None, self._paused_until - now
+            self._refill(now)
+            if self._inflight >= int(self._limit):
+                return None, None
+            if cost > self._tokens:
+                return None, (cost - self._tokens) * 60 / self.tokens_per_minute
+
+            self._tokens -= cost
+            self._inflight += 1
+            return True, None
+
+    def release(
+        self,
+        lease: object,
+        charged: int,
+        used_tokens: int = None,
+        throttled: bool = False,
+        retry_after: float = None,
+        completed: bool = True
+    ):
+        """
+        요청 종료
+
+        Args:
+            lease: try_acquire()로 받은 lease
+            charged: 예약했던 토큰 수
+            used_tokens: 실제 사용한 토큰 수 (알면 예약량과의 차이를 정산)
+            throttled: 429 응답을 받았는지 여부 (동시 요청 수를 줄이고 잠시 멈춤)
+            retry_after: 429 응답의 Retry-After(초)
+            completed: 요청을 실제로 보냈는지 여부 (False면 한도만 반납하고 AIMD는 건너뜀)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._inflight -= 1
+            if self.tokens_per_minute and used_tokens is not None:
+                self._refill(now)
+                self._tokens = min(self._tokens + charged - used_tokens, self.tokens_per_minute)
+
+            if throttled:
+                self._limit = max(1.0, self._limit / 2)
+                pause = retry_after if retry_after is not None else self.rate_limit_pause
+                self._paused_until = max(self._paused_until, now + pause)
+            elif completed:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'inflight': self._inflight,
+                'limit': int(self._limit),
+                'tokens_available': int(self._tokens) if self.tokens_per_minute else None,
+                'paused_for': round(max(self._paused_until - now, 0), 1)
+            }
+
+    def _refill(self, now: float):
+        if self.tokens_per_minute:
+            elapsed = now - self._refilled_at
+            self._tokens = min(self._tokens + elapsed * self.tokens_per_minute / 60, self.tokens_per_minute)
+        self._refilled_at = now
+
+
+class SharedLimiter:
+    """
+    SQLite 파일에 저장되는 동시 요청 수/분당 토큰 예산 (LocalLimiter와 같은 인터페이스)
+
+    한도 상태는 한 행(limiter), 진행 중인 요청은 lease 행(leases)으로 두고 모든 변경을
+    BEGIN IMMEDIATE 트랜잭션 안에서 하므로, 프로세스가 몇 개든 합계가 한도를 넘지 않습니다.
+    프로세스가 죽어 반납되지 않은 lease는 lease_ttl이 지나면 사라집니다.
+    다른 프로세스가 반납한 한도는 알림이 오지 않으므로 대기 중인 요청은 poll_interval마다 다시 확인합니다.
+    """
+
+    poll_interval = 0.1
+    blocking = True
+
+    def __init__(
+        self,
+        db_path: str,
+        max_concurrency: int = 16,
+        tokens_per_minute: int = 0,
+        rate_limit_pause: float = 5,
+        lease_ttl: float = 600
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (한도를 나눠 쓸 프로세스는 같은 경로 사용)
+            max_concurrency: 전체 프로세스의 동시 요청 수 상한
+            tokens_per_minute: 전체 프로세스의 분당 토큰 예산 (0이면 제한 없음)
+            rate_limit_pause: 429 응답에 Retry-After가 없을 때 새 요청을 멈출 시간(초)
+            lease_ttl: 반납되지 않은 lease를 버리기까지의 시간(초), 가장 긴 LLM 요청보다 길게
+        """
+        self.db_path = db_path
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.rate_limit_pause = rate_limit_pause
+        self.lease_ttl = lease_ttl
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS limiter (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                concurrency REAL NOT NULL,
+                tokens REAL NOT NULL,
+                refilled_at REAL NOT NULL,
+                paused_until REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS leases (
+                id TEXT PRIMARY KEY,
+                pid INTEGER NOT NULL,
+                tokens INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            'INSERT OR IGNORE INTO limiter (id, concurrency, tokens, refilled_at, paused_until) VALUES (1, ?, ?, ?, 0)',
+            (float(self.max_concurrency), float(self.tokens_per_minute), time.time())
+        )
+
+    def _state(self, conn: sqlite3.Connection, now: float) -> Dict:
+        """만료된 lease를 지우고 토큰을 채운 현재 상태 (트랜잭션 안에서 호출)"""
+        conn.execute('DELETE FROM leases WHERE expires_at < ?', (now,))
+        row = conn.execute('SELECT * FROM limiter WHERE id = 1').fetchone()
+        state = dict(row)
+        # 설정을 낮춰 다시 시작한 경우에도 새 상한을 따름
+        state['concurrency'] = min(state['concurrency'], float(self.max_concurrency))
+        if self.tokens_per_minute:
+            elapsed = max(now - state['refilled_at'], 0)
+            state['tokens'] = min(
+                state['tokens'] + elapsed * self.tokens_per_minute / 60, self.tokens_per_minute
+            )
+        state['refilled_at'] = now
+        state['inflight'] = conn.execute('SELECT COUNT(*) FROM leases').fetchone()[0]
+        return state
+
+    @staticmethod
+    def _save(conn: sqlite3.Connection, state: Dict):
+        conn.execute(
+            'UPDATE limiter SET concurrency = ?, tokens = ?, refilled_at = ?, paused_until = ? WHERE id = 1',
+            (state['concurrency'], state['tokens'], state['refilled_at'], state['paused_until'])
+        )
+
+    def try_acquire(self, cost: int) -> Tuple[Optional[str], Optional[float]]:
+        """
+        요청 하나를 위한 한도 확보 (LocalLimiter.try_acquire() 참고)
+
+        Returns:
+            Tuple[Optional[str], Optional[float]]: (lease ID (확보하지 못하면 None), 다시 시도할 때까지의 시간(초))
+        """
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            state = self._state(conn, now)
+            lease = None
+            retry_in = None
+            if now < state['paused_until']:
+                retry_in = state['paused_until'] - now
+            elif state['inflight'] >= int(state['concurrency']):
+                pass
+            elif cost > state['tokens']:
+                retry_in = (cost - state['tokens']) * 60 / self.tokens_per_minute
+            else:
+                lease = uuid.uuid4().hex
+                state['tokens'] -= cost
+                conn.execute(
+                    'INSERT INTO leases (id, pid, tokens, expires_at) VALUES (?, ?, ?, ?)',
+                    (lease, os.getpid(), cost, now + self.lease_ttl)
+                )
+            self._save(conn, state)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return lease, retry_in
+
+    def release(
+        self,
+        lease: str,
+        charged: int,
+        used_tokens: int = None,
+        throttled: bool = False,
+        retry_after: float = None,
+        completed: bool = True
+    ):
+        """요청 종료 (LocalLimiter.release() 참고)"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM leases WHERE id = ?', (lease,))
+            state = self._state(conn, now)
+            if self.tokens_per_minute and used_tokens is not None:
+                state['tokens'] = min(state['tokens'] + charged - used_tokens, self.tokens_per_minute)
+
+            if throttled:
+                state['concurrency'] = max(1.0, state['concurrency'] / 2)
+                pause = retry_after if retry_after is not None else self.rate_limit_pause
+                state['paused_until'] = max(state['paused_until'], now + pause)
+            elif completed:
+                state['concurrency'] = min(
+                    float(self.max_concurrency), state['concurrency'] + 1 / state['concurrency']
+                )
+            self._save(conn, state)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def stats(self) -> Dict:
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            state = self._state(conn, now)
+            self._save(conn, state)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return {
+            'inflight': state['inflight'],
+            'limit': int(state['concurrency']),
+            'tokens_available': int(state['tokens']) if self.tokens_per_minute else None,
+            'paused_for': round(max(state['paused_until'] - now, 0), 1)
+        }
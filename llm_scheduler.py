@@ -0,0 +1,382 @@
+"""
+LLM 요청 스케줄러 모듈
+
+Upstage API를 호출하기 전에 슬롯을 받게 해서 리뷰가 몰려도 요청이 한꺼번에 나가지 않게 합니다.
+
+- 동시 요청 수 상한: 429를 받으면 절반으로 줄이고 성공할 때마다 조금씩 되돌림 (AIMD)
+- 분당 토큰 예산: 요청 전에 prompt + max_tokens만큼 예약하고 응답 후 실제 사용량으로 정산
+- 우선순위: 보호 브랜치 대상 PR 먼저, draft/봇 PR 나중 (오래 기다린 요청은 한 단계씩 올라감)
+- 저장소 간 공정 분배: 같은 우선순위 안에서는 토큰을 덜 쓴 저장소의 요청 먼저 (start-time fair queuing)
+
+대기열(우선순위/공정 분배)은 프로세스 단위이고, 동시 요청 수와 분당 토큰 예산은
+LLM_SCHEDULER_SHARED=true(기본값)면 SQLite 파일로 모든 프로세스가 나눠 씁니다 (llm_limiter 모듈).
+"""
+import asyncio
+import itertools
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional
+
+from utils.config import Config
+from utils.llm_limiter import LocalLimiter, SharedLimiter
+from utils.metrics import LLM_SCHEDULER_WAIT_SECONDS
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITY_NAMES = ('high', 'normal', 'low')
+
+
+class SchedulerTimeout(Exception):
+    """대기 시간 안에 슬롯을 받지 못한 경우"""
+
+
+def pr_priority(pr_info: Dict, protected_branches: Iterable[str] = None) -> int:
+    """
+    PR 정보로 LLM 요청 우선순위 결정
+
+    draft/봇 PR은 대상 브랜치와 관계없이 낮음, 보호 브랜치가 대상이면 높음
+
+    Args:
+        pr_info: PR 정보 딕셔너리
+        protected_branches: 먼저 처리할 대상 브랜치 (기본값: Config.LLM_PROTECTED_BRANCHES)
+
+    Returns:
+        int: PRIORITY_HIGH | PRIORITY_NORMAL | PRIORITY_LOW
+    """
+    author = pr_info.get('author') or ''
+    if pr_info.get('draft') or pr_info.get('author_type') == 'Bot' or author.endswith('[bot]'):
+        return PRIORITY_LOW
+
+    if protected_branches is None:
+        protected_branches = [b.strip() for b in Config.LLM_PROTECTED_BRANCHES.split(',') if b.strip()]
+    if pr_info.get('base_branch') in set(protected_branches):
+        return PRIORITY_HIGH
+    return PRIORITY_NORMAL
+
+
+class Ticket:
+    """대기 중이거나 실행 중인 요청 하나"""
+
+    __slots__ = (
+        'tenant', 'priority', 'tokens', 'start', 'seq', 'enqueued_at',
+        'wake', 'granted', 'charged', 'lease'
+    )
+
+    def __init__(self, tenant: str, priority: int, tokens: int, wake: Callable[[], None]):
+        self.tenant = tenant
+        self.priority = priority
+        self.tokens = tokens
+        self.wake = wake
+        self.start = 0.0
+        self.seq = 0
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.charged = 0
+        self.lease = None
+
+
+class LLMScheduler:
+    """
+    동시 요청 수/분당 토큰 예산/우선순위/저장소 간 공정 분배를 적용하는 요청 스케줄러
+
+    슬롯 배정은 상태가 바뀔 때(요청 추가, 종료, 대기 시간 경과)마다 _dispatch()에서 한꺼번에 합니다.
+    맨 앞 요청이 토큰 예산을 기다리는 동안에는 뒤의 작은 요청도 끼어들지 않습니다
+    (큰 청크가 계속 밀려나지 않도록). 한도 자체는 limiter(LocalLimiter 또는 SharedLimiter)가 관리합니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        tokens_per_minute: int = 0,
+        aging: float = 60,
+        rate_limit_pause: float = 5,
+        limiter=None
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 진행할 수 있는 요청 수 상한
+            tokens_per_minute: 분당 토큰 예산 (0이면 제한 없음)
+            aging: 이 시간(초)을 기다릴 때마다 우선순위를 한 단계 올림 (0이면 사용 안 함)
+            rate_limit_pause: 429 응답에 Retry-After가 없을 때 새 요청을 멈출 시간(초)
+            limiter: 한도 관리자 (기본값: 위 설정의 LocalLimiter)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.aging = aging
+        self.limiter = limiter or LocalLimiter(self.max_concurrency, tokens_per_minute, rate_limit_pause)
+
+        # 이 프로세스에서 진행 중인 요청 수와, 한도가 없어 다음 확인까지 배정을 쉬는 시각
+        self._inflight = 0
+        self._blocked_until = 0.0
+        self._waiting: List[Ticket] = []
+        # 저장소별 마지막 요청의 가상 종료 시각과 현재 가상 시각 (fair queuing)
+        self._finish: Dict[str, float] = {}
+        self._clock = 0.0
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+        self.granted = 0
+        self.throttled = 0
+        self.timeouts = 0
+
+    @classmethod
+    def from_config(cls) -> 'LLMScheduler':
+        limiter = None
+        if Config.LLM_SCHEDULER_SHARED:
+            limiter = SharedLimiter(
+                Config.LLM_SCHEDULER_DB_PATH,
+                max_concurrency=Config.LLM_MAX_CONCURRENCY,
+                tokens_per_minute=Config.LLM_TOKENS_PER_MINUTE,
+                rate_limit_pause=Config.LLM_RATE_LIMIT_PAUSE,
+                lease_ttl=Config.LLM_SCHEDULER_LEASE_TTL
+            )
+        return cls(
+            max_concurrency=Config.LLM_MAX_CONCURRENCY,
+            tokens_per_minute=Config.LLM_TOKENS_PER_MINUTE,
+            aging=Config.LLM_PRIORITY_AGING,
+            rate_limit_pause=Config.LLM_RATE_LIMIT_PAUSE,
+            limiter=limiter
+        )
+
+    @property
+    def poll_interval(self) -> float:
+        """대기 중 상태를 다시 확인하는 최대 간격(초)"""
+        return self.limiter.poll_interval
+
+    def acquire(
+        self,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL,
+        tokens: int = 0,
+        timeout: float = None
+    ) -> Ticket:
+        """
+        요청 슬롯을 받을 때까지 대기
+
+        Args:
+            tenant: 공정 분배 단위 (저장소 이름)
+            priority: 우선순위
+            tokens: 예약할 토큰 수 (prompt + max_tokens)
+            timeout: 최대 대기 시간(초), None이면 제한 없음
+
+        Returns:
+            Ticket: 요청이 끝나면 release()에 전달
+
+        Raises:
+            SchedulerTimeout: timeout 안에 슬롯을 받지 못한 경우
+        """
+        event = threading.Event()
+        ticket = self._enqueue(tenant, priority, tokens, event.set)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            retry_in = self._dispatch()
+            if ticket.granted:
+                return ticket
+            wait = min(retry_in or self.poll_interval, self.poll_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if self._cancel(ticket, timed_out=True):
+                        return ticket
+                    raise SchedulerTimeout(f"LLM 요청 대기 시간 초과 ({timeout:g}초)")
+                wait = min(wait, remaining)
+            event.wait(wait)
+            event.clear()
+
+    async def acquire_async(
+        self,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL,
+        tokens: int = 0,
+        timeout: float = None
+    ) -> Ticket:
+        """
+        요청 슬롯을 받을 때까지 대기 (acquire()의 비동기 버전, 이벤트 루프를 막지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        ticket = self._enqueue(tenant, priority, tokens, lambda: loop.call_soon_threadsafe(event.set))
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        try:
+            while True:
+                if self.limiter.blocking:
+                    retry_in = await asyncio.to_thread(self._dispatch)
+                else:
+                    retry_in = self._dispatch()
+                if ticket.granted:
+                    return ticket
+                wait = min(retry_in or self.poll_interval, self.poll_interval)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        if self._cancel(ticket, timed_out=True):
+                            return ticket
+                        raise SchedulerTimeout(f"LLM 요청 대기 시간 초과 ({timeout:g}초)")
+                    wait = min(wait, remaining)
+                try:
+                    await asyncio.wait_for(event.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소되면 반납
+            if self._cancel(ticket):
+                self.release(ticket)
+            raise
+
+    def try_acquire(self, tenant: str = '', priority: int = PRIORITY_NORMAL, tokens: int = 0) -> Optional[Ticket]:
+        """
+        기다리지 않고 바로 슬롯을 받음 (헤지 요청처럼 없어도 되는 요청용)
+
+        대기 중인 요청이 있으면 그 요청보다 먼저 가져가지 않습니다.
+
+        Returns:
+            Ticket: 받은 슬롯 (요청이 끝나면 release()에 전달, 못 받으면 None)
+        """
+        ticket = Ticket(tenant, min(max(priority, PRIORITY_HIGH), PRIORITY_LOW), max(int(tokens), 0), lambda: None)
+        with self._lock:
+            if self._waiting or time.monotonic() < self._blocked_until:
+                return None
+            lease, _ = self.limiter.try_acquire(self._cost(ticket))
+            if lease is None:
+                return None
+            self._grant(ticket, lease)
+        return ticket
+
+    def release(self, ticket: Ticket, used_tokens: int = None, throttled: bool = False, retry_after: float = None):
+        """
+        요청 종료
+
+        Args:
+            ticket: acquire()로 받은 슬롯
+            used_tokens: 실제 사용한 토큰 수 (알면 예약량과의 차이를 정산)
+            throttled: 429 응답을 받았는지 여부 (동시 요청 수를 줄이고 잠시 멈춤)
+            retry_after: 429 응답의 Retry-After(초)
+        """
+        self._finish_ticket(ticket, used_tokens, throttled, retry_after)
+
+    def cancel(self, ticket: Ticket):
+        """요청을 보내지 않고 슬롯 반납 (예약한 토큰도 돌려받음)"""
+        self._finish_ticket(ticket, used_tokens=0, completed=False)
+
+    def stats(self) -> Dict:
+        limits = self.limiter.stats()
+        with self._lock:
+            waiting = Counter(PRIORITY_NAMES[t.priority] for t in self._waiting)
+            return {
+                'inflight': self._inflight,
+                'inflight_total': limits['inflight'],
+                'limit': limits['limit'],
+                'shared': isinstance(self.limiter, SharedLimiter),
+                'waiting': {name: waiting.get(name, 0) for name in PRIORITY_NAMES},
+                'waiting_repos': len({t.tenant for t in self._waiting}),
+                'tokens_available': limits['tokens_available'],
+                'paused_for': limits['paused_for'],
+                'granted': self.granted,
+                'throttled': self.throttled,
+                'timeouts': self.timeouts
+            }
+
+    def _finish_ticket(
+        self,
+        ticket: Ticket,
+        used_tokens: int = None,
+        throttled: bool = False,
+        retry_after: float = None,
+        completed: bool = True
+    ):
+        self.limiter.release(ticket.lease, ticket.charged, used_tokens, throttled, retry_after, completed)
+        with self._lock:
+            self._inflight -= 1
+            # 반납한 한도를 바로 다른 대기 요청이 쓸 수 있도록 다음 확인 시각을 기다리지 않음
+            self._blocked_until = 0.0
+            if throttled:
+                self.throttled += 1
+            if not self._waiting:
+                # 대기 중인 요청이 없으면 지난 저장소 기록은 필요 없음
+                self._finish.clear()
+        self._dispatch()
+
+    def _enqueue(self, tenant: str, priority: int, tokens: int, wake: Callable[[], None]) -> Ticket:
+        ticket = Ticket(tenant, min(max(priority, PRIORITY_HIGH), PRIORITY_LOW), max(int(tokens), 0), wake)
+        with self._lock:
+            # 저장소의 이전 요청이 끝나는 가상 시각부터 시작 (쉬던 저장소는 현재 가상 시각부터)
+            ticket.start = max(self._finish.get(tenant, 0.0), self._clock)
+            self._finish[tenant] = ticket.start + max(ticket.tokens, 1)
+            ticket.seq = next(self._seq)
+            self._waiting.append(ticket)
+        return ticket
+
+    def _cancel(self, ticket: Ticket, timed_out: bool = False) -> bool:
+        """
+        대기 취소
+
+        Returns:
+            bool: 이미 슬롯을 받은 경우 True (호출자가 사용하거나 반납해야 함)
+        """
+        with self._lock:
+            if ticket.granted:
+                return True
+            self._waiting.remove(ticket)
+            if timed_out:
+                self.timeouts += 1
+            return False
+
+    def _cost(self, ticket: Ticket) -> int:
+        # 예산보다 큰 요청은 예산 전체를 쓰는 것으로 처리 (영원히 기다리지 않도록)
+        return min(ticket.tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+
+    def _grant(self, ticket: Ticket, lease: object):
+        """슬롯 배정 기록 (self._lock 안에서 호출)"""
+        self._inflight += 1
+        self._clock = max(self._clock, ticket.start)
+        ticket.lease = lease
+        ticket.charged = self._cost(ticket)
+        ticket.granted = True
+        self.granted += 1
+
+    def _effective_priority(self, ticket: Ticket, now: float) -> int:
+        if not self.aging:
+            return ticket.priority
+        return max(PRIORITY_HIGH, ticket.priority - int((now - ticket.enqueued_at) / self.aging))
+
+    def _dispatch(self) -> Optional[float]:
+        """
+        배정 가능한 만큼 대기 중 요청에 슬롯 배정
+
+        Returns:
+            float: 예산/일시 정지 때문에 배정하지 못했다면 다시 시도할 때까지의 시간(초)
+        """
+        woken = []
+        retry_in = None
+        with self._lock:
+            now = time.monotonic()
+            if not self._waiting:
+                return None
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            while self._waiting:
+                ticket = min(
+                    self._waiting,
+                    key=lambda t: (self._effective_priority(t, now), t.start, t.seq)
+                )
+                lease, retry_in = self.limiter.try_acquire(self._cost(ticket))
+                if lease is None:
+                    # 다른 프로세스가 반납하는 한도는 알림이 없으므로 limiter 확인 간격만큼 쉼
+                    self._blocked_until = now + (retry_in if retry_in is not None else self.poll_interval)
+                    break
+
+                self._waiting.remove(ticket)
+                self._grant(ticket, lease)
+                woken.append(ticket)
+
+        for ticket in woken:
+            LLM_SCHEDULER_WAIT_SECONDS.observe(now - ticket.enqueued_at, priority=PRIORITY_NAMES[ticket.priority])
+            ticket.wake()
+        return retry_in
@@ -3,13 +3,58 @@ Upstage Solar Pro LLM 연동 서비스
 """
 import requests
 import json
-from typing import Dict, Optional
+import random
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from utils.config import Config
+from utils.http_client import RETRY_STATUS_CODES, get_session
+from utils.analysis_cache import AnalysisCache
+from utils.token_budget import PromptPacker
+from utils.json_stream import IncrementalJSONParser, sse_data
+from utils.json_repair import loads_tolerant, split_fields, strip_code_fence
+from utils.analysis_schema import ANALYSIS_FIELDS, AnalysisSchemaError, validate_analysis
+from utils.model_router import ModelRoute, ModelRouter
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.hedging import HedgePolicy
+from utils.llm_scheduler import PRIORITY_NORMAL, LLMScheduler, SchedulerTimeout, Ticket
+from utils.metrics import LLM_OUTPUT_REPAIRS, LLM_TOKENS
 
 
 class LLMService:
     """Upstage Solar Pro 연동 클래스"""
     
+    # 공유 세션/메트릭 이름
+    SERVICE_NAME = 'upstage'
+    
+    MODEL = "solar-pro"
+    TEMPERATURE = 0.3  # 일관성 있는 분석을 위해 낮은 temperature
+    
+    # REVIEW_PROMPT / 시스템 프롬프트를 바꾸면 올려서 기존 캐시를 무효화
+    PROMPT_VERSION = "1"
+    
+    SYSTEM_PROMPT = "당신은 코드 리뷰 전문가입니다. 보안, 품질, 성능을 중심으로 코드를 분석합니다."
+    
+    # 청크 결과 병합 시 정렬 기준
+    SEVERITY_ORDER = {"높음": 0, "중간": 1, "낮음": 2}
+    PRIORITY_ORDER = {"필수": 0, "권장": 1, "선택": 2}
+    MAX_MERGED_ITEMS = 15
+    
+    # 프로세스 내 LLM 응답 지연 시간과 헤지 예산 (인스턴스 간 공유)
+    hedge_policy = HedgePolicy(
+        quantile=Config.LLM_HEDGE_QUANTILE,
+        min_samples=Config.LLM_HEDGE_MIN_SAMPLES,
+        max_ratio=Config.LLM_HEDGE_MAX_RATIO,
+        max_inflight=Config.LLM_HEDGE_MAX_INFLIGHT
+    )
+    
+    # 프로세스 내 모든 LLM 요청이 거치는 스케줄러 (동시 요청 수/분당 토큰/우선순위/저장소 간 공정 분배)
+    scheduler = LLMScheduler.from_config()
+    # 429 응답 후 슬롯을 다시 받아 재시도하는 횟수 (5xx는 Config.HTTP_MAX_RETRIES)
+    RATE_LIMIT_RETRIES = 2
+    
     # 코드 리뷰 프롬프트
     REVIEW_PROMPT = """당신은 전문 코드 리뷰어입니다. 다음 Pull Request의 변경사항을 분석하고 상세한 리뷰를 제공해주세요.
 
@@ -85,13 +130,40 @@ class LLMService:
 
 중요: 반드시 유효한 JSON 형식으로만 응답해주세요. 추가 설명이나 마크다운은 포함하지 마세요."""
     
-    def __init__(self):
+    # 형식이 깨진 응답 조각 복구 프롬프트 (diff 없이 깨진 부분만 보냄)
+    REPAIR_SYSTEM_PROMPT = "당신은 JSON 교정기입니다. 내용은 그대로 두고 JSON 문법만 고칩니다."
+    REPAIR_PROMPT = """다음은 코드 리뷰 결과 JSON의 일부인데 형식 오류가 있습니다 ({error}).
+내용은 바꾸거나 줄이지 말고 JSON 문법만 고쳐서, 같은 키를 가진 JSON 객체 하나로만 응답해주세요.
+
+스키마:
+- summary: 문자열
+- risks: [{{"severity": "높음|중간|낮음", "category": "보안|품질|버그|테스트|성능", "description": "...", "location": "..."}}]
+- suggestions: [{{"priority": "필수|권장|선택", "description": "...", "example": "..."}}]
+- positive_points: [문자열]
+- overall_rating: 문자열
+
+```
+{fragment}
+```"""
+    
+    def __init__(self, cache: Optional[AnalysisCache] = None, router: Optional[ModelRouter] = None):
         self.api_key = Config.UPSTAGE_API_KEY
         self.api_url = Config.UPSTAGE_API_URL
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
+        if cache is None and Config.ANALYSIS_CACHE_ENABLED:
+            cache = AnalysisCache()
+        self.cache = cache
+        self.timeout = (Config.HTTP_CONNECT_TIMEOUT, Config.LLM_READ_TIMEOUT)
+        self.packer = PromptPacker()
+        self.router = router or ModelRouter.from_config(self.MODEL, self.TEMPERATURE)
+    
+    @property
+    def session(self):
+        """프로세스 내 공유 keep-alive 세션"""
+        return get_session(self.SERVICE_NAME)
     
     def analyze_pr(
         self,
@@ -100,7 +172,11 @@ class LLMService:
         base_branch: str,
         head_branch: str,
         description: str,
-        diff: str
+        diff: str,
+        on_event: Callable[[str, Any], None] = None,
+        deadline: Optional[Deadline] = None,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL
     ) -> Optional[Dict]:
         """
         PR 분석 실행
@@ -112,10 +188,766 @@ class LLMService:
             head_branch: 헤드 브랜치
             description: PR 설명
             diff: 코드 변경사항
+            on_event: 스트리밍 모드에서 summary/리스크/제안 항목이 완성될 때마다 (키, 값)으로 호출
+            deadline: 작업 마감 시간 (요청 타임아웃을 남은 시간 이하로 제한)
+            tenant: 스케줄러 공정 분배 단위 (저장소 이름)
+            priority: 스케줄러 우선순위 (llm_scheduler.pr_priority())
             
         Returns:
             Dict: 분석 결과
         """
+        # diff 크기/경로/언어로 모델 선택
+        route = self.router.route(diff)
+        
+        # 같은 입력으로 이미 분석한 적이 있으면 캐시 사용
+        cache_key = self.cache_key_for(title, description, diff, route)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("✅ 캐시된 분석 결과 사용")
+                return {**cached, 'usage': {'prompt_tokens': 0, 'completion_tokens': 0}}
+        
+        payload = self.build_payload(title, author, base_branch, head_branch, description, diff, route)
+        content = None
+        
+        try:
+            print(f"🤖 Upstage {route.model}로 코드 분석 중... (라우트: {route.name})")
+            if Config.LLM_STREAMING:
+                analysis_result, partial = self._scheduled(
+                    payload, tenant, priority, deadline,
+                    lambda: self._request_streaming(payload, on_event, deadline, route),
+                    lambda result: result[0].get('usage')
+                )
+            else:
+                content, usage = self._scheduled(
+                    payload, tenant, priority, deadline,
+                    lambda: self._complete(payload, deadline, tenant, priority, route.name),
+                    lambda result: result[1]
+                )
+                try:
+                    analysis_result, partial = self.parse_analysis(content)
+                except (json.JSONDecodeError, AnalysisSchemaError) as e:
+                    # 전체를 다시 분석하지 않고 깨진 부분만 고쳐 받음
+                    analysis_result, partial, repair_usage = self._repair(
+                        content, e, route, deadline, tenant, priority
+                    )
+                    usage = self.total_usage([{'usage': usage}, {'usage': repair_usage}])
+                if partial:
+                    analysis_result['risks'].append(self.truncated_risk())
+                analysis_result['usage'] = usage
+            
+            analysis_result['model_routes'] = [route.name]
+            analysis_result['models'] = [route.model]
+            
+            # 끊긴 응답에서 복구한 결과는 캐시하지 않음
+            if cache_key and not partial:
+                self.cache.set(cache_key, analysis_result)
+            
+            print("✅ 분석 완료!")
+            return analysis_result
+            
+        except requests.exceptions.RequestException as e:
+            print(f"❌ LLM API 요청 실패: {e}")
+            return None
+        except (json.JSONDecodeError, AnalysisSchemaError) as e:
+            print(f"❌ JSON 파싱 실패: {e}")
+            print(f"응답 내용: {content}")
+            return None
+        except DeadlineExceeded as e:
+            print(f"⏱️ 분석 생략: {e}")
+            return None
+        except SchedulerTimeout as e:
+            print(f"⏳ 분석 생략: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ 예상치 못한 오류: {e}")
+            return None
+    
+    def _repair(
+        self,
+        content: str,
+        error: ValueError,
+        route: ModelRoute,
+        deadline: Optional[Deadline],
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL,
+        scheduled: bool = True
+    ) -> Tuple[Dict, bool, Dict[str, int]]:
+        """
+        로컬에서 고치지 못한 응답의 깨진 필드만 보내 JSON 문법을 고쳐 받음
+        
+        요청에는 diff 없이 깨진 조각만 들어가므로 원래 분석 요청보다 훨씬 적은 토큰을 씁니다.
+        
+        Args:
+            content: 모델이 생성한 텍스트
+            error: 로컬 파싱/스키마 검증 오류
+            route: 원래 요청의 모델 라우트
+            deadline: 작업 마감 시간
+            tenant: 스케줄러 공정 분배 단위
+            priority: 스케줄러 우선순위
+            scheduled: 스케줄러 슬롯을 새로 받을지 여부
+                (False면 슬롯을 가진 원래 요청 안에서 바로 보냄, 스트리밍 응답 복구용)
+            
+        Returns:
+            Tuple[Dict, bool, Dict[str, int]]: (분석 결과, 부분 결과 여부, 복구 요청 토큰 사용량)
+            
+        Raises:
+            error: 복구 요청을 보낼 수 없거나 복구한 응답도 쓸 수 없는 경우
+        """
+        request = self.build_repair_request(content, error, route)
+        if request is None:
+            raise error
+        payload, salvaged = request
+        
+        print(f"🩹 응답 형식 오류, 깨진 부분만 다시 요청: {error}")
+        try:
+            if scheduled:
+                repaired, usage = self._scheduled(
+                    payload, tenant, priority, deadline,
+                    lambda: self._post_completion(payload, self.request_timeout(deadline)),
+                    lambda result: result[1]
+                )
+            else:
+                repaired, usage = self._post_completion(payload, self.request_timeout(deadline))
+        except (requests.exceptions.RequestException, DeadlineExceeded, SchedulerTimeout) as e:
+            LLM_OUTPUT_REPAIRS.inc(method='request', result='failed')
+            print(f"❌ 복구 요청 실패: {e}")
+            raise error
+        
+        result, partial = self.finish_repair(salvaged, repaired, error)
+        return result, partial, usage
+    
+    def build_repair_request(
+        self,
+        content: str,
+        error: ValueError,
+        route: ModelRoute
+    ) -> Optional[Tuple[Dict, Dict]]:
+        """
+        복구 요청 페이로드 생성
+        
+        최상위 필드별로 나눠 파싱되는 필드는 그대로 쓰고 깨진 필드만 보냅니다.
+        필드를 나눌 수 없거나 스키마 오류인 경우에는 응답 전체를 보냅니다.
+        
+        Args:
+            content: 모델이 생성한 텍스트
+            error: 로컬 파싱/스키마 검증 오류
+            route: 원래 요청의 모델 라우트
+            
+        Returns:
+            Tuple[Dict, Dict]: (요청 페이로드, 이미 파싱한 필드)
+                복구 요청을 끄거나 조각이 LLM_REPAIR_MAX_TOKENS보다 크면 None
+        """
+        LLM_OUTPUT_REPAIRS.inc(method='local', result='failed')
+        if not Config.LLM_REPAIR_ENABLED:
+            return None
+        
+        salvaged: Dict[str, Any] = {}
+        broken: List[Tuple[str, str]] = []
+        fields = None if isinstance(error, AnalysisSchemaError) else split_fields(content)
+        for key, raw in fields or []:
+            if key not in ANALYSIS_FIELDS:
+                continue
+            try:
+                salvaged[key], _ = loads_tolerant(raw)
+            except json.JSONDecodeError:
+                broken.append((key, raw))
+        
+        if broken:
+            fragment = "{\n" + ",\n".join(
+                f"{json.dumps(key, ensure_ascii=False)}: {raw}" for key, raw in broken
+            ) + "\n}"
+        else:
+            salvaged = {}
+            fragment = strip_code_fence(content)
+        
+        tokens = self.packer.counter.count(fragment)
+        if tokens > Config.LLM_REPAIR_MAX_TOKENS:
+            print(f"⚠️ 깨진 부분이 너무 커서 복구 요청 생략 ({tokens} 토큰)")
+            return None
+        
+        payload = {
+            "model": route.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": self.REPAIR_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": self.REPAIR_PROMPT.format(error=error, fragment=fragment)
+                }
+            ],
+            "temperature": 0,
+            # 고친 조각은 원래 조각과 길이가 비슷함
+            "max_tokens": tokens + tokens // 2 + 64
+        }
+        return payload, salvaged
+    
+    @staticmethod
+    def finish_repair(salvaged: Dict, repaired: str, error: ValueError) -> Tuple[Dict, bool]:
+        """
+        복구 요청 응답과 이미 파싱한 필드를 합쳐 분석 결과 생성
+        
+        Args:
+            salvaged: 원래 응답에서 파싱한 필드
+            repaired: 복구 요청에 대한 모델 응답
+            error: 원래 오류 (복구에 실패하면 다시 발생)
+            
+        Returns:
+            Tuple[Dict, bool]: (분석 결과, 부분 결과 여부)
+        """
+        try:
+            fixed, fixes = loads_tolerant(repaired)
+            if not isinstance(fixed, dict):
+                raise AnalysisSchemaError(f"복구 응답이 JSON 객체가 아님 ({type(fixed).__name__})")
+            result, _ = validate_analysis({**salvaged, **fixed})
+        except (json.JSONDecodeError, AnalysisSchemaError) as e:
+            LLM_OUTPUT_REPAIRS.inc(method='request', result='failed')
+            print(f"❌ 복구한 응답도 사용할 수 없음: {e}")
+            raise error
+        
+        LLM_OUTPUT_REPAIRS.inc(method='request', result='ok')
+        print(f"✅ 깨진 부분 복구 완료 (필드 {len(fixed)}개)")
+        return result, 'truncated' in fixes
+    
+    def _scheduled(
+        self,
+        payload: Dict,
+        tenant: str,
+        priority: int,
+        deadline: Optional[Deadline],
+        send: Callable[[], Any],
+        usage_of: Callable[[Any], Optional[Dict[str, int]]]
+    ) -> Any:
+        """
+        스케줄러 슬롯을 받은 뒤 요청 실행
+        
+        POST 요청은 전송 계층(세션)에서 재시도하지 않으므로 여기서 재시도합니다.
+        429 응답을 받으면 스케줄러가 동시 요청 수를 줄이고 Retry-After만큼 새 요청을 멈추며,
+        이 요청은 슬롯을 다시 받아 재시도합니다 (fallback 분석으로 넘어가지 않도록).
+        5xx 응답은 슬롯을 반납하고 backoff 후 다시 받아 재시도합니다.
+        
+        Args:
+            payload: 요청 페이로드 (예약 토큰 수 계산용)
+            tenant: 공정 분배 단위 (저장소 이름)
+            priority: 우선순위
+            deadline: 작업 마감 시간 (슬롯 대기 시간도 남은 시간 이하로 제한)
+            send: 실제 요청 함수
+            usage_of: send() 결과에서 토큰 사용량을 꺼내는 함수
+            
+        Returns:
+            send()의 반환값
+            
+        Raises:
+            SchedulerTimeout: 대기 시간 안에 슬롯을 받지 못한 경우
+        """
+        scheduler = self.scheduler if Config.LLM_SCHEDULER_ENABLED else None
+        tokens = self.reserved_tokens(payload)
+        # 429와 5xx는 따로 셈 (retry_delay() 참고)
+        throttles = errors = 0
+        while True:
+            ticket = None
+            if scheduler is not None:
+                ticket = scheduler.acquire(tenant, priority, tokens, self.scheduler_timeout(deadline))
+            try:
+                result = send()
+            except requests.exceptions.HTTPError as e:
+                status = getattr(e.response, 'status_code', None)
+                throttled, retry_after = self.rate_limit_status(status, getattr(e.response, 'headers', None))
+                if ticket is not None:
+                    scheduler.release(ticket, throttled=throttled, retry_after=retry_after)
+                attempt = throttles if throttled else errors
+                delay = self.retry_delay(status, retry_after, attempt, deadline, scheduled=scheduler is not None)
+                if delay is None:
+                    raise
+                throttles, errors = (throttles + 1, errors) if throttled else (throttles, errors + 1)
+                print(f"🔁 LLM API 응답 {status}, {delay:.1f}초 후 재시도 ({attempt + 1}회)")
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if ticket is not None:
+                    scheduler.release(ticket)
+                raise
+            
+            if ticket is not None:
+                usage = usage_of(result)
+                scheduler.release(ticket, sum(usage.values()) if usage else None)
+            return result
+    
+    def retry_delay(
+        self,
+        status_code: Optional[int],
+        retry_after: Optional[float],
+        attempt: int,
+        deadline: Optional[Deadline] = None,
+        scheduled: bool = True
+    ) -> Optional[float]:
+        """
+        실패한 LLM 요청을 다시 보내기 전 대기 시간
+        
+        Args:
+            status_code: 응답 상태 코드
+            retry_after: 429 응답의 Retry-After(초)
+            attempt: 같은 종류(429 또는 5xx) 실패로 지금까지 재시도한 횟수
+            deadline: 작업 마감 시간 (대기 후 남는 시간이 없으면 재시도하지 않음)
+            scheduled: 스케줄러를 거치는지 여부 (429 대기는 스케줄러가 대신함)
+            
+        Returns:
+            float: 대기 시간(초) (재시도하지 않으면 None)
+        """
+        backoff = Config.HTTP_RETRY_BACKOFF
+        if status_code == 429 and attempt < self.RATE_LIMIT_RETRIES:
+            # 스케줄러가 Retry-After 동안 모든 요청을 멈추므로 바로 슬롯을 다시 요청
+            delay = 0.0 if scheduled else (retry_after or backoff * (2 ** attempt))
+        elif status_code in RETRY_STATUS_CODES and status_code != 429 and attempt < Config.HTTP_MAX_RETRIES:
+            delay = backoff * (2 ** attempt) + random.uniform(0, backoff)
+        else:
+            return None
+        
+        if deadline is not None and deadline.remaining() <= delay:
+            return None
+        return delay
+    
+    def reserved_tokens(self, payload: Dict) -> int:
+        """스케줄러에 예약할 토큰 수 (prompt + max_tokens)"""
+        counter = self.packer.counter
+        prompt_tokens = sum(counter.count(message['content']) for message in payload['messages'])
+        return prompt_tokens + int(payload.get('max_tokens') or 0)
+    
+    @staticmethod
+    def scheduler_timeout(deadline: Optional[Deadline] = None) -> float:
+        """스케줄러 슬롯 최대 대기 시간 (마감 시간이 있으면 남은 시간 이하)"""
+        if deadline is None:
+            return Config.LLM_SCHEDULER_MAX_WAIT
+        return min(Config.LLM_SCHEDULER_MAX_WAIT, deadline.remaining())
+    
+    @staticmethod
+    def rate_limit_status(status_code: int, headers) -> Tuple[bool, Optional[float]]:
+        """
+        실패 응답이 호출 한도 초과(429)인지 확인
+        
+        Returns:
+            Tuple[bool, Optional[float]]: (429 여부, Retry-After 초 (없으면 None))
+        """
+        if status_code != 429:
+            return False, None
+        retry_after = (headers or {}).get('Retry-After')
+        return True, float(retry_after) if retry_after and retry_after.isdigit() else None
+    
+    def request_timeout(self, deadline: Optional[Deadline] = None) -> Tuple[float, float]:
+        """
+        LLM 요청 (connect, read) 타임아웃
+        
+        Raises:
+            DeadlineExceeded: 마감 시간이 이미 지난 경우
+        """
+        if deadline is None:
+            return self.timeout
+        return deadline.cap_timeout(self.timeout, "LLM 요청")
+    
+    def response_usage(self, payload: Dict, content: str, usage: Dict = None) -> Dict[str, int]:
+        """
+        요청 하나의 토큰 사용량 (토큰 수 히스토그램에도 기록)
+        
+        Args:
+            payload: 요청 페이로드
+            content: 모델이 생성한 텍스트
+            usage: API 응답의 usage (없으면 토큰 계산기로 추정)
+            
+        Returns:
+            Dict[str, int]: {'prompt_tokens', 'completion_tokens'}
+        """
+        if usage and 'prompt_tokens' in usage:
+            result = {
+                'prompt_tokens': int(usage['prompt_tokens']),
+                'completion_tokens': int(usage.get('completion_tokens') or 0)
+            }
+        else:
+            counter = self.packer.counter
+            result = {
+                'prompt_tokens': sum(counter.count(message['content']) for message in payload['messages']),
+                'completion_tokens': counter.count(content or '')
+            }
+        LLM_TOKENS.observe(result['prompt_tokens'], model=payload.get('model'), kind='prompt')
+        LLM_TOKENS.observe(result['completion_tokens'], model=payload.get('model'), kind='completion')
+        return result
+    
+    @staticmethod
+    def total_usage(results: List[Optional[Dict]]) -> Dict[str, int]:
+        """청크별 결과의 토큰 사용량 합계"""
+        total = {'prompt_tokens': 0, 'completion_tokens': 0}
+        for result in results:
+            usage = (result or {}).get('usage') or {}
+            for key in total:
+                total[key] += int(usage.get(key) or 0)
+        return total
+    
+    def _post_completion(
+        self,
+        payload: Dict,
+        timeout: Tuple[float, float],
+        hedge_key: Optional[str] = None
+    ) -> Tuple[str, Dict[str, int]]:
+        """요청 하나를 보내고 (응답 본문, 토큰 사용량) 반환, hedge_key가 있으면 지연 시간을 그 키로 헤지 정책에 기록"""
+        started = time.monotonic()
+        response = self.session.post(
+            self.api_url,
+            headers=self.headers,
+            json=payload,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        
+        # 응답에서 content 추출
+        result = response.json()
+        content = result['choices'][0]['message']['content']
+        if hedge_key is not None:
+            self.hedge_policy.record(time.monotonic() - started, hedge_key)
+        return content, self.response_usage(payload, content, result.get('usage'))
+    
+    def _start_attempt(self, payload: Dict, timeout: Tuple[float, float], hedge_key: str) -> Future:
+        future = Future()
+        
+        def run():
+            try:
+                future.set_result(self._post_completion(payload, timeout, hedge_key))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name='llm-request', daemon=True).start()
+        return future
+    
+    def _complete(
+        self,
+        payload: Dict,
+        deadline: Optional[Deadline] = None,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL,
+        hedge_key: str = ''
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        응답 본문 요청
+        
+        헤징을 켜면 같은 라우트 요청의 최근 p90 지연 시간 안에 응답이 없을 때 같은 요청을 하나 더 보내고
+        먼저 성공한 응답을 사용합니다. 헤지 예산이나 스케줄러 슬롯이 없거나 남은 시간이 부족하면
+        첫 요청만 기다립니다.
+        
+        헤지가 먼저 응답하면 호출한 _scheduled()가 첫 요청의 슬롯을 반납하지만 첫 요청은 아직 진행 중이므로,
+        그 요청이 끝날 때까지 헤지의 슬롯을 대신 잡아 두어 동시 요청 수 한도를 넘지 않게 합니다.
+        
+        Args:
+            payload: 요청 페이로드
+            deadline: 작업 마감 시간
+            tenant: 헤지 요청의 스케줄러 공정 분배 단위
+            priority: 헤지 요청의 스케줄러 우선순위
+            hedge_key: 지연 시간 표본을 나누는 키 (모델 라우트 이름)
+        
+        Returns:
+            Tuple[str, Dict[str, int]]: (모델이 생성한 텍스트, 토큰 사용량)
+            
+        Raises:
+            requests.exceptions.RequestException: 모든 요청이 실패한 경우
+            DeadlineExceeded: 마감 시간이 이미 지난 경우
+        """
+        timeout = self.request_timeout(deadline)
+        delay = self.hedge_policy.hedge_delay(hedge_key) if Config.LLM_HEDGE_ENABLED else None
+        if delay is None or (deadline and deadline.remaining() <= delay):
+            return self._post_completion(payload, timeout, hedge_key)
+        
+        primary = self._start_attempt(payload, timeout, hedge_key)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        allowed, ticket = self._acquire_hedge(payload, tenant, priority)
+        if not allowed:
+            return primary.result()
+        
+        print(f"🔀 {delay:.1f}초 안에 응답이 없어 헤지 요청 추가")
+        try:
+            hedge = self._start_attempt(payload, self.request_timeout(deadline), hedge_key)
+        except DeadlineExceeded:
+            self.hedge_policy.release()
+            if ticket is not None:
+                self.scheduler.cancel(ticket)
+            return primary.result()
+        
+        def release_slot(future: Future):
+            error = future.exception()
+            response = getattr(error, 'response', None)
+            self._release_ticket(
+                ticket,
+                future.result()[1] if error is None else None,
+                getattr(response, 'status_code', None),
+                getattr(response, 'headers', None)
+            )
+        
+        def finish_hedge(future: Future):
+            self.hedge_policy.release()
+            if future.exception() is None and not primary.done():
+                # 응답을 버릴 첫 요청이 끝날 때까지 슬롯 유지 (결과로 한도 정산)
+                primary.add_done_callback(release_slot)
+            else:
+                release_slot(future)
+        
+        hedge.add_done_callback(finish_hedge)
+        
+        # 먼저 성공한 응답 사용 (늦은 쪽은 응답을 버림)
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            failed = None
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.hedge_policy.won()
+                    return future.result()
+                failed = future
+            if not pending:
+                return failed.result()
+    
+    def _acquire_hedge(self, payload: Dict, tenant: str, priority: int) -> Tuple[bool, Optional[Ticket]]:
+        """
+        헤지 요청에 쓸 스케줄러 슬롯과 헤지 예산 확보
+        
+        헤지도 실제 API 호출이므로 동시 요청 수/분당 토큰 예산에 포함합니다.
+        슬롯을 기다리는 요청이 있거나 한도가 없으면 헤지를 보내지 않습니다.
+        
+        Returns:
+            Tuple[bool, Optional[Ticket]]: (헤지를 보내도 되는지 여부,
+                스케줄러 슬롯 (스케줄러를 쓰지 않으면 None)),
+                보냈다면 끝난 뒤 hedge_policy.release()와 _release_ticket() 필요
+        """
+        ticket = None
+        if Config.LLM_SCHEDULER_ENABLED:
+            ticket = self.scheduler.try_acquire(tenant, priority, self.reserved_tokens(payload))
+            if ticket is None:
+                self.hedge_policy.reject()
+                return False, None
+        if not self.hedge_policy.try_acquire():
+            if ticket is not None:
+                self.scheduler.cancel(ticket)
+            return False, None
+        return True, ticket
+    
+    def _release_ticket(
+        self,
+        ticket: Optional[Ticket],
+        usage: Optional[Dict[str, int]] = None,
+        status_code: Optional[int] = None,
+        headers=None
+    ):
+        """
+        헤지로 받은 스케줄러 슬롯 반납
+        
+        Args:
+            ticket: _acquire_hedge()로 받은 슬롯
+            usage: 성공한 경우 토큰 사용량
+            status_code: 실패한 경우 응답 상태 코드 (429면 스케줄러가 한도를 줄임)
+            headers: 실패한 경우 응답 헤더
+        """
+        if ticket is None:
+            return
+        if usage is not None:
+            self.scheduler.release(ticket, sum(usage.values()))
+            return
+        throttled, retry_after = self.rate_limit_status(status_code, headers)
+        self.scheduler.release(ticket, throttled=throttled, retry_after=retry_after)
+    
+    def _request_streaming(
+        self,
+        payload: Dict,
+        on_event: Callable[[str, Any], None] = None,
+        deadline: Optional[Deadline] = None,
+        route: ModelRoute = None
+    ) -> Tuple[Dict, bool]:
+        """
+        스트리밍 모드로 요청하고 완성되는 항목을 즉시 전달
+        
+        항목이 이미 콜백으로 전달되므로 헤징은 사용하지 않습니다.
+        끝까지 받은 응답을 로컬에서 고치지 못하면 깨진 필드만 다시 요청합니다 (_repair()).
+        
+        Returns:
+            Tuple[Dict, bool]: (분석 결과, 끊긴 응답에서 복구한 부분 결과인지 여부)
+            
+        Raises:
+            requests.exceptions.RequestException: 복구할 항목 없이 요청이 실패한 경우
+            json.JSONDecodeError: 응답에서 완성된 항목을 하나도 찾지 못한 경우
+        """
+        parser = IncrementalJSONParser()
+        timeout = self.request_timeout(deadline)
+        try:
+            with self.session.post(
+                self.api_url,
+                headers=self.headers,
+                json={**payload, "stream": True},
+                timeout=timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                # text/event-stream은 charset이 없으면 latin-1로 디코딩되므로 직접 UTF-8 디코딩
+                for line in response.iter_lines():
+                    delta = self.stream_delta(line.decode('utf-8', errors='replace'))
+                    if delta is None:
+                        break
+                    self.emit_events(parser.feed(delta), on_event)
+        except requests.exceptions.RequestException as e:
+            if not parser.result():
+                raise
+            print(f"⚠️ 스트리밍 중단: {e}")
+            result, partial, broken = self.recover_stream(parser, e)
+        else:
+            result, partial, broken = self.recover_stream(parser)
+        
+        usage = self.response_usage(payload, parser.text)
+        if broken is not None and route is not None:
+            try:
+                # 이 요청이 받은 스케줄러 슬롯 안에서 이어서 보냄 (슬롯을 두 개 잡지 않도록)
+                result, partial, repair_usage = self._repair(
+                    parser.text, broken, route, deadline, scheduled=False
+                )
+                usage = self.total_usage([{'usage': usage}, {'usage': repair_usage}])
+            except (json.JSONDecodeError, AnalysisSchemaError):
+                if result is None:
+                    raise
+        return self.finish_stream(result, partial, broken, usage), partial
+    
+    @staticmethod
+    def stream_delta(line: str) -> Optional[str]:
+        """
+        SSE 라인에서 생성된 텍스트 조각 추출
+        
+        Args:
+            line: 스트리밍 응답 라인
+            
+        Returns:
+            str: 텍스트 조각 (없으면 빈 문자열, 스트림 종료면 None)
+        """
+        data = sse_data(line or '')
+        if not data:
+            return ''
+        if data == '[DONE]':
+            return None
+        choices = json.loads(data).get('choices') or [{}]
+        return (choices[0].get('delta') or {}).get('content') or ''
+    
+    @staticmethod
+    def emit_events(events: List[Tuple[str, Any]], on_event: Callable[[str, Any], None] = None):
+        """완성된 항목을 콜백으로 전달 (콜백 오류는 분석에 영향을 주지 않음)"""
+        if not on_event:
+            return
+        for key, value in events:
+            try:
+                on_event(key, value)
+            except Exception as e:
+                print(f"⚠️ 스트리밍 콜백 오류: {e}")
+    
+    def recover_stream(
+        self,
+        parser: IncrementalJSONParser,
+        error: Exception = None
+    ) -> Tuple[Optional[Dict], bool, Optional[ValueError]]:
+        """
+        스트림 종료 후 결과 확정
+        
+        전체 응답을 (필요하면 로컬에서 고쳐) 파싱하고, 그래도 안 되면 증분 파서가 꺼낸
+        완성된 필드/항목만으로 결과를 만듭니다.
+        
+        Args:
+            parser: 응답을 받은 증분 파서
+            error: 스트림이 중간에 끊긴 경우 그 예외
+            
+        Returns:
+            Tuple[Optional[Dict], bool, Optional[ValueError]]: (분석 결과 (완성된 항목이 없으면 None),
+                부분 결과 여부, 끝까지 받은 응답의 파싱/스키마 오류 (호출자가 깨진 필드를 복구 요청))
+            
+        Raises:
+            json.JSONDecodeError: 스트림이 끊겼는데 완성된 항목이 하나도 없는 경우 (원래 예외)
+        """
+        try:
+            result, partial = self.parse_analysis(parser.text)
+            return result, partial, None
+        except (json.JSONDecodeError, AnalysisSchemaError) as e:
+            # 중간에 끊긴 응답은 복구 요청으로 뒷부분을 되살릴 수 없으므로 완성된 항목만 사용
+            broken = None if error is not None else e
+            if not parser.result():
+                if broken is None:
+                    raise error
+                return None, True, broken
+            result, _ = validate_analysis(parser.result())
+            return result, True, broken
+    
+    def finish_stream(
+        self,
+        result: Optional[Dict],
+        partial: bool,
+        broken: Optional[ValueError],
+        usage: Dict[str, int]
+    ) -> Dict:
+        """
+        스트리밍 결과에 토큰 사용량과 부분 결과 안내를 붙임
+        
+        Raises:
+            broken: 복구 요청을 보내지 못했고 완성된 항목도 없는 경우
+        """
+        if result is None:
+            raise broken
+        if partial:
+            print(f"⚠️ 응답이 불완전하여 완성된 항목만 사용 ({len(result['risks'])}개 위험 요소)")
+            result['risks'].append(self.truncated_risk())
+        result['usage'] = usage
+        return result
+    
+    @staticmethod
+    def truncated_risk() -> Dict:
+        """끊긴 응답에서 일부 항목만 살린 경우의 안내 항목"""
+        return {
+            "severity": "낮음",
+            "category": "시스템",
+            "description": "LLM 응답이 중간에 끊겨 일부 항목만 포함되었습니다.",
+            "location": "N/A"
+        }
+    
+    def diff_token_budget(self, title: str = "", description: str = "") -> int:
+        """
+        요청 하나(청크 하나)에 넣을 수 있는 diff 토큰 수
+        
+        Args:
+            title: PR 제목
+            description: PR 설명
+            
+        Returns:
+            int: 청크당 diff 토큰 예산 (Config.LLM_CHUNK_TOKEN_BUDGET 이하)
+        """
+        counter = self.packer.counter
+        overhead = (
+            counter.count(self.SYSTEM_PROMPT)
+            + counter.count(self.REVIEW_PROMPT)
+            + counter.count(title or "")
+            + counter.count(description or "")
+        )
+        return self.packer.diff_budget(overhead, limit=Config.LLM_CHUNK_TOKEN_BUDGET)
+    
+    def build_payload(
+        self,
+        title: str,
+        author: str,
+        base_branch: str,
+        head_branch: str,
+        description: str,
+        diff: str,
+        route: Optional[ModelRoute] = None
+    ) -> Dict:
+        """
+        Chat Completions API 요청 페이로드 생성
+        
+        Args:
+            analyze_pr()와 동일
+            route: 사용할 모델 라우트 (기본값: 기본 모델/temperature)
+            
+        Returns:
+            Dict: API 요청 페이로드
+        """
         # 프롬프트 생성
         prompt = self.REVIEW_PROMPT.format(
             title=title,
@@ -126,63 +958,402 @@ class LLMService:
             diff=diff
         )
         
-        # API 요청 페이로드
-        payload = {
-            "model": "solar-pro",
+        # 응답 토큰은 diff 크기에 맞춰 동적으로 할당
+        counter = self.packer.counter
+        prompt_tokens = counter.count(self.SYSTEM_PROMPT) + counter.count(prompt)
+        max_tokens = self.packer.response_tokens(prompt_tokens, counter.count(diff))
+        
+        route = route or ModelRoute('default', self.MODEL, self.TEMPERATURE)
+        if route.max_tokens:
+            max_tokens = min(max_tokens, route.max_tokens)
+        
+        return {
+            "model": route.model,
             "messages": [
                 {
                     "role": "system",
-                    "content": "당신은 코드 리뷰 전문가입니다. 보안, 품질, 성능을 중심으로 코드를 분석합니다."
+                    "content": self.SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            "temperature": 0.3,  # 일관성 있는 분석을 위해 낮은 temperature
-            "max_tokens": 2000
+            "temperature": route.temperature,
+            "max_tokens": max_tokens
         }
+    
+    def cache_key_for(
+        self,
+        title: str,
+        description: str,
+        diff: str,
+        route: Optional[ModelRoute] = None
+    ) -> Optional[str]:
+        """
+        분석 캐시 키 생성 (라우트가 고른 모델/temperature 포함)
         
-        try:
-            print("🤖 Upstage Solar Pro로 코드 분석 중...")
-            response = requests.post(
-                self.api_url,
-                headers=self.headers,
-                json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
+        Returns:
+            str: 캐시 키 (캐시를 쓰지 않으면 None)
+        """
+        if not self.cache:
+            return None
+        route = route or ModelRoute('default', self.MODEL, self.TEMPERATURE)
+        return AnalysisCache.make_key(
+            diff=diff,
+            title=title,
+            description=description or "",
+            model=route.model,
+            prompt_version=self.PROMPT_VERSION,
+            temperature=route.temperature
+        )
+    
+    @staticmethod
+    def parse_analysis(content: str) -> Tuple[Dict, bool]:
+        """
+        LLM 응답 본문을 분석 결과로 파싱하고 스키마에 맞춤
+        
+        엄격한 JSON 파싱에 실패하면 코드 펜스, 끝 쉼표, 문자열 안의 개행, 끊긴 배열 등을
+        로컬에서 고쳐 다시 파싱합니다.
+        
+        Args:
+            content: 모델이 생성한 텍스트
+            
+        Returns:
+            Tuple[Dict, bool]: (분석 결과, 끊긴 응답에서 완성된 항목만 살린 결과인지 여부)
             
-            result = response.json()
+        Raises:
+            json.JSONDecodeError: 고쳐도 유효한 JSON이 아닌 경우
+            AnalysisSchemaError: 분석 결과 형식이 아닌 경우
+        """
+        data, fixes = loads_tolerant(content)
+        result, schema_fixes = validate_analysis(data)
+        if fixes:
+            LLM_OUTPUT_REPAIRS.inc(method='local', result='ok')
+            print(f"🩹 JSON 형식 오류를 로컬에서 복구 ({', '.join(fixes)})")
+        if schema_fixes:
+            print(f"🩹 응답 스키마 보정: {'; '.join(schema_fixes)}")
+        return result, 'truncated' in fixes
+    
+    def analyze_chunks(
+        self,
+        title: str,
+        author: str,
+        base_branch: str,
+        head_branch: str,
+        description: str,
+        chunks: List[Dict],
+        max_workers: int = None,
+        on_event: Callable[[str, Any], None] = None,
+        deadline: Optional[Deadline] = None,
+        tenant: str = '',
+        priority: int = PRIORITY_NORMAL
+    ) -> List[Optional[Dict]]:
+        """
+        diff 청크들을 병렬로 분석 (병합하지 않음)
+        
+        Args:
+            title: PR 제목
+            author: 작성자
+            base_branch: 베이스 브랜치
+            head_branch: 헤드 브랜치
+            description: PR 설명
+            chunks: review_pipeline.plan_chunks() 결과
+            max_workers: 동시 LLM 호출 수 (기본값: Config.LLM_CHUNK_WORKERS)
+            on_event: 스트리밍 모드에서 청크별로 완성되는 항목을 받을 콜백 (여러 스레드에서 호출됨)
+            deadline: 작업 마감 시간 (지난 뒤 시작하는 청크는 분석 실패로 처리)
+            tenant: 스케줄러 공정 분배 단위 (저장소 이름)
+            priority: 스케줄러 우선순위
             
-            # 응답에서 content 추출
-            content = result['choices'][0]['message']['content']
+        Returns:
+            List[Optional[Dict]]: 청크 순서대로의 분석 결과 (실패한 청크는 None)
+        """
+        if not chunks:
+            return []
+        
+        workers = min(max_workers or Config.LLM_CHUNK_WORKERS, len(chunks))
+        print(f"🧩 {len(chunks)}개 청크를 {workers}개 워커로 분석 중...")
+        
+        def analyze_chunk(chunk: Dict) -> Optional[Dict]:
+            return self.analyze_pr(
+                title=title,
+                author=author,
+                base_branch=base_branch,
+                head_branch=head_branch,
+                description=description,
+                diff=chunk['text'],
+                on_event=on_event,
+                deadline=deadline,
+                tenant=tenant,
+                priority=priority
+            )
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(analyze_chunk, chunks))
+    
+    def results_by_file(self, chunks: List[Dict], results: List[Optional[Dict]]) -> Dict[str, Dict]:
+        """
+        청크별 분석 결과를 파일별 결과로 나눔 (증분 분석에서 바뀌지 않은 파일의 결과를 이어 쓰기 위함)
+        
+        파일이 하나뿐인 청크는 결과 전체가 그 파일의 결과입니다.
+        여러 파일을 묶은 청크는 한 파일에 속한다고 알 수 있는 항목(위치가 그 파일인 위험 요소,
+        그 파일만 언급한 위험 요소/제안/장점)만 그 파일에 배정하고, 요약/평점/어느 파일인지 모르는 항목은
+        저장하지 않습니다. 그렇지 않으면 한 파일만 다시 분석했을 때 이미 고쳐진 내용이 다른 파일의 결과로 남습니다.
+        
+        Args:
+            chunks: 분석한 청크 ('files' 포함)
+            results: 청크별 분석 결과 (실패한 청크는 None)
             
-            # JSON 파싱
-            # 가끔 ```json ... ``` 형태로 올 수 있으므로 처리
-            content = content.strip()
-            if content.startswith('```json'):
-                content = content[7:]
-            if content.startswith('```'):
-                content = content[3:]
-            if content.endswith('```'):
-                content = content[:-3]
+        Returns:
+            Dict[str, Dict]: 파일 경로별 분석 결과
+        """
+        parts: Dict[str, List[Dict]] = {}
+        for chunk, result in zip(chunks, results):
+            if not result:
+                continue
+            files = chunk.get('files') or []
+            if len(files) == 1:
+                part = dict(result)
+                part.pop('usage', None)
+                parts.setdefault(files[0], []).append(part)
+                continue
             
-            analysis_result = json.loads(content.strip())
+            risks = [
+                (risk, self._risk_file(risk, files) or self._mentioned_file(risk.get('description'), files))
+                for risk in result.get('risks') or []
+            ]
+            suggestions = [
+                (suggestion, self._mentioned_file(
+                    f"{suggestion.get('description', '')} {suggestion.get('example', '')}", files
+                ))
+                for suggestion in result.get('suggestions') or []
+            ]
+            points = [(point, self._mentioned_file(point, files)) for point in result.get('positive_points') or []]
+            for path in files:
+                parts.setdefault(path, []).append({
+                    'summary': '',
+                    'risks': [risk for risk, owner in risks if owner == path],
+                    'suggestions': [suggestion for suggestion, owner in suggestions if owner == path],
+                    'positive_points': [point for point, owner in points if owner == path],
+                    'overall_rating': 'N/A',
+                    'model_routes': result.get('model_routes') or [],
+                    'models': result.get('models') or []
+                })
+        
+        return {path: self.merge_analyses(file_parts) for path, file_parts in parts.items()}
+    
+    def merge_file_results(
+        self,
+        previous: Dict[str, Dict],
+        updated: Dict[str, Dict],
+        deleted: List[str] = (),
+        renamed: Dict[str, str] = None,
+        changed: List[str] = ()
+    ) -> Dict[str, Dict]:
+        """
+        이전 파일별 결과에 새로 분석한 파일 결과를 합침 (증분 분석)
+        
+        다시 분석한 파일은 새 head의 전체 내용을 본 결과가 아니라 바뀐 부분을 본 결과이지만,
+        이전 결과의 위험 요소가 이미 고쳐졌을 수 있으므로 이전 결과를 합치지 않고 교체합니다.
+        이번 diff에 있었지만 새 결과가 없는 파일(필터로 제외 등)의 이전 결과도 버립니다.
+        
+        Args:
+            previous: 이전 head의 파일별 결과
+            updated: 바뀐 파일만 새로 분석한 결과
+            deleted: 삭제된 파일 경로
+            renamed: 새 경로 → 이전 경로
+            changed: 이번 diff에 포함된 모든 파일 경로
             
-            print("✅ 분석 완료!")
-            return analysis_result
+        Returns:
+            Dict[str, Dict]: 새 head 기준 파일별 결과
+        """
+        merged = dict(previous)
+        for new_path, old_path in (renamed or {}).items():
+            if old_path in merged and new_path not in merged:
+                merged[new_path] = merged.pop(old_path)
+        for path in list(deleted) + list(changed):
+            merged.pop(path, None)
+        
+        for path, result in updated.items():
+            if path not in deleted:
+                merged[path] = result
+        return merged
+    
+    def combine_file_results(
+        self,
+        file_results: Dict[str, Dict],
+        chunks: List[Dict],
+        chunk_results: List[Optional[Dict]]
+    ) -> Optional[Dict]:
+        """
+        이번에 분석한 청크 결과와 이어 쓰는 파일별 결과를 PR 전체 분석 결과로 병합
+        
+        이번 청크에 포함된 파일은 청크 결과 전체(요약, 평점 포함)를 쓰고,
+        그 밖의 파일은 저장된 파일별 결과(results_by_file())만 씁니다.
+        
+        Args:
+            file_results: 파일 경로별 분석 결과 (merge_file_results() 결과)
+            chunks: 이번에 분석한 청크 ('files' 포함)
+            chunk_results: 이번에 분석한 청크별 결과 (실패한 청크는 None)
             
-        except requests.exceptions.RequestException as e:
-            print(f"❌ LLM API 요청 실패: {e}")
+        Returns:
+            Dict: 병합된 분석 결과 (결과가 하나도 없으면 None)
+        """
+        analysed = {path for chunk in chunks for path in chunk.get('files') or []}
+        carried = [result for path, result in file_results.items() if path not in analysed]
+        fresh = [result for result in chunk_results if result]
+        analysis = self.merge_analyses(
+            fresh + carried,
+            weights=[chunk['tokens'] for chunk, result in zip(chunks, chunk_results) if result] + [1] * len(carried)
+        )
+        if analysis is None:
             return None
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON 파싱 실패: {e}")
-            print(f"응답 내용: {content}")
+        
+        # 저장된 결과를 그대로 반환하는 경우가 있으므로 복사본에 안내 추가
+        analysis = {**analysis, 'risks': list(analysis.get('risks') or [])}
+        analysis.pop('usage', None)
+        failed = sum(1 for result in chunk_results if not result)
+        if failed:
+            analysis['risks'].append(self.chunk_failure_risk(len(chunk_results), failed))
+        return analysis
+    
+    @staticmethod
+    def chunk_failure_risk(total: int, failed: int) -> Dict:
+        """일부 청크 분석 실패 안내 항목"""
+        return {
+            "severity": "중간",
+            "category": "시스템",
+            "description": f"{total}개 구간 중 {failed}개 구간 분석 실패 - 해당 부분은 수동 리뷰가 필요합니다.",
+            "location": "N/A"
+        }
+    
+    @staticmethod
+    def _risk_file(risk: Dict, files: List[str]) -> Optional[str]:
+        # "src/app.py:12", "app.py:12-20" 형태의 위치에서 청크 안의 파일 찾기
+        location = str(risk.get('location') or '').strip().strip('`')
+        path = location.split(':', 1)[0].strip()
+        if not path or path == 'N/A':
             return None
-        except Exception as e:
-            print(f"❌ 예상치 못한 오류: {e}")
+        for file in files:
+            if file == path or file.endswith('/' + path):
+                return file
+        return None
+    
+    @staticmethod
+    def _mentioned_file(text: Any, files: List[str]) -> Optional[str]:
+        # 설명에 청크 안의 파일이 하나만 언급된 경우 그 파일 (경로 또는 파일 이름)
+        text = str(text or '')
+        mentioned = [
+            file for file in files
+            if any(
+                re.search(r'(?<![\w./-])' + re.escape(name) + r'(?![\w-])', text)
+                for name in (file, file.rsplit('/', 1)[-1])
+            )
+        ]
+        return mentioned[0] if len(mentioned) == 1 else None
+    
+    def merge_analyses(
+        self,
+        results: List[Optional[Dict]],
+        weights: List[int] = None
+    ) -> Optional[Dict]:
+        """
+        청크별 분석 결과를 중복 제거/정렬하여 하나로 병합
+        
+        Args:
+            results: 청크별 분석 결과 (실패한 청크는 None)
+            weights: 평점 가중 평균에 쓸 청크별 가중치 (토큰 수 등)
+            
+        Returns:
+            Dict: 병합된 분석 결과 (모든 결과가 None이면 None)
+        """
+        weights = weights or [1] * len(results)
+        succeeded = [(r, w) for r, w in zip(results, weights) if r]
+        if not succeeded:
+            return None
+        if len(results) == 1:
+            return succeeded[0][0]
+        
+        risks = {}
+        suggestions = {}
+        positive_points = {}
+        summaries = []
+        model_routes = []
+        models = []
+        rating_sum = 0.0
+        rating_weight = 0
+        
+        for result, weight in succeeded:
+            summary = (result.get('summary') or '').strip()
+            if summary and summary not in summaries:
+                summaries.append(summary)
+            
+            for risk in result.get('risks') or []:
+                key = (risk.get('category', ''), self._normalize_text(risk.get('description', '')))
+                existing = risks.get(key)
+                if existing is None or self._rank(risk.get('severity'), self.SEVERITY_ORDER) < \
+                        self._rank(existing.get('severity'), self.SEVERITY_ORDER):
+                    risks[key] = risk
+            
+            for suggestion in result.get('suggestions') or []:
+                key = self._normalize_text(suggestion.get('description', ''))
+                existing = suggestions.get(key)
+                if existing is None or self._rank(suggestion.get('priority'), self.PRIORITY_ORDER) < \
+                        self._rank(existing.get('priority'), self.PRIORITY_ORDER):
+                    suggestions[key] = suggestion
+            
+            for point in result.get('positive_points') or []:
+                positive_points.setdefault(self._normalize_text(str(point)), point)
+            
+            for route_name in result.get('model_routes') or []:
+                if route_name not in model_routes:
+                    model_routes.append(route_name)
+            for model in result.get('models') or []:
+                if model not in models:
+                    models.append(model)
+            
+            rating = self._parse_rating(result.get('overall_rating'))
+            if rating is not None:
+                rating_sum += rating * weight
+                rating_weight += weight
+        
+        failed = len(results) - len(succeeded)
+        merged_risks = sorted(
+            risks.values(),
+            key=lambda r: self._rank(r.get('severity'), self.SEVERITY_ORDER)
+        )[:self.MAX_MERGED_ITEMS]
+        if failed:
+            merged_risks.append(self.chunk_failure_risk(len(results), failed))
+        
+        return {
+            "summary": " ".join(summaries),
+            "risks": merged_risks,
+            "suggestions": sorted(
+                suggestions.values(),
+                key=lambda s: self._rank(s.get('priority'), self.PRIORITY_ORDER)
+            )[:self.MAX_MERGED_ITEMS],
+            "positive_points": list(positive_points.values())[:self.MAX_MERGED_ITEMS],
+            "overall_rating": str(round(rating_sum / rating_weight)) if rating_weight else "N/A",
+            "model_routes": model_routes,
+            "models": models
+        }
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return re.sub(r'\s+', ' ', text).strip().lower()
+    
+    @staticmethod
+    def _rank(value: str, order: Dict[str, int]) -> int:
+        return order.get(value, len(order))
+    
+    @staticmethod
+    def _parse_rating(rating) -> Optional[float]:
+        # "7", 7, "7/10", "7점" 형태 모두 처리
+        match = re.search(r'\d+(\.\d+)?', str(rating or ''))
+        if not match:
             return None
+        value = float(match.group())
+        return value if 0 <= value <= 10 else None
     
     def create_fallback_analysis(self, error_message: str = None) -> Dict:
         """
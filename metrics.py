@@ -0,0 +1,257 @@
+"""
+프로세스 내 메트릭 수집 모듈 (Prometheus 텍스트 형식)
+
+외부 의존성 없이 카운터/게이지/히스토그램만 구현합니다. 관측은 잠금 하나와
+버킷 탐색(bisect)뿐이므로 요청 경로에서 호출해도 부담이 없습니다.
+값은 프로세스별로 집계되므로 여러 프로세스로 실행하면 프로세스마다 따로 수집해야 합니다.
+"""
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 기본 버킷
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+TOKEN_BUCKETS = (64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+RETRY_BUCKETS = (0, 1, 2, 3, 5)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    TYPE = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.TYPE}']
+
+
+class Counter(_Metric):
+    """누적 카운터"""
+
+    TYPE = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, **labels):
+        """값 지정 (다른 객체가 세고 있는 누적 값을 옮겨 올 때 사용)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """현재 값 게이지"""
+
+    TYPE = 'gauge'
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    TYPE = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수..., +Inf 개수, 합계]
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+
+        lines = self.header()
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), state[:-1]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(state[-1])}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    메트릭 목록과 조회 시점에 값을 채우는 콜백 관리
+
+    큐 길이나 캐시 적중 수처럼 다른 객체가 이미 세고 있는 값은 관측 코드를 추가하지 않고
+    add_collector()로 /metrics 조회 때만 읽어옵니다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]):
+        """
+        /metrics 조회 직전에 호출할 함수 등록
+
+        Args:
+            collector: 게이지/카운터 값을 채우는 함수 (예외는 무시)
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics.values())
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                pass
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+# 리뷰 단계
+REVIEW_STAGE_SECONDS = REGISTRY.histogram(
+    'pr_review_stage_seconds', 'PR 리뷰 단계별 소요 시간(초)', ('stage',)
+)
+REVIEW_SECONDS = REGISTRY.histogram(
+    'pr_review_duration_seconds', 'PR 리뷰 전체 소요 시간(초)', ('status',)
+)
+QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    'job_queue_wait_seconds', '실행 가능 시각부터 워커가 가져갈 때까지 대기 시간(초)', ('job_type',)
+)
+
+# 외부 API 호출 (GitHub/Upstage/Slack)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'http_client_request_seconds', '외부 API 응답 헤더 수신까지 걸린 시간(초)', ('service', 'method', 'status')
+)
+HTTP_REQUEST_BYTES = REGISTRY.histogram(
+    'http_client_request_bytes', '외부 API 요청 본문 크기(bytes)', ('service',), BYTE_BUCKETS
+)
+HTTP_RESPONSE_BYTES = REGISTRY.histogram(
+    'http_client_response_bytes', '외부 API 응답 본문 크기(bytes)', ('service',), BYTE_BUCKETS
+)
+HTTP_RETRIES = REGISTRY.histogram(
+    'http_client_retries', '요청 하나에 사용한 재시도 횟수', ('service',), RETRY_BUCKETS
+)
+
+# LLM 토큰
+LLM_TOKENS = REGISTRY.histogram(
+    'llm_request_tokens', 'LLM 요청 하나의 토큰 수', ('model', 'kind'), TOKEN_BUCKETS
+)
+LLM_SCHEDULER_WAIT_SECONDS = REGISTRY.histogram(
+    'llm_scheduler_wait_seconds', 'LLM 요청이 스케줄러 슬롯을 받기까지 기다린 시간(초)', ('priority',)
+)
+LLM_OUTPUT_REPAIRS = REGISTRY.counter(
+    'llm_output_repairs_total', '형식이 어긋난 LLM 응답의 복구 결과별 누적 횟수', ('method', 'result')
+)
+
+
+def observe_http(
+    service: str,
+    method: str,
+    status: int,
+    seconds: float,
+    request_bytes: Optional[int] = None,
+    response_bytes: Optional[int] = None,
+    retries: int = 0
+):
+    """
+    외부 API 요청 하나의 메트릭 기록
+
+    Args:
+        service: 'github' | 'upstage' | 'slack'
+        method: HTTP 메서드
+        status: 최종 응답 상태 코드
+        seconds: 응답 헤더 수신까지 걸린 시간
+        request_bytes: 요청 본문 크기 (알 수 없으면 None)
+        response_bytes: 응답 본문 크기 (스트리밍 등으로 알 수 없으면 None)
+        retries: 재시도 횟수
+    """
+    HTTP_REQUEST_SECONDS.observe(seconds, service=service, method=method, status=status)
+    HTTP_RETRIES.observe(retries, service=service)
+    if request_bytes is not None:
+        HTTP_REQUEST_BYTES.observe(request_bytes, service=service)
+    if response_bytes is not None:
+        HTTP_RESPONSE_BYTES.observe(response_bytes, service=service)
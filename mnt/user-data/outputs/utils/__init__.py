@@ -3,5 +3,6 @@ Utility 모듈
 """
 from .config import Config
 from .webhook_validator import verify_github_signature
+from .job_queue import JobQueue, WorkerPool
 
-__all__ = ['Config', 'verify_github_signature']
+__all__ = ['Config', 'verify_github_signature', 'JobQueue', 'WorkerPool']
@@ -0,0 +1,184 @@
+"""
+diff 특성에 따른 LLM 모델 라우팅 모듈
+
+작은 diff는 가벼운 모델로 빠르고 저렴하게, 크거나 보안에 민감한 diff는
+solar-pro로 분석하도록 설정 파일의 규칙에 따라 모델/max_tokens/temperature를 고릅니다.
+"""
+import fnmatch
+import json
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from utils.config import Config
+from utils.token_budget import get_token_counter
+
+logger = logging.getLogger(__name__)
+
+SECURITY_PATTERNS = [
+    '*auth*', '*login*', '*password*', '*secret*', '*token*', '*crypt*', '*secur*',
+    '*permission*', '*session*', '*.pem', '*.key', 'Dockerfile', '*.tf', '.github/workflows/*',
+]
+
+# 위에서부터 처음 일치하는 규칙 사용
+DEFAULT_RULES = [
+    {'name': 'security', 'when': {'paths': SECURITY_PATTERNS}, 'model': 'solar-pro', 'temperature': 0.2},
+    {'name': 'small', 'when': {'max_tokens': 1500, 'max_files': 3}, 'model': 'solar-mini', 'max_tokens': 1024},
+    {'name': 'default'},
+]
+
+
+class ModelRoute:
+    """라우팅 결과 (요청 하나에 쓸 모델 설정)"""
+
+    __slots__ = ('name', 'model', 'temperature', 'max_tokens')
+
+    def __init__(self, name: str, model: str, temperature: float, max_tokens: Optional[int] = None):
+        self.name = name
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'model': self.model,
+            'temperature': self.temperature,
+            'max_tokens': self.max_tokens
+        }
+
+
+def diff_features(diff: str, counter=None) -> Dict:
+    """
+    라우팅 조건 판정용 diff 특성 추출
+
+    Args:
+        diff: unified diff (청크 하나)
+        counter: 토큰 계산기 (기본값: get_token_counter())
+
+    Returns:
+        Dict: {'tokens', 'files': [경로], 'extensions': {확장자}}
+    """
+    files = []
+    for line in diff.split('\n'):
+        if line.startswith('diff --git ') and ' b/' in line:
+            files.append(line.split(' b/', 1)[1])
+
+    extensions = {path.rsplit('.', 1)[-1].lower() for path in files if '.' in path.rsplit('/', 1)[-1]}
+    return {
+        'tokens': (counter or get_token_counter()).count(diff),
+        'files': files,
+        'extensions': extensions
+    }
+
+
+class ModelRouter:
+    """
+    규칙 목록으로 요청별 모델을 고르는 라우터
+
+    규칙 형식 (JSON):
+        {"name": "small", "model": "solar-mini", "max_tokens": 1024, "temperature": 0.3,
+         "when": {"max_tokens": 1500, "max_files": 3}}
+
+    when 조건 (모두 만족해야 일치, 없으면 항상 일치):
+        min_tokens / max_tokens: diff 토큰 수 범위
+        min_files / max_files: 파일 수 범위
+        paths: 하나라도 일치해야 하는 경로 glob 목록
+        languages: 하나라도 포함해야 하는 확장자 목록 (예: ["py", "go"])
+    """
+
+    # 라우트별 요청 수 (동기/비동기 LLM 서비스 인스턴스가 함께 집계)
+    _counts: Dict[str, int] = {}
+    _counts_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rules: List[Dict] = None,
+        default_model: str = 'solar-pro',
+        default_temperature: float = 0.3
+    ):
+        """
+        Args:
+            rules: 라우팅 규칙 (기본값: DEFAULT_RULES)
+            default_model: 규칙에 model이 없을 때 쓸 모델
+            default_temperature: 규칙에 temperature가 없을 때 쓸 값
+        """
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        self.default_model = default_model
+        self.default_temperature = default_temperature
+
+    @classmethod
+    def from_config(cls, default_model: str, default_temperature: float) -> 'ModelRouter':
+        """
+        Config 설정으로 라우터 생성
+
+        LLM_ROUTING_ENABLED가 꺼져 있으면 모든 요청을 기본 모델로 보내는 규칙 하나만 씁니다.
+        LLM_ROUTES_FILE이 있으면 그 JSON 파일의 규칙 목록을 사용합니다.
+        """
+        if not Config.LLM_ROUTING_ENABLED:
+            rules = [{'name': 'default'}]
+        elif Config.LLM_ROUTES_FILE:
+            with open(Config.LLM_ROUTES_FILE, encoding='utf-8') as f:
+                rules = json.load(f)
+        else:
+            rules = DEFAULT_RULES
+        return cls(rules, default_model, default_temperature)
+
+    def route(self, diff: str) -> ModelRoute:
+        """
+        diff에 맞는 모델 선택
+
+        Args:
+            diff: 분석할 diff (청크 하나)
+
+        Returns:
+            ModelRoute: 선택된 라우트 (일치하는 규칙이 없으면 기본 모델)
+        """
+        features = diff_features(diff)
+        for rule in self.rules:
+            if self._matches(rule.get('when') or {}, features):
+                route = ModelRoute(
+                    name=rule.get('name', 'unnamed'),
+                    model=rule.get('model', self.default_model),
+                    temperature=rule.get('temperature', self.default_temperature),
+                    max_tokens=rule.get('max_tokens')
+                )
+                break
+        else:
+            route = ModelRoute('default', self.default_model, self.default_temperature)
+
+        with self._counts_lock:
+            self._counts[route.name] = self._counts.get(route.name, 0) + 1
+        logger.info(
+            f"🧭 모델 라우팅: {route.name} → {route.model} "
+            f"({features['tokens']} 토큰, {len(features['files'])}개 파일)"
+        )
+        return route
+
+    @staticmethod
+    def _matches(when: Dict, features: Dict) -> bool:
+        tokens = features['tokens']
+        file_count = len(features['files'])
+
+        if 'min_tokens' in when and tokens < when['min_tokens']:
+            return False
+        if 'max_tokens' in when and tokens > when['max_tokens']:
+            return False
+        if 'min_files' in when and file_count < when['min_files']:
+            return False
+        if 'max_files' in when and file_count > when['max_files']:
+            return False
+        if 'paths' in when and not any(
+            fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(path.rsplit('/', 1)[-1], pattern)
+            for path in features['files'] for pattern in when['paths']
+        ):
+            return False
+        if 'languages' in when and not features['extensions'] & {ext.lower() for ext in when['languages']}:
+            return False
+        return True
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """라우트별 요청 수"""
+        with cls._counts_lock:
+            return dict(cls._counts)
@@ -0,0 +1,307 @@
+"""
+외부 API 호출량 제어 모듈
+
+한도 상태는 키별 딕셔너리로 저장소(store)에 둡니다. 기본 MemoryStateStore는 프로세스 안에서만 유효하고,
+SharedStateStore는 SQLite 파일에 두어 같은 파일을 쓰는 모든 프로세스(gunicorn 워커, worker.py)가 한도를 나눠 씁니다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from utils.config import Config
+
+
+class RateLimitExceeded(Exception):
+    """남은 호출 한도가 없어 요청을 미뤄야 하는 경우"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"rate limit exhausted, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class MemoryStateStore:
+    """프로세스 메모리에 키별 한도 상태 보관"""
+
+    def __init__(self):
+        self._state: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def edit(self, key: str, create: Callable[[], Dict] = None) -> Iterator[Optional[Dict]]:
+        """
+        키의 상태를 잠근 채로 읽고 고침 (with 블록 안에서 바꾼 내용이 저장됨)
+
+        Args:
+            key: 한도를 구분하는 키
+            create: 상태가 없을 때 새 상태를 만드는 함수 (None이면 상태가 없을 때 None)
+        """
+        with self._lock:
+            state = self._state.get(key)
+            if state is None and create is not None:
+                state = self._state[key] = create()
+            yield state
+
+    def items(self) -> List[Tuple[str, Dict]]:
+        """(키 앞 4자리, 상태) 목록"""
+        with self._lock:
+            return [(key[:4], dict(state)) for key, state in self._state.items()]
+
+
+class SharedStateStore:
+    """
+    SQLite 파일에 키별 한도 상태(JSON) 보관
+
+    edit()는 BEGIN IMMEDIATE 트랜잭션 안에서 읽고 쓰므로 여러 프로세스가 동시에 고쳐도 차감이 사라지지 않습니다.
+    키(토큰, 웹훅 URL)는 해시만 저장합니다.
+    """
+
+    def __init__(self, db_path: str, namespace: str):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (한도를 나눠 쓸 프로세스는 같은 경로 사용)
+            namespace: 같은 파일을 쓰는 한도 종류 구분 (예: 'github', 'slack')
+        """
+        self.db_path = db_path
+        self.namespace = namespace
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)
+
+        클래스 속성으로 import 시점에 만들어지므로 파일과 테이블은 처음 연결할 때 만듭니다.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limits (
+                    namespace TEXT NOT NULL,
+                    key_hash TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key_hash)
+                )
+            """)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def edit(self, key: str, create: Callable[[], Dict] = None) -> Iterator[Optional[Dict]]:
+        """키의 상태를 트랜잭션 안에서 읽고 고침 (MemoryStateStore.edit() 참고)"""
+        key_hash = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT state FROM rate_limits WHERE namespace = ? AND key_hash = ?',
+                (self.namespace, key_hash)
+            ).fetchone()
+            state = json.loads(row['state']) if row is not None else (create() if create else None)
+            yield state
+            if state is not None:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO rate_limits (namespace, key_hash, label, state, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (self.namespace, key_hash, key[:4], json.dumps(state), time.time())
+                )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def items(self) -> List[Tuple[str, Dict]]:
+        """(키 앞 4자리, 상태) 목록"""
+        rows = self._connect().execute(
+            'SELECT label, state FROM rate_limits WHERE namespace = ?', (self.namespace,)
+        ).fetchall()
+        return [(row['label'], json.loads(row['state'])) for row in rows]
+
+
+def state_store(namespace: str):
+    """
+    설정에 맞는 한도 상태 저장소
+
+    Args:
+        namespace: 한도 종류 (예: 'github', 'slack')
+
+    Returns:
+        RATE_LIMIT_SHARED=true면 SharedStateStore, 아니면 MemoryStateStore
+    """
+    if Config.RATE_LIMIT_SHARED:
+        return SharedStateStore(Config.RATE_LIMIT_DB_PATH, namespace)
+    return MemoryStateStore()
+
+
+class RateLimitGovernor:
+    """
+    GitHub 스타일 X-RateLimit-* 헤더를 추적하는 토큰별 호출 한도 관리자
+
+    응답 헤더로 남은 한도와 초기화 시각을 갱신하고, 헤더 사이의 요청은
+    남은 한도를 직접 차감해 예측합니다. 남은 한도가 reserve 이하로 떨어지면
+    초기화까지 기다리거나(max_wait 이내) RateLimitExceeded로 요청을 미룹니다.
+    """
+
+    def __init__(self, reserve: int = 0, max_wait: float = 0, store=None):
+        """
+        Args:
+            reserve: 항상 남겨둘 호출 수 (다른 클라이언트/수동 작업용)
+            max_wait: 한도 소진 시 직접 기다릴 최대 시간(초), 넘으면 예외
+            store: 한도 상태 저장소 (기본값: 프로세스 단위 MemoryStateStore)
+        """
+        self.reserve_calls = reserve
+        self.max_wait = max_wait
+        self._store = store or MemoryStateStore()
+
+    def reserve(self, key: str) -> float:
+        """
+        요청 한 건을 위한 한도 확보
+
+        Args:
+            key: 한도를 구분하는 키 (예: 토큰)
+
+        Returns:
+            float: 요청 전에 기다려야 하는 시간(초), 0이면 바로 요청 가능
+
+        Raises:
+            RateLimitExceeded: 초기화까지 max_wait보다 오래 남은 경우
+        """
+        with self._store.edit(key) as state:
+            if state is None:
+                return 0
+
+            now = time.time()
+            if now >= state['reset_at']:
+                state['remaining'] = state['limit']
+                state['reset_at'] = now + 3600
+
+            if state['remaining'] > self.reserve_calls:
+                state['remaining'] -= 1
+                return 0
+
+            wait = state['reset_at'] - now
+
+        if wait <= self.max_wait:
+            return wait
+        raise RateLimitExceeded(wait)
+
+    def update(self, key: str, status_code: int, headers: Mapping[str, str]):
+        """
+        응답 헤더로 한도 상태 갱신
+
+        Args:
+            key: 한도를 구분하는 키
+            status_code: HTTP 상태 코드
+            headers: 응답 헤더
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit = headers.get('X-RateLimit-Limit')
+        reset = headers.get('X-RateLimit-Reset')
+        retry_after = headers.get('Retry-After')
+
+        def create() -> Dict:
+            return {'limit': 5000, 'remaining': 5000, 'reset_at': time.time() + 3600}
+
+        with self._store.edit(key, create) as state:
+            if limit and limit.isdigit():
+                state['limit'] = int(limit)
+            if remaining and remaining.isdigit():
+                state['remaining'] = int(remaining)
+            if reset and reset.isdigit():
+                state['reset_at'] = float(reset)
+
+            # secondary rate limit (403/429 + Retry-After)
+            if status_code in (403, 429) and retry_after and retry_after.isdigit():
+                state['remaining'] = 0
+                state['reset_at'] = time.time() + int(retry_after)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """키별 현재 한도 상태 (키는 앞 4자리만 노출)"""
+        return {
+            f"{label}…": {
+                'limit': state['limit'],
+                'remaining': state['remaining'],
+                'reset_in': max(int(state['reset_at'] - time.time()), 0)
+            }
+            for label, state in self._store.items()
+        }
+
+
+class TokenBucket:
+    """
+    키(웹훅 URL, 채널 등)별 토큰 버킷 송신 속도 제한기
+
+    초당 rate개씩 토큰이 차고 최대 capacity개까지 쌓이며, 메시지 하나에 토큰 하나를 씁니다.
+    상대 서버가 Retry-After로 거절하면 penalize()로 해당 키를 그 시간 동안 막습니다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, store=None):
+        """
+        Args:
+            rate: 초당 허용 메시지 수
+            capacity: 순간적으로 보낼 수 있는 최대 메시지 수 (burst)
+            store: 버킷 상태 저장소 (기본값: 프로세스 단위 MemoryStateStore)
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._store = store or MemoryStateStore()
+
+    def acquire(self, key: str, max_wait: float = None) -> float:
+        """
+        메시지 한 건을 위한 토큰 확보
+
+        기다려야 하는 시간이 max_wait 이하면 토큰을 미리 차감하고 그 시간을 반환합니다
+        (호출자는 그만큼 sleep 후 전송). max_wait를 넘으면 토큰을 차감하지 않습니다.
+
+        Args:
+            key: 송신 대상 키
+            max_wait: 토큰을 예약할 최대 대기 시간(초), None이면 제한 없음
+
+        Returns:
+            float: 전송 전 대기 시간(초)
+        """
+        with self._store.edit(
+            key, lambda: {'tokens': self.capacity, 'updated_at': time.time(), 'blocked_until': 0.0}
+        ) as state:
+            now = time.time()
+            tokens = min(self.capacity, state['tokens'] + (now - state['updated_at']) * self.rate)
+            state['tokens'] = tokens
+            state['updated_at'] = now
+
+            wait = max((1 - tokens) / self.rate if tokens < 1 else 0, state['blocked_until'] - now, 0)
+            if max_wait is not None and wait > max_wait:
+                return wait
+
+            state['tokens'] = tokens - 1
+            return wait
+
+    def penalize(self, key: str, delay: float):
+        """
+        Retry-After 응답을 받은 키를 delay초 동안 막음
+
+        Args:
+            key: 송신 대상 키
+            delay: 막을 시간(초)
+        """
+        with self._store.edit(
+            key, lambda: {'tokens': 0.0, 'updated_at': time.time(), 'blocked_until': 0.0}
+        ) as state:
+            now = time.time()
+            state['tokens'] = min(state['tokens'], 0.0)
+            state['updated_at'] = now
+            state['blocked_until'] = max(state['blocked_until'], now + delay)
@@ -0,0 +1,68 @@
+"""
+저장소 설정 파일 메모리 캐시 모듈
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class RepoFileCache:
+    """
+    (repo, ref, 경로) 단위로 저장소 파일 내용을 보관하는 LRU + TTL 캐시
+
+    .gitattributes처럼 리뷰마다 읽지만 거의 바뀌지 않는 파일용입니다.
+    파일이 없다는 결과(404)도 None으로 저장하여 다시 요청하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 300):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            ttl: 항목 유효 시간(초)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[str, str, str], Tuple[float, Optional[str]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, repo_full_name: str, ref: str, path: str) -> Tuple[bool, Optional[str]]:
+        """
+        파일 내용 조회
+
+        Returns:
+            Tuple[bool, Optional[str]]: (캐시 적중 여부, 파일 내용 (파일이 없으면 None))
+        """
+        key = (repo_full_name, ref or '', path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, repo_full_name: str, ref: str, path: str, content: Optional[str]):
+        """
+        파일 내용 저장
+
+        Args:
+            repo_full_name: 저장소 전체 이름
+            ref: 브랜치/커밋 SHA
+            path: 저장소 내 파일 경로
+            content: 파일 내용 (파일이 없으면 None)
+        """
+        key = (repo_full_name, ref or '', path)
+        with self._lock:
+            self._entries[key] = (time.time(), content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
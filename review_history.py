@@ -0,0 +1,302 @@
+"""
+리뷰 이력 저장 모듈 (SQLite 기반)
+
+분석이 끝날 때마다 PR/head/모델/단계별 소요 시간/토큰 수/분석 결과를 남깁니다.
+기록은 메모리 큐에 넣고 백그라운드 스레드가 묶어서 쓰므로 리뷰 처리 경로를 막지 않습니다.
+"""
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewHistoryStore:
+    """
+    리뷰 이력 저장소
+
+    - record(): 큐에 넣기만 하고 즉시 반환 (큐가 가득 차면 기록을 버리고 경고)
+    - 쓰기 스레드가 batch_size개 또는 flush_interval마다 한 트랜잭션으로 저장
+    - query(): (repo, created_at) 인덱스와 커서 기반 페이지로 행 수와 무관하게 빠르게 조회
+    """
+
+    # query() 결과에 항상 포함하는 컬럼 (analysis는 요청 시에만)
+    COLUMNS = (
+        'id', 'repo', 'pr_number', 'head_sha', 'models', 'status', 'incremental',
+        'timings', 'total_seconds', 'prompt_tokens', 'completion_tokens', 'error', 'created_at'
+    )
+    MAX_PAGE_SIZE = 500
+
+    def __init__(
+        self,
+        db_path: str = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+        max_pending: int = None
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: Config.REVIEW_HISTORY_DB_PATH)
+            batch_size: 한 번에 쓸 최대 기록 수
+            flush_interval: 기록을 모으는 최대 시간(초)
+            max_pending: 쓰기 대기 중인 최대 기록 수
+        """
+        self.db_path = db_path or Config.REVIEW_HISTORY_DB_PATH
+        self.batch_size = batch_size or Config.REVIEW_HISTORY_BATCH_SIZE
+        self.flush_interval = flush_interval or Config.REVIEW_HISTORY_FLUSH_INTERVAL
+        self._pending: 'queue.Queue[Optional[Tuple]]' = queue.Queue(
+            maxsize=max_pending or Config.REVIEW_HISTORY_MAX_PENDING
+        )
+        self._local = threading.local()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS reviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                repo TEXT NOT NULL,
+                pr_number INTEGER NOT NULL,
+                head_sha TEXT,
+                models TEXT,
+                status TEXT NOT NULL,
+                incremental INTEGER NOT NULL DEFAULT 0,
+                timings TEXT,
+                total_seconds REAL,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                analysis TEXT,
+                error TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_reviews_repo_created ON reviews (repo, created_at, id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_reviews_pr ON reviews (repo, pr_number, created_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_reviews_created ON reviews (created_at, id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_reviews_head ON reviews (head_sha)')
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def start(self):
+        """쓰기 스레드 시작"""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='review-history-writer', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """남은 기록을 모두 쓰고 쓰기 스레드 종료"""
+        if self._thread is None:
+            return
+        self._pending.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def record(
+        self,
+        pr_info: Dict,
+        status: str,
+        analysis: Dict = None,
+        timings: Dict[str, float] = None,
+        total_seconds: float = None,
+        error: str = None
+    ):
+        """
+        리뷰 이력 기록 (쓰기는 백그라운드에서 수행)
+
+        Args:
+            pr_info: PR 정보 딕셔너리
+            status: 'ok' | 'partial' | 'fallback' | 'error'
+            analysis: 분석 결과 (models/usage/incremental 필드 사용)
+            timings: 단계별 소요 시간(초)
+            total_seconds: 전체 소요 시간(초)
+            error: 실패 사유
+        """
+        analysis = analysis or {}
+        usage = analysis.get('usage') or {}
+        row = (
+            pr_info['repo'],
+            int(pr_info['number']),
+            pr_info.get('head_sha'),
+            ','.join(analysis.get('models') or []) or None,
+            status,
+            1 if analysis.get('incremental') else 0,
+            json.dumps(timings or {}),
+            total_seconds,
+            int(usage.get('prompt_tokens') or 0),
+            int(usage.get('completion_tokens') or 0),
+            json.dumps(analysis, ensure_ascii=False) if analysis else None,
+            error,
+            time.time()
+        )
+
+        self.start()
+        try:
+            self._pending.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("⚠️ 리뷰 이력 대기열이 가득 차 기록을 버림")
+
+    def _run(self):
+        while True:
+            batch: List[Tuple] = []
+            flushed: List[threading.Event] = []
+            stopping = False
+            item = self._pending.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    batch.append(item)
+                if stopping or flushed or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            for event in flushed:
+                event.set()
+            if stopping:
+                return
+
+    def _write(self, batch: List[Tuple]):
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT INTO reviews (repo, pr_number, head_sha, models, status, incremental, timings, '
+                'total_seconds, prompt_tokens, completion_tokens, analysis, error, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                batch
+            )
+            conn.execute('COMMIT')
+            self.written += len(batch)
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            self.dropped += len(batch)
+            logger.error(f"❌ 리뷰 이력 저장 실패 ({len(batch)}건): {e}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        지금까지 기록한 이력이 저장될 때까지 대기 (테스트/종료용)
+
+        Returns:
+            bool: 제한 시간 안에 저장되었는지 여부
+        """
+        self.start()
+        done = threading.Event()
+        self._pending.put(done)
+        return done.wait(timeout)
+
+    def query(
+        self,
+        repo: str = None,
+        since: float = None,
+        pr_number: int = None,
+        head_sha: str = None,
+        limit: int = 100,
+        cursor: str = None,
+        include_analysis: bool = False
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        리뷰 이력 조회 (created_at 오름차순)
+
+        Args:
+            repo: 저장소 전체 이름
+            since: 이 시각(unix timestamp) 이후 기록만
+            pr_number: PR 번호 (repo와 함께 사용)
+            head_sha: 특정 head의 기록만
+            limit: 최대 행 수 (MAX_PAGE_SIZE 이하)
+            cursor: 이전 페이지가 돌려준 next_cursor
+            include_analysis: 분석 결과 JSON 포함 여부
+
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (기록 목록, 다음 페이지 커서)
+
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
+        """
+        limit = max(1, min(int(limit), self.MAX_PAGE_SIZE))
+        columns = list(self.COLUMNS) + (['analysis'] if include_analysis else [])
+        conditions, params = [], []
+
+        if repo:
+            conditions.append('repo = ?')
+            params.append(repo)
+        if pr_number is not None:
+            conditions.append('pr_number = ?')
+            params.append(int(pr_number))
+        if head_sha:
+            conditions.append('head_sha = ?')
+            params.append(head_sha)
+        if since is not None:
+            conditions.append('created_at >= ?')
+            params.append(float(since))
+        if cursor:
+            # 커서: 마지막 행의 "created_at:id" (OFFSET 없이 다음 페이지를 인덱스로 바로 찾음)
+            created_at, row_id = cursor.split(':', 1)
+            conditions.append('(created_at > ? OR (created_at = ? AND id > ?))')
+            params.extend([float(created_at), float(created_at), int(row_id)])
+
+        sql = f"SELECT {', '.join(columns)} FROM reviews"
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY created_at, id LIMIT ?'
+        params.append(limit + 1)
+
+        rows = self._connect().execute(sql, params).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        reviews = []
+        for row in rows:
+            review = dict(row)
+            review['timings'] = json.loads(review['timings'] or '{}')
+            review['models'] = review['models'].split(',') if review['models'] else []
+            review['incremental'] = bool(review['incremental'])
+            if include_analysis:
+                review['analysis'] = json.loads(review['analysis']) if review['analysis'] else None
+            reviews.append(review)
+
+        next_cursor = f"{rows[-1]['created_at']!r}:{rows[-1]['id']}" if has_more else None
+        return reviews, next_cursor
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pending': self._pending.qsize(),
+            'written': self.written,
+            'dropped': self.dropped
+        }
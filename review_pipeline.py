@@ -0,0 +1,245 @@
+"""
+PR 리뷰 단계 공통 로직
+
+동기 파이프라인(app.process_pr_review)과 비동기 파이프라인(AsyncReviewEngine.process_pr_review)은
+GitHub/LLM/Slack 호출 방식만 다르고, 그 사이의 판단(증분 분석 여부, 필터링/청크 분할,
+결과 병합과 상태 결정, 증분 기준 저장 여부, 이력 기록)은 모두 이 모듈의 함수를 사용합니다.
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from utils.config import Config
+from utils.deadline import Deadline
+from utils.diff_chunker import split_files_into_chunks
+from utils.diff_filter import filter_diff_files
+from utils.diff_parser import DiffFile, DiffStats
+from utils.metrics import REVIEW_SECONDS
+from utils.review_history import ReviewHistoryStore
+from utils.timing import StageTimer
+
+logger = logging.getLogger(__name__)
+
+FETCH_DIFF_FAILED = "Failed to fetch PR diff"
+
+# 일부 구간을 분석하지 못했을 때 결과에 덧붙이는 위험 요소
+PARTIAL_REVIEW_RISK = {
+    "severity": "중간",
+    "category": "시스템",
+    "description": "PR이 너무 커서 일부 구간은 분석하지 못했습니다. 수동 리뷰가 필요합니다.",
+    "location": "N/A"
+}
+
+
+def review_key(pr_info: dict) -> str:
+    """PR 단위 키 (작업 병합과 증분 분석 기준에 사용)"""
+    return f"{pr_info['repo']}#{pr_info['number']}"
+
+
+def incremental_base(state: Optional[Dict], pr_info: dict) -> Optional[str]:
+    """
+    증분 분석 기준 head 결정
+
+    Args:
+        state: ReviewStateStore.get() 결과 (없으면 None)
+        pr_info: PR 정보 딕셔너리
+
+    Returns:
+        str: 이 커밋 이후 변경분만 분석 (전체 diff를 분석해야 하면 None)
+    """
+    if not state or state['head_sha'] == pr_info['head_sha']:
+        return None
+    if state['incremental_count'] >= Config.INCREMENTAL_MAX_PUSHES:
+        return None
+    return state['head_sha']
+
+
+def diff_changes(diff_files: List[DiffFile]) -> Dict:
+    """
+    바뀐/삭제/이름 변경된 파일 (증분 결과 병합용)
+
+    Returns:
+        Dict: {'changed': 모든 경로, 'deleted': 삭제된 경로, 'renamed': 새 경로 → 이전 경로}
+    """
+    return {
+        'changed': [f.path for f in diff_files],
+        'deleted': [f.path for f in diff_files if f.is_deleted],
+        'renamed': {f.path: f.old_path for f in diff_files if f.old_path != f.path}
+    }
+
+
+def plan_chunks(
+    diff_files: List[DiffFile],
+    gitattributes: Optional[str],
+    token_budget: int
+) -> Tuple[List[Dict], Dict]:
+    """
+    생성/vendored/바이너리 파일을 거르고 토큰 예산에 맞게 청크로 분할
+
+    Args:
+        diff_files: 파싱한 diff 파일 목록
+        gitattributes: 저장소의 .gitattributes 내용 (없으면 None)
+        token_budget: 청크 하나의 diff 토큰 예산
+
+    Returns:
+        Tuple[List[Dict], Dict]: (분석할 청크 (최대 Config.LLM_MAX_CHUNKS개),
+            분석 범위 {'skipped_chunks': 청크 수 제한으로 건너뛴 청크 수,
+                       'truncated_chunks': 긴 라인을 잘라낸 청크 수,
+                       'dropped_files': 분석할 청크에 하나도 들어가지 못한 파일 경로})
+    """
+    diff_files, _ = filter_diff_files(diff_files, gitattributes)
+    chunks = split_files_into_chunks(diff_files, token_budget)
+    skipped = max(len(chunks) - Config.LLM_MAX_CHUNKS, 0)
+    if skipped:
+        logger.warning(f"⚠️ 청크 수 제한 초과: {len(chunks)}개 중 {Config.LLM_MAX_CHUNKS}개만 분석")
+        chunks = chunks[:Config.LLM_MAX_CHUNKS]
+
+    covered = {path for chunk in chunks for path in chunk['files']}
+    dropped = [f.path for f in diff_files if f.path not in covered]
+    if dropped:
+        logger.warning(f"⚠️ 분석하지 못한 파일 {len(dropped)}개: {', '.join(dropped[:10])}")
+    coverage = {
+        'skipped_chunks': skipped,
+        'truncated_chunks': sum(1 for chunk in chunks if chunk.get('truncated')),
+        'dropped_files': dropped
+    }
+    return chunks, coverage
+
+
+def has_gaps(coverage: Dict, diff_stats: DiffStats) -> bool:
+    """diff 크기 제한, 청크 수 제한, 토큰 예산 때문에 빠지거나 잘린 구간이 있는지 여부"""
+    return bool(
+        diff_stats.truncated or coverage['skipped_chunks']
+        or coverage['truncated_chunks'] or coverage['dropped_files']
+    )
+
+
+def partial_review_risk(coverage: Dict) -> Dict:
+    """일부 구간을 분석하지 못했을 때 결과에 덧붙이는 위험 요소"""
+    risk = dict(PARTIAL_REVIEW_RISK)
+    dropped = coverage['dropped_files']
+    if dropped:
+        names = ', '.join(dropped[:5]) + (f" 외 {len(dropped) - 5}개" if len(dropped) > 5 else '')
+        risk['description'] += f" (분석하지 못한 파일: {names})"
+    if coverage['truncated_chunks']:
+        risk['description'] += " 토큰 한도를 넘는 긴 라인은 잘라서 분석했습니다."
+    return risk
+
+
+def build_analysis(
+    llm_service,
+    chunks: List[Dict],
+    chunk_results: List[Optional[Dict]],
+    diff_stats: DiffStats,
+    coverage: Dict,
+    deadline: Deadline,
+    state: Optional[Dict] = None,
+    incremental: bool = False,
+    changes: Dict = None
+) -> Tuple[Dict, str, Optional[Dict]]:
+    """
+    청크별 결과를 최종 분석 결과로 합치고 리뷰 상태 결정
+
+    증분 분석이면 이전 head의 파일별 결과에서 이번 diff에 포함된 파일의 결과를 교체합니다.
+
+    Args:
+        llm_service: LLMService (또는 AsyncLLMService)
+        chunks: 분석한 청크
+        chunk_results: 청크별 분석 결과 (실패한 청크는 None)
+        diff_stats: diff 통계
+        coverage: plan_chunks()가 반환한 분석 범위
+        deadline: 작업 마감 시간 (fallback 사유 결정용)
+        state: 증분 분석 기준 상태
+        incremental: 증분 분석 여부
+        changes: diff_changes() 결과 (증분 분석일 때 필요)
+
+    Returns:
+        Tuple[Dict, str, Optional[Dict]]: (분석 결과, 'ok' | 'partial' | 'fallback',
+            다음 증분 분석용 파일별 결과 (증분 분석 비활성화면 None))
+    """
+    file_results = None
+    if Config.INCREMENTAL_REVIEW_ENABLED:
+        file_results = llm_service.results_by_file(chunks, chunk_results)
+        if incremental:
+            file_results = llm_service.merge_file_results(
+                state['file_results'],
+                file_results,
+                deleted=changes['deleted'],
+                renamed=changes['renamed'],
+                changed=changes['changed']
+            )
+        analysis = llm_service.combine_file_results(file_results, chunks, chunk_results)
+    else:
+        analysis = llm_service.merge_analyses(
+            chunk_results, weights=[chunk['tokens'] for chunk in chunks]
+        )
+
+    if incremental and analysis:
+        analysis['incremental'] = {'since': state['head_sha'], 'files': diff_stats.files}
+
+    if not analysis:
+        logger.warning("⚠️ LLM 분석 실패, fallback 사용")
+        analysis = llm_service.create_fallback_analysis(
+            "분석 시간 초과" if deadline.expired() else "LLM API 응답 실패"
+        )
+        review_status = 'fallback'
+    elif has_gaps(coverage, diff_stats):
+        analysis.setdefault('risks', []).append(partial_review_risk(coverage))
+        review_status = 'partial'
+    else:
+        review_status = 'ok' if all(chunk_results) else 'partial'
+    analysis['usage'] = llm_service.total_usage(chunk_results)
+    return analysis, review_status, file_results
+
+
+def next_incremental_count(
+    chunk_results: List[Optional[Dict]],
+    coverage: Dict,
+    diff_stats: DiffStats,
+    state: Optional[Dict],
+    incremental: bool
+) -> Optional[int]:
+    """
+    다음 push의 증분 분석 기준으로 저장할 연속 증분 횟수
+
+    Returns:
+        int: 저장할 incremental_count (기준을 지워야 하면 None)
+    """
+    # 모든 구간을 빠짐없이 (잘라내지 않고) 분석한 경우에만 기준으로 사용
+    if not all(chunk_results) or has_gaps(coverage, diff_stats):
+        return None
+    return state['incremental_count'] + 1 if incremental else 0
+
+
+def record_review(
+    review_history: Optional[ReviewHistoryStore],
+    pr_info: dict,
+    status: str,
+    analysis: dict = None,
+    timer: StageTimer = None,
+    error: str = None
+):
+    """
+    리뷰 결과를 메트릭과 이력 저장소에 기록 (이력 저장소가 없으면 메트릭만)
+
+    이력은 큐에 넣기만 하므로 이벤트 루프에서 호출해도 됩니다.
+
+    Args:
+        review_history: 리뷰 이력 저장소
+        pr_info: PR 정보 딕셔너리
+        status: 'ok' | 'partial' | 'fallback' | 'error'
+        analysis: 분석 결과
+        timer: 단계별 소요 시간
+        error: 실패 사유
+    """
+    if timer:
+        REVIEW_SECONDS.observe(timer.total(), status=status)
+    if review_history is None:
+        return
+    review_history.record(
+        pr_info,
+        status,
+        analysis=analysis,
+        timings=timer.timings if timer else None,
+        total_seconds=timer.total() if timer else None,
+        error=error
+    )
@@ -0,0 +1,101 @@
+"""
+PR별 마지막 분석 상태 저장 모듈 (SQLite 기반)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.config import Config
+
+
+class ReviewStateStore:
+    """
+    PR 키 → 마지막으로 분석한 head SHA와 파일별 분석 결과
+
+    새 push가 오면 이전 head 이후 바뀐 파일만 다시 분석하고 나머지 파일은
+    저장된 결과를 그대로 쓰기 위해 사용합니다.
+    """
+
+    def __init__(self, db_path: str = None, ttl: float = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: Config.REVIEW_STATE_DB_PATH)
+            ttl: 마지막 분석 후 상태를 보관할 시간(초) (기본값: Config.REVIEW_STATE_TTL)
+        """
+        self.db_path = db_path or Config.REVIEW_STATE_DB_PATH
+        self.ttl = ttl if ttl is not None else Config.REVIEW_STATE_TTL
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect().execute("""
+            CREATE TABLE IF NOT EXISTS review_state (
+                pr_key TEXT PRIMARY KEY,
+                head_sha TEXT NOT NULL,
+                file_results TEXT NOT NULL,
+                incremental_count INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, pr_key: str) -> Optional[Dict]:
+        """
+        PR의 마지막 분석 상태 조회
+
+        Args:
+            pr_key: PR 키 (예: 'owner/repo#123')
+
+        Returns:
+            Dict: {'head_sha', 'file_results': {경로: 분석 결과}, 'incremental_count'}
+            (없거나 만료되면 None)
+        """
+        row = self._connect().execute(
+            'SELECT head_sha, file_results, incremental_count FROM review_state '
+            'WHERE pr_key = ? AND updated_at > ?',
+            (pr_key, time.time() - self.ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'head_sha': row[0],
+            'file_results': json.loads(row[1]),
+            'incremental_count': row[2]
+        }
+
+    def put(self, pr_key: str, head_sha: str, file_results: Dict[str, Dict], incremental_count: int = 0):
+        """
+        분석 상태 저장 (만료된 다른 PR 상태도 함께 정리)
+
+        Args:
+            pr_key: PR 키
+            head_sha: 분석한 head SHA
+            file_results: 파일 경로별 분석 결과
+            incremental_count: 마지막 전체 분석 이후 증분 분석 횟수
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO review_state '
+            '(pr_key, head_sha, file_results, incremental_count, updated_at) VALUES (?, ?, ?, ?, ?)',
+            (pr_key, head_sha, json.dumps(file_results, ensure_ascii=False), incremental_count, now)
+        )
+        conn.execute('DELETE FROM review_state WHERE updated_at <= ?', (now - self.ttl,))
+
+    def delete(self, pr_key: str):
+        """PR 분석 상태 삭제 (다음 push는 전체 분석)"""
+        self._connect().execute('DELETE FROM review_state WHERE pr_key = ?', (pr_key,))
@@ -0,0 +1,236 @@
+"""
+Slack 송신 디스패처 모듈
+
+리뷰 결과와 에러 알림을 영속 outbox(JobQueue)에 넣고, 전용 워커가
+대상(웹훅/채널)별 속도 제한과 Retry-After를 지키며 전송합니다.
+"""
+import logging
+import os
+import time
+import uuid
+from typing import Dict
+
+import requests
+
+from utils.config import Config
+from utils.http_client import get_session
+from utils.job_queue import JobQueue, RetryLater, WorkerPool
+from utils.rate_limit import TokenBucket, state_store
+from services.slack_service import SlackService
+
+logger = logging.getLogger(__name__)
+
+
+class SlackDispatcher:
+    """
+    Slack 메시지 outbox와 전송 워커
+
+    - 대상별 토큰 버킷으로 송신 속도 제한 (웹훅은 초당 1건 수준)
+    - 429 응답은 Retry-After만큼 대상을 막고 작업을 연기, 그 외 실패는 backoff 후 재시도
+    - 다이제스트 모드에서는 창(window) 안에 들어온 리뷰를 하나의 Block Kit 메시지로 묶음
+    - 최종 실패한 메시지는 outbox에 dead 상태와 오류로 남음
+    """
+
+    REVIEW_JOB = 'slack_review'
+    DIGEST_JOB = 'slack_digest'
+    ERROR_JOB = 'slack_error'
+    PLACEHOLDER_JOB = 'slack_placeholder'
+
+    # 이보다 오래 기다려야 하면 워커를 붙잡지 않고 작업을 연기
+    MAX_INLINE_WAIT = 2.0
+
+    def __init__(
+        self,
+        slack_service: SlackService,
+        outbox: JobQueue = None,
+        limiter: TokenBucket = None,
+        digest_window: float = None,
+        concurrency: int = None
+    ):
+        """
+        Args:
+            slack_service: 메시지 포맷팅/봇 API 전송에 쓸 Slack 서비스
+            outbox: 전송 대기 큐 (기본값: Config.SLACK_OUTBOX_DB_PATH의 JobQueue)
+            limiter: 대상별 송신 속도 제한기 (기본값: Config.SLACK_RATE_LIMIT/SLACK_RATE_BURST,
+                RATE_LIMIT_SHARED=true면 모든 프로세스의 디스패처가 버킷을 나눠 씀)
+            digest_window: 다이제스트로 묶을 시간(초), 0이면 PR마다 개별 전송
+            concurrency: 전송 워커 수 (기본값: Config.SLACK_DISPATCH_WORKERS)
+        """
+        self.slack_service = slack_service
+        self.outbox = outbox or JobQueue(
+            db_path=Config.SLACK_OUTBOX_DB_PATH,
+            max_attempts=Config.SLACK_OUTBOX_MAX_ATTEMPTS
+        )
+        self.limiter = limiter or TokenBucket(
+            Config.SLACK_RATE_LIMIT, Config.SLACK_RATE_BURST, store=state_store('slack')
+        )
+        self.digest_window = digest_window if digest_window is not None else Config.SLACK_DIGEST_WINDOW
+        if self.digest_window and slack_service.progressive:
+            logger.warning("⚠️ 진행 상황 메시지 모드에서는 다이제스트를 사용하지 않습니다")
+            self.digest_window = 0
+
+        self.pool = WorkerPool(
+            self.outbox,
+            self._handle,
+            concurrency=concurrency or Config.SLACK_DISPATCH_WORKERS
+        )
+        self._worker_id = f"{os.getpid()}-slack-{uuid.uuid4().hex[:6]}"
+
+    @property
+    def session(self):
+        """웹훅 전송용 세션 (429/5xx 재시도는 outbox가 담당하므로 세션 자체 재시도는 끔)"""
+        return get_session('slack_outbox', max_retries=0)
+
+    def start(self):
+        """전송 워커 시작"""
+        self.pool.start()
+
+    def stop(self, timeout: float = None):
+        """전송 워커 중지"""
+        self.pool.stop(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """outbox 상태별 메시지 수"""
+        return self.outbox.stats()
+
+    def send_pr_review(self, pr_info: Dict, analysis: Dict, pr_url: str) -> bool:
+        """
+        PR 리뷰 결과를 전송 대기열에 추가
+
+        Returns:
+            bool: 대기열 추가 성공 여부 (실제 전송은 워커가 수행)
+        """
+        payload = {'pr_info': pr_info, 'analysis': analysis, 'pr_url': pr_url}
+        if self.digest_window:
+            self.outbox.enqueue(self.DIGEST_JOB, payload, delay=self.digest_window)
+        else:
+            self.outbox.enqueue(self.REVIEW_JOB, payload)
+        self.pool.notify()
+        return True
+
+    def send_placeholder(self, pr_info: Dict) -> bool:
+        """
+        리뷰 대기 중 진행 상황 메시지를 전송 대기열에 추가 (진행 상황 모드에서만)
+
+        webhook 요청 안에서 Slack을 호출하지 않도록 outbox를 거치며,
+        같은 PR의 아직 보내지 않은 대기 메시지는 하나로 합칩니다.
+
+        Returns:
+            bool: 대기열 추가 여부 (진행 상황 모드가 아니면 False)
+        """
+        if not self.slack_service.progressive:
+            return False
+        self.outbox.enqueue(
+            self.PLACEHOLDER_JOB,
+            {'pr_info': pr_info, 'queued_at': time.time()},
+            coalesce_key=f"placeholder:{SlackService.pr_message_key(pr_info)}"
+        )
+        self.pool.notify()
+        return True
+
+    def send_error_notification(self, error_message: str, pr_url: str = None) -> bool:
+        """
+        에러 알림을 전송 대기열에 추가 (다이제스트로 묶지 않음)
+
+        Returns:
+            bool: 대기열 추가 성공 여부
+        """
+        self.outbox.enqueue(self.ERROR_JOB, {'error_message': error_message, 'pr_url': pr_url})
+        self.pool.notify()
+        return True
+
+    def _handle(self, job: Dict) -> bool:
+        job_type = job['job_type']
+        payload = job['payload']
+
+        if job_type == self.DIGEST_JOB:
+            return self._deliver_digest(job)
+
+        if job_type == self.PLACEHOLDER_JOB:
+            self._throttle(f"channel:{self.slack_service.channel}")
+            return self.slack_service.post_placeholder(payload['pr_info'], payload.get('queued_at'))
+
+        if job_type == self.REVIEW_JOB:
+            if self.slack_service.progressive:
+                # 진행 상황 메시지를 최종 결과로 갱신 (봇 API)
+                self._throttle(f"channel:{self.slack_service.channel}")
+                return self.slack_service.send_pr_review(**payload)
+            message = self.slack_service.format_review_message(**payload)
+        elif job_type == self.ERROR_JOB:
+            message = self.slack_service.format_error_message(payload['error_message'], payload.get('pr_url'))
+        else:
+            logger.error(f"❌ 알 수 없는 Slack 작업 종류: {job_type}")
+            return True
+
+        return self._post_webhook(message)
+
+    def _deliver_digest(self, job: Dict) -> bool:
+        # 창 안에 쌓인 다른 리뷰도 함께 가져와 한 메시지로 전송 (헤더/안내 블록 2개 제외)
+        extra = self.outbox.claim_batch(
+            self._worker_id, self.DIGEST_JOB, SlackService.MAX_BLOCKS - 3
+        )
+        reviews = [job['payload']] + [other['payload'] for other in extra]
+
+        if len(reviews) == 1:
+            message = self.slack_service.format_review_message(**reviews[0])
+        else:
+            message = self.slack_service.format_digest_message(reviews)
+            logger.info(f"📦 리뷰 {len(reviews)}건을 다이제스트로 전송")
+
+        try:
+            success = self._post_webhook(message)
+        except RetryLater as e:
+            for other in extra:
+                self.outbox.defer(other, e.delay, str(e))
+            raise
+        except Exception as e:
+            for other in extra:
+                self.outbox.settle(other, False, str(e))
+            raise
+
+        for other in extra:
+            self.outbox.settle(other, success, None if success else 'digest delivery failed')
+        return success
+
+    def _throttle(self, key: str):
+        wait = self.limiter.acquire(key, max_wait=self.MAX_INLINE_WAIT)
+        if wait > self.MAX_INLINE_WAIT:
+            raise RetryLater(wait, f"Slack 송신 속도 제한 ({wait:.1f}초)")
+        if wait > 0:
+            time.sleep(wait)
+
+    def _post_webhook(self, message: Dict) -> bool:
+        """
+        웹훅으로 메시지 전송
+
+        Returns:
+            bool: 성공 여부 (False면 outbox가 backoff 후 재시도)
+
+        Raises:
+            RetryLater: 속도 제한에 걸렸거나 Slack이 429로 거절한 경우
+        """
+        key = f"webhook:{self.slack_service.webhook_url}"
+        self._throttle(key)
+
+        try:
+            response = self.session.post(
+                self.slack_service.webhook_url,
+                json=message,
+                timeout=self.slack_service.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"❌ Slack 메시지 전송 실패: {e}")
+            return False
+
+        if response.status_code == 429:
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else 1.0
+            self.limiter.penalize(key, delay)
+            raise RetryLater(delay, f"Slack 429, {delay:.0f}초 후 재시도")
+
+        if response.status_code >= 400:
+            logger.warning(f"❌ Slack 메시지 전송 실패 ({response.status_code}): {response.text[:200]}")
+            return False
+
+        logger.info("✅ Slack 메시지 전송 완료")
+        return True
@@ -0,0 +1,131 @@
+"""
+PR별 Slack 메시지 위치 저장 모듈 (SQLite 기반)
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from utils.config import Config
+
+
+class SlackMessageStore:
+    """
+    PR 키 → (채널, 메시지 ts) 매핑
+
+    PR당 하나의 메시지를 chat.update로 갱신하기 위해 사용하며,
+    재시작이나 여러 워커 프로세스 사이에서도 같은 메시지를 찾을 수 있도록 디스크에 저장합니다.
+    첫 게시는 claim()으로 빈 ts 행을 먼저 넣은(INSERT OR IGNORE) 스레드/프로세스 하나만 수행합니다.
+    """
+
+    # 첫 게시 중 프로세스가 죽어 남은 예약 행을 다른 프로세스가 가져갈 수 있게 되는 시간(초)
+    CLAIM_TIMEOUT = 60
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: Config.SLACK_MESSAGE_DB_PATH)
+        """
+        self.db_path = db_path or Config.SLACK_MESSAGE_DB_PATH
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect().execute("""
+            CREATE TABLE IF NOT EXISTS slack_messages (
+                pr_key TEXT PRIMARY KEY,
+                channel TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 반환 (fork 이후에는 부모 프로세스의 연결을 쓰지 않고 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, pr_key: str) -> Optional[Tuple[str, str]]:
+        """
+        PR 메시지 위치 조회
+
+        Args:
+            pr_key: PR 키 (예: 'owner/repo#123')
+
+        Returns:
+            Tuple[str, str]: (채널 ID, 메시지 ts), 없으면 None
+        """
+        row = self._connect().execute(
+            "SELECT channel, ts FROM slack_messages WHERE pr_key = ? AND ts != ''", (pr_key,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def updated_at(self, pr_key: str) -> Optional[float]:
+        """
+        PR 메시지를 마지막으로 게시/갱신한 시각
+
+        Returns:
+            float: unix timestamp (메시지가 없으면 None)
+        """
+        row = self._connect().execute(
+            "SELECT updated_at FROM slack_messages WHERE pr_key = ? AND ts != ''", (pr_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def claim(self, pr_key: str) -> bool:
+        """
+        PR 메시지 첫 게시 권한 획득
+
+        Args:
+            pr_key: PR 키
+
+        Returns:
+            bool: True면 호출한 쪽이 chat.postMessage 후 put() (실패 시 release())해야 함,
+                False면 이미 메시지가 있거나 다른 쪽이 게시 중
+        """
+        conn = self._connect()
+        now = time.time()
+        inserted = conn.execute(
+            "INSERT OR IGNORE INTO slack_messages (pr_key, channel, ts, updated_at) VALUES (?, '', '', ?)",
+            (pr_key, now)
+        ).rowcount
+        if inserted:
+            return True
+        # 게시 중 죽은 예약은 일정 시간 뒤 다시 가져감
+        return conn.execute(
+            "UPDATE slack_messages SET updated_at = ? WHERE pr_key = ? AND ts = '' AND updated_at < ?",
+            (now, pr_key, now - self.CLAIM_TIMEOUT)
+        ).rowcount == 1
+
+    def release(self, pr_key: str):
+        """
+        첫 게시에 실패했을 때 claim() 예약 해제
+
+        Args:
+            pr_key: PR 키
+        """
+        self._connect().execute(
+            "DELETE FROM slack_messages WHERE pr_key = ? AND ts = ''", (pr_key,)
+        )
+
+    def put(self, pr_key: str, channel: str, ts: str):
+        """
+        PR 메시지 위치 저장
+
+        Args:
+            pr_key: PR 키
+            channel: 채널 ID
+            ts: 메시지 ts
+        """
+        self._connect().execute(
+            'INSERT OR REPLACE INTO slack_messages (pr_key, channel, ts, updated_at) VALUES (?, ?, ?, ?)',
+            (pr_key, channel, ts, time.time())
+        )
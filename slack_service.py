@@ -2,16 +2,47 @@
 Slack 메시지 전송 서비스
 """
 import requests
-from typing import Dict, List
+import threading
+import time
+from typing import Any, Dict, List, Optional
 from utils.config import Config
+from utils.http_client import get_session
+from utils.slack_messages import SlackMessageStore
 
 
 class SlackService:
     """Slack API 연동 클래스"""
     
-    def __init__(self):
+    # 공유 세션/메트릭 이름
+    SERVICE_NAME = 'slack'
+    
+    # 기존 메시지를 갱신할 수 없어 새로 올려야 하는 chat.update 오류
+    STALE_MESSAGE_ERRORS = ('message_not_found', 'cant_update_message', 'channel_not_found')
+    
+    # Block Kit 제한
+    MAX_BLOCKS = 50
+    MAX_SECTION_TEXT = 3000
+    MAX_FIELD_TEXT = 2000
+    MAX_HEADER_TEXT = 150
+    MAX_FALLBACK_TEXT = 3000
+    
+    def __init__(self, message_store: Optional[SlackMessageStore] = None):
         self.webhook_url = Config.SLACK_WEBHOOK_URL
         self.bot_token = Config.SLACK_BOT_TOKEN
+        self.api_url = Config.SLACK_API_URL
+        self.channel = Config.SLACK_CHANNEL
+        self.timeout = (Config.HTTP_CONNECT_TIMEOUT, Config.SLACK_READ_TIMEOUT)
+        
+        # 봇 토큰과 채널이 있어야 chat.postMessage/chat.update 사용 가능
+        self.progressive = bool(Config.SLACK_PROGRESSIVE_UPDATES and self.bot_token and self.channel)
+        if self.progressive and message_store is None:
+            message_store = SlackMessageStore()
+        self.message_store = message_store
+    
+    @property
+    def session(self):
+        """프로세스 내 공유 keep-alive 세션"""
+        return get_session(self.SERVICE_NAME)
     
     def send_pr_review(
         self,
@@ -32,11 +63,18 @@ class SlackService:
         """
         message = self.format_review_message(pr_info, analysis, pr_url)
         
+        if self.progressive:
+            # 진행 상황 메시지를 최종 결과로 교체
+            success = self.upsert_pr_message(pr_info, message)
+            if success:
+                print("✅ Slack 메시지 전송 완료!")
+            return success
+        
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=message,
-                timeout=10
+                timeout=self.timeout
             )
             response.raise_for_status()
             print("✅ Slack 메시지 전송 완료!")
@@ -45,6 +83,183 @@ class SlackService:
             print(f"❌ Slack 메시지 전송 실패: {e}")
             return False
     
+    def api_call(self, method: str, payload: Dict) -> Optional[Dict]:
+        """
+        Slack Web API 호출 (봇 토큰 사용)
+        
+        Args:
+            method: API 메서드 (예: 'chat.postMessage')
+            payload: 요청 본문
+            
+        Returns:
+            Dict: 응답 JSON (요청 실패 시 None, Slack 오류는 'ok': False로 반환)
+        """
+        try:
+            response = self.session.post(
+                f"{self.api_url}/{method}",
+                headers={
+                    'Authorization': f'Bearer {self.bot_token}',
+                    'Content-Type': 'application/json; charset=utf-8'
+                },
+                json=payload,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"❌ Slack {method} 호출 실패: {e}")
+            return None
+        
+        if not result.get('ok'):
+            print(f"❌ Slack {method} 오류: {result.get('error')}")
+        return result
+    
+    @staticmethod
+    def pr_message_key(pr_info: Dict) -> str:
+        """PR당 메시지 하나를 찾기 위한 키"""
+        return f"{pr_info['repo']}#{pr_info['number']}"
+    
+    def upsert_pr_message(self, pr_info: Dict, message: Dict) -> bool:
+        """
+        PR 메시지가 이미 있으면 chat.update로 갱신하고, 없으면 새로 올림
+        
+        Args:
+            pr_info: PR 정보
+            message: Slack 메시지 페이로드 (blocks, text)
+            
+        Returns:
+            bool: 성공 여부
+        """
+        key = self.pr_message_key(pr_info)
+        location = self.message_store.get(key)
+        
+        if location:
+            channel, ts = location
+            result = self.api_call('chat.update', {'channel': channel, 'ts': ts, **message})
+            if result is None:
+                return False
+            if result.get('ok'):
+                self.message_store.put(key, channel, ts)
+                return True
+            if result.get('error') not in self.STALE_MESSAGE_ERRORS:
+                return False
+        elif not self.message_store.claim(key):
+            # 다른 스레드/프로세스가 첫 메시지를 올리는 중 (호출한 쪽이 나중에 다시 시도)
+            return False
+        
+        result = self.api_call('chat.postMessage', {'channel': self.channel, **message})
+        if not result or not result.get('ok'):
+            if not location:
+                self.message_store.release(key)
+            return False
+        self.message_store.put(key, result['channel'], result['ts'])
+        return True
+    
+    def post_placeholder(self, pr_info: Dict, queued_at: float = None) -> bool:
+        """
+        리뷰 대기 중 진행 상황 메시지 게시 (같은 PR의 새 push면 기존 메시지를 갱신)
+        
+        webhook 요청 안에서 호출하지 않고 SlackDispatcher.send_placeholder()로 outbox를 거쳐 전송합니다.
+        
+        Args:
+            pr_info: PR 정보
+            queued_at: 대기열에 넣은 시각 (그 뒤에 리뷰가 이미 메시지를 갱신했으면 덮어쓰지 않음)
+            
+        Returns:
+            bool: 성공 여부 (진행 상황 모드가 아니면 False)
+        """
+        if not self.progressive:
+            return False
+        updated_at = self.message_store.updated_at(self.pr_message_key(pr_info))
+        if queued_at and updated_at and updated_at > queued_at:
+            return True
+        return self.upsert_pr_message(
+            pr_info,
+            self.format_progress_message(pr_info, "⏳ PR 수신, 리뷰 대기 중")
+        )
+    
+    def start_progress(self, pr_info: Dict) -> 'ReviewProgress':
+        """
+        리뷰 한 건의 진행 상황 갱신 객체 생성
+        
+        Args:
+            pr_info: PR 정보
+            
+        Returns:
+            ReviewProgress: 진행 상황 모드가 아니면 아무것도 하지 않는 객체
+        """
+        return ReviewProgress(self, pr_info)
+    
+    def format_progress_message(self, pr_info: Dict, status: str, summary: str = None) -> Dict:
+        """
+        진행 상황 메시지 포맷팅
+        
+        Args:
+            pr_info: PR 정보
+            status: 현재 단계 설명
+            summary: 먼저 도착한 분석 요약 (선택사항)
+            
+        Returns:
+            Dict: Slack 메시지 페이로드
+        """
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "🔄 PR 리뷰 진행 중",
+                    "emoji": True
+                }
+            },
+            {
+                "type": "section",
+                "fields": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*📋 제목:*\n{pr_info.get('title', 'N/A')}"
+                    },
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*👤 작성자:*\n@{pr_info.get('author', 'unknown')}"
+                    }
+                ]
+            },
+            {
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": status}]
+            }
+        ]
+        
+        if summary:
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*📊 요약 (분석 중)*\n{summary}"
+                }
+            })
+        
+        if pr_info.get('url'):
+            blocks.append({
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {
+                            "type": "plain_text",
+                            "text": "🔗 PR 보기",
+                            "emoji": True
+                        },
+                        "url": pr_info['url']
+                    }
+                ]
+            })
+        
+        return self.fit_message({
+            "blocks": blocks,
+            "text": f"PR 리뷰 진행 중: {pr_info.get('title', 'N/A')}"
+        })
+    
     def format_review_message(
         self,
         pr_info: Dict,
@@ -122,6 +337,17 @@ class SlackService:
             }
         ]
         
+        # 증분 리뷰 안내
+        incremental = analysis.get('incremental')
+        if incremental:
+            blocks.append({
+                "type": "context",
+                "elements": [{
+                    "type": "mrkdwn",
+                    "text": f"🔁 `{incremental['since'][:7]}` 이후 바뀐 {incremental['files']}개 파일만 다시 분석했습니다 (나머지는 이전 결과)"
+                }]
+            })
+        
         # 위험 요소
         risks = analysis.get('risks', [])
         if risks:
@@ -139,13 +365,7 @@ class SlackService:
                 risk_text += "\n"
             
             blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": risk_text
-                }
-            })
+            blocks.extend(self.text_sections(risk_text))
         
         # 개선 제안
         suggestions = analysis.get('suggestions', [])
@@ -159,13 +379,7 @@ class SlackService:
                 suggestion_text += f"{emoji} *[{priority}]* {description}\n"
             
             blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": suggestion_text
-                }
-            })
+            blocks.extend(self.text_sections(suggestion_text))
         
         # 긍정적인 점
         positive_points = analysis.get('positive_points', [])
@@ -175,13 +389,7 @@ class SlackService:
                 positive_text += f"• {point}\n"
             
             blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": positive_text
-                }
-            })
+            blocks.extend(self.text_sections(positive_text))
         
         # PR 링크 버튼
         blocks.append({"type": "divider"})
@@ -201,9 +409,157 @@ class SlackService:
             ]
         })
         
-        return {
+        return self.fit_message({
             "blocks": blocks,
             "text": f"PR 리뷰: {pr_info.get('title', 'N/A')}"  # 알림용 fallback 텍스트
+        })
+    
+    def format_digest_message(self, reviews: List[Dict]) -> Dict:
+        """
+        여러 PR 리뷰를 하나의 메시지로 묶는 다이제스트 포맷팅
+        
+        Args:
+            reviews: {'pr_info', 'analysis', 'pr_url'} 딕셔너리 리스트
+            
+        Returns:
+            Dict: Slack 메시지 페이로드 (50블록을 넘는 PR은 개수만 표시)
+        """
+        severity_emoji = {"높음": "🔴", "중간": "🟡", "낮음": "🟢"}
+        
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"🔍 PR 리뷰 요약 ({len(reviews)}건)",
+                    "emoji": True
+                }
+            }
+        ]
+        
+        # 헤더 1개 + 마지막 '외 N건' 안내 1개를 남겨둠
+        max_items = self.MAX_BLOCKS - 2
+        for review in reviews[:max_items]:
+            pr_info = review['pr_info']
+            analysis = review['analysis']
+            
+            counts = {}
+            for risk in analysis.get('risks') or []:
+                severity = risk.get('severity', '낮음')
+                counts[severity] = counts.get(severity, 0) + 1
+            risk_line = " ".join(
+                f"{emoji} {counts[severity]}"
+                for severity, emoji in severity_emoji.items() if counts.get(severity)
+            ) or "위험 요소 없음"
+            
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        f"*<{review['pr_url']}|{pr_info.get('title', 'N/A')}>* · @{pr_info.get('author', 'unknown')}"
+                        f" · ⭐ {analysis.get('overall_rating', 'N/A')}/10 · {risk_line}\n"
+                        f"{analysis.get('summary', '')}"
+                    )
+                }
+            })
+        
+        if len(reviews) > max_items:
+            blocks.append({
+                "type": "context",
+                "elements": [{
+                    "type": "mrkdwn",
+                    "text": f"외 {len(reviews) - max_items}건은 각 PR에서 확인해주세요."
+                }]
+            })
+        
+        return self.fit_message({
+            "blocks": blocks,
+            "text": f"PR 리뷰 {len(reviews)}건"
+        })
+    
+    @classmethod
+    def text_sections(cls, text: str) -> List[Dict]:
+        """
+        긴 mrkdwn 텍스트를 section 글자 수 제한에 맞게 라인 단위로 나눔
+        
+        Args:
+            text: section 텍스트
+            
+        Returns:
+            List[Dict]: section 블록 리스트
+        """
+        limit = cls.MAX_SECTION_TEXT
+        parts = []
+        current = ""
+        for line in text.splitlines(keepends=True):
+            while len(line) > limit:
+                if current:
+                    parts.append(current)
+                    current = ""
+                parts.append(line[:limit])
+                line = line[limit:]
+            if len(current) + len(line) > limit:
+                parts.append(current)
+                current = ""
+            current += line
+        if current.strip():
+            parts.append(current)
+        
+        return [
+            {"type": "section", "text": {"type": "mrkdwn", "text": part}}
+            for part in parts
+        ]
+    
+    @classmethod
+    def fit_message(cls, message: Dict) -> Dict:
+        """
+        Block Kit 제한(블록 50개, 텍스트 길이)에 맞게 메시지 조정
+        
+        넘치는 블록은 잘라내고 '생략' 안내를 붙이되, 마지막 actions 블록(PR 링크 버튼)은 유지합니다.
+        
+        Args:
+            message: Slack 메시지 페이로드
+            
+        Returns:
+            Dict: 조정된 메시지 페이로드
+        """
+        def clip(text: str, limit: int) -> str:
+            return text if len(text) <= limit else text[:limit - 1] + "…"
+        
+        blocks = []
+        for block in message.get('blocks', []):
+            block = dict(block)
+            if block.get('type') == 'header':
+                block['text'] = {**block['text'], 'text': clip(block['text']['text'], cls.MAX_HEADER_TEXT)}
+            elif block.get('type') == 'section':
+                if 'text' in block:
+                    block['text'] = {**block['text'], 'text': clip(block['text']['text'], cls.MAX_SECTION_TEXT)}
+                if 'fields' in block:
+                    block['fields'] = [
+                        {**field, 'text': clip(field['text'], cls.MAX_FIELD_TEXT)}
+                        for field in block['fields'][:10]
+                    ]
+            elif block.get('type') == 'context':
+                block['elements'] = [
+                    {**element, 'text': clip(element['text'], cls.MAX_FIELD_TEXT)} if 'text' in element else element
+                    for element in block['elements'][:10]
+                ]
+            blocks.append(block)
+        
+        if len(blocks) > cls.MAX_BLOCKS:
+            tail = [blocks[-1]] if blocks[-1].get('type') == 'actions' else []
+            keep = cls.MAX_BLOCKS - 1 - len(tail)
+            omitted = len(blocks) - keep - len(tail)
+            blocks = blocks[:keep] + [{
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": f"… 메시지가 길어 {omitted}개 블록을 생략했습니다."}]
+            }] + tail
+        
+        return {
+            **message,
+            "blocks": blocks,
+            "text": clip(message.get('text', ''), cls.MAX_FALLBACK_TEXT)
         }
     
     def send_error_notification(self, error_message: str, pr_url: str = None) -> bool:
@@ -217,6 +573,31 @@ class SlackService:
         Returns:
             bool: 전송 성공 여부
         """
+        message = self.format_error_message(error_message, pr_url)
+        
+        try:
+            response = self.session.post(
+                self.webhook_url,
+                json=message,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 에러 알림 전송 실패: {e}")
+            return False
+    
+    def format_error_message(self, error_message: str, pr_url: str = None) -> Dict:
+        """
+        에러 알림 메시지 포맷팅
+        
+        Args:
+            error_message: 에러 메시지
+            pr_url: PR URL (선택사항)
+            
+        Returns:
+            Dict: Slack 메시지 페이로드
+        """
         blocks = [
             {
                 "type": "header",
@@ -251,19 +632,83 @@ class SlackService:
                 ]
             })
         
-        message = {
+        return self.fit_message({
             "blocks": blocks,
             "text": "PR 분석 중 오류 발생"
-        }
-        
-        try:
-            response = requests.post(
-                self.webhook_url,
-                json=message,
-                timeout=10
+        })
+
+
+class ReviewProgress:
+    """
+    리뷰 한 건의 진행 상황을 PR 메시지에 반영
+
+    단계 전환(diff 수신, 분석 시작)은 바로 갱신하고, 스트리밍 중 도착하는 항목은
+    Config.SLACK_UPDATE_INTERVAL 간격으로만 갱신하여 chat.update 호출 한도를 지킵니다.
+    LLM 청크 워커 여러 개에서 동시에 호출될 수 있습니다.
+    """
+
+    def __init__(self, slack_service: SlackService, pr_info: Dict):
+        self.slack_service = slack_service
+        self.pr_info = pr_info
+        self.enabled = slack_service.progressive
+        self.total_chunks = 0
+        self.summaries: List[str] = []
+        self.risk_count = 0
+        self._closed = False
+        self._last_update = 0.0
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+    def update(self, status: str, force: bool = True):
+        """
+        진행 상황 갱신
+
+        Args:
+            status: 현재 단계 설명
+            force: False면 최소 간격이 지나지 않았을 때 건너뜀
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            now = time.time()
+            if not force and now - self._last_update < Config.SLACK_UPDATE_INTERVAL:
+                return
+            self._last_update = now
+            summary = " ".join(self.summaries) or None
+        message = self.slack_service.format_progress_message(self.pr_info, status, summary)
+        with self._send_lock:
+            if not self._closed:
+                self.slack_service.upsert_pr_message(self.pr_info, message)
+
+    def close(self):
+        """최종 결과 전송 전에 호출 (진행 중인 갱신이 끝나길 기다린 뒤 이후 갱신 중단)"""
+        with self._send_lock:
+            self._closed = True
+
+    def analysis_started(self, total_chunks: int, diff_summary: str):
+        """LLM 분석 시작 단계 표시"""
+        self.total_chunks = total_chunks
+        self.update(f"📥 {diff_summary} · 🤖 {total_chunks}개 구간 분석 중")
+
+    def on_llm_event(self, key: str, value: Any):
+        """
+        스트리밍 분석 항목 수신 콜백 (LLMService.analyze_pr의 on_event)
+
+        Args:
+            key: 분석 결과 필드 이름
+            value: 완성된 값 또는 배열 항목
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if key == 'summary' and value:
+                self.summaries.append(str(value))
+            elif key == 'risks':
+                self.risk_count += 1
+            else:
+                return
+            status = (
+                f"🤖 분석 중 · 요약 {len(self.summaries)}/{self.total_chunks or 1}개 구간"
+                f" · 위험 요소 {self.risk_count}건 발견"
             )
-            response.raise_for_status()
-            return True
-        except requests.exceptions.RequestException as e:
-            print(f"❌ 에러 알림 전송 실패: {e}")
-            return False
+        self.update(status, force=False)
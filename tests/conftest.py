@@ -0,0 +1,17 @@
+"""
+테스트 공통 설정
+
+배포 시에는 모듈이 utils/, services/ 패키지 아래에 놓이므로
+저장소 루트를 두 패키지 경로로 등록해 같은 import 경로(utils.X, services.X)로 불러옵니다.
+"""
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for _name in ('utils', 'services'):
+    if _name not in sys.modules:
+        _package = types.ModuleType(_name)
+        _package.__path__ = [ROOT]
+        sys.modules[_name] = _package
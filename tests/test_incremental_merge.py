@@ -0,0 +1,116 @@
+"""
+증분 리뷰의 파일별 결과 분할/병합 테스트
+"""
+import pytest
+
+from utils.config import Config
+from services.llm_service import LLMService
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    monkeypatch.setattr(Config, 'ANALYSIS_CACHE_ENABLED', False)
+    return LLMService()
+
+
+def analysis(summary, risks=(), suggestions=(), rating='5'):
+    return {
+        'summary': summary,
+        'risks': list(risks),
+        'suggestions': list(suggestions),
+        'positive_points': [],
+        'overall_rating': rating
+    }
+
+
+def risk(description, location='N/A', severity='높음'):
+    return {'severity': severity, 'category': '보안', 'description': description, 'location': location}
+
+
+def suggestion(description):
+    return {'priority': '필수', 'description': description, 'example': ''}
+
+
+def texts(items):
+    return [item['description'] for item in items]
+
+
+def test_multi_file_chunk_keeps_only_attributable_findings(llm):
+    chunks = [{'files': ['src/a.py', 'src/b.py'], 'tokens': 100}]
+    result = analysis(
+        'a.py has SQL injection',
+        risks=[risk('SQL injection', 'src/a.py:10'), risk('b.py leaks a file handle'), risk('Missing tests')],
+        suggestions=[suggestion('Use parameterized queries in a.py'), suggestion('Add logging')]
+    )
+
+    by_file = llm.results_by_file(chunks, [result])
+
+    assert texts(by_file['src/a.py']['risks']) == ['SQL injection']
+    assert texts(by_file['src/a.py']['suggestions']) == ['Use parameterized queries in a.py']
+    assert texts(by_file['src/b.py']['risks']) == ['b.py leaks a file handle']
+    assert by_file['src/b.py']['suggestions'] == []
+    assert by_file['src/b.py']['summary'] == ''
+
+
+def test_single_file_chunk_keeps_whole_result(llm):
+    result = analysis('b.py refactor', risks=[risk('Missing tests')], suggestions=[suggestion('Add logging')])
+
+    by_file = llm.results_by_file([{'files': ['b.py'], 'tokens': 10}], [result])
+
+    assert by_file['b.py']['summary'] == 'b.py refactor'
+    assert texts(by_file['b.py']['risks']) == ['Missing tests']
+
+
+def test_reanalysing_one_file_drops_fixed_findings_from_siblings(llm):
+    first_chunks = [{'files': ['a.py', 'b.py'], 'tokens': 100}]
+    first = analysis(
+        'a.py has SQL injection',
+        risks=[risk('SQL injection', 'a.py:3'), risk('Unvalidated input reaches the query'),
+               risk('b.py swallows exceptions', 'b.py:7', '중간')],
+        suggestions=[suggestion('Use parameterized queries in a.py')],
+        rating='3'
+    )
+    stored = llm.results_by_file(first_chunks, [first])
+
+    # 다음 push에서 a.py만 고쳐 다시 분석
+    push_chunks = [{'files': ['a.py'], 'tokens': 40}]
+    push = analysis('a.py has SQL injection fixed', rating='8')
+    updated = llm.results_by_file(push_chunks, [push])
+    merged = llm.merge_file_results(stored, updated, changed=['a.py'])
+    combined = llm.combine_file_results(merged, push_chunks, [push])
+
+    assert texts(combined['risks']) == ['b.py swallows exceptions']
+    assert combined['suggestions'] == []
+    assert combined['summary'] == 'a.py has SQL injection fixed'
+    assert combined['overall_rating'] == '8'
+
+
+def test_combine_reports_failed_chunks(llm):
+    chunks = [{'files': ['a.py'], 'tokens': 10}, {'files': ['b.py'], 'tokens': 10}]
+    ok = analysis('a.py ok', rating='7')
+
+    combined = llm.combine_file_results(llm.results_by_file(chunks, [ok, None]), chunks, [ok, None])
+
+    assert combined['summary'] == 'a.py ok'
+    assert [r['category'] for r in combined['risks']] == ['시스템']
+
+
+def test_merge_file_results_handles_renames_deletes_and_filtered_files(llm):
+    previous = {
+        'old.py': analysis('old'),
+        'gone.py': analysis('gone'),
+        'filtered.py': analysis('filtered'),
+        'same.py': analysis('same')
+    }
+    updated = {'new.py': analysis('new')}
+
+    merged = llm.merge_file_results(
+        previous,
+        updated,
+        deleted=['gone.py'],
+        renamed={'new.py': 'old.py'},
+        changed=['new.py', 'gone.py', 'filtered.py']
+    )
+
+    assert sorted(merged) == ['new.py', 'same.py']
+    assert merged['new.py']['summary'] == 'new'
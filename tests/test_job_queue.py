@@ -0,0 +1,113 @@
+"""
+JobQueue 테스트 (claim 순서, lease 만료 후 재할당, 넘어간 작업의 뒤늦은 완료 처리)
+"""
+import time
+
+import pytest
+
+from utils.job_queue import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(
+        db_path=str(tmp_path / 'jobs.db'),
+        visibility_timeout=60,
+        max_attempts=3,
+        retry_backoff=0,
+        priority_aging=0
+    )
+
+
+def expire_lease(queue, job_id):
+    queue._connect().execute('UPDATE jobs SET lease_until = ? WHERE id = ?', (time.time() - 1, job_id))
+
+
+def status(queue, job_id):
+    return queue._connect().execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()['status']
+
+
+def test_claim_assigns_each_job_once(queue):
+    job_id = queue.enqueue('pr_review', {'n': 1})
+
+    job = queue.claim('w1')
+    assert job['id'] == job_id
+    assert job['worker_id'] == 'w1'
+    assert job['attempts'] == 1
+    assert queue.claim('w2') is None
+
+
+def test_claim_orders_by_priority_then_tenant_load(queue):
+    queue.enqueue('pr_review', {}, priority=1, tenant='big')
+    queue.enqueue('pr_review', {}, priority=1, tenant='big')
+    small = queue.enqueue('pr_review', {}, priority=1, tenant='small')
+    urgent = queue.enqueue('pr_review', {}, priority=0, tenant='big')
+
+    assert queue.claim('w1')['id'] == urgent
+    # big 저장소 작업이 이미 실행 중이므로 small이 먼저
+    assert queue.claim('w2')['id'] == small
+
+
+def test_coalesce_replaces_pending_payload(queue):
+    first = queue.enqueue('pr_review', {'sha': 'a'}, coalesce_key='repo#1')
+    second = queue.enqueue('pr_review', {'sha': 'b'}, coalesce_key='repo#1')
+
+    assert first == second
+    assert queue.claim('w1')['payload'] == {'sha': 'b'}
+
+
+def test_expired_lease_is_reclaimed(queue):
+    job_id = queue.enqueue('pr_review', {})
+    queue.claim('w1')
+    expire_lease(queue, job_id)
+
+    assert queue.recover_expired() == 1
+    job = queue.claim('w2')
+    assert job['id'] == job_id
+    assert job['attempts'] == 2
+
+
+def test_stale_complete_does_not_override_new_owner(queue):
+    job_id = queue.enqueue('pr_review', {})
+    stale = queue.claim('w1')
+    expire_lease(queue, job_id)
+    queue.recover_expired()
+    current = queue.claim('w2')
+
+    assert queue.complete(stale) is False
+    assert status(queue, job_id) == JobQueue.RUNNING
+
+    assert queue.complete(current) is True
+    assert status(queue, job_id) == JobQueue.DONE
+
+
+def test_stale_fail_and_defer_are_ignored(queue):
+    job_id = queue.enqueue('pr_review', {})
+    stale = queue.claim('w1')
+    expire_lease(queue, job_id)
+    queue.recover_expired()
+    current = queue.claim('w2')
+
+    assert queue.fail(stale, 'boom') is False
+    queue.defer(stale, 30)
+    row = queue._connect().execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+    assert row['status'] == JobQueue.RUNNING
+    assert row['worker_id'] == 'w2'
+    assert row['attempts'] == current['attempts']
+
+
+def test_settle_after_release_keeps_job_pending(queue):
+    job_id = queue.enqueue('pr_review', {})
+    job = queue.claim('w1')
+
+    assert queue.release(['w1']) == 1
+    queue.settle(job, True)
+    assert status(queue, job_id) == JobQueue.PENDING
+
+
+def test_fail_retries_then_dead(queue):
+    job_id = queue.enqueue('pr_review', {}, max_attempts=2)
+
+    assert queue.fail(queue.claim('w1'), 'first') is True
+    assert queue.fail(queue.claim('w1'), 'second') is False
+    assert status(queue, job_id) == JobQueue.DEAD
@@ -0,0 +1,49 @@
+"""
+json_repair.loads_tolerant 테스트
+"""
+import json
+
+import pytest
+
+from utils.json_repair import loads_tolerant
+
+
+def test_valid_json_needs_no_fixes():
+    assert loads_tolerant('{"a": 1}') == ({'a': 1}, [])
+
+
+def test_code_fence_and_surrounding_text_are_ignored():
+    assert loads_tolerant('```json\n{"a": 1}\n```') == ({'a': 1}, [])
+    assert loads_tolerant('Here you go: {"a": 1} thanks') == ({'a': 1}, [])
+
+
+def test_trailing_commas_are_dropped():
+    assert loads_tolerant('{"a": [1, 2,],}') == ({'a': [1, 2]}, ['trailing_comma'])
+
+
+def test_raw_control_characters_in_strings_are_escaped():
+    assert loads_tolerant('{"a": "line\nbreak"}') == ({'a': 'line\nbreak'}, ['control_char'])
+
+
+def test_truncated_string_value_is_closed():
+    assert loads_tolerant('{"summary": "long text cut') == ({'summary': 'long text cut'}, ['truncated'])
+
+
+def test_truncated_value_is_cut_after_last_complete_value():
+    data, fixes = loads_tolerant('{"risks": [{"d": "x"}, {"d": "y", "e": tr')
+
+    assert data == {'risks': [{'d': 'x'}, {'d': 'y'}]}
+    assert fixes == ['truncated']
+
+
+def test_mismatched_closer_inserts_missing_bracket_without_truncation():
+    assert loads_tolerant('{"risks": [1, 2}') == ({'risks': [1, 2]}, ['bracket'])
+
+
+def test_unopened_closer_is_dropped():
+    assert loads_tolerant('{"a": [1, 2]]}') == ({'a': [1, 2]}, ['bracket'])
+
+
+def test_unrepairable_text_raises_original_error():
+    with pytest.raises(json.JSONDecodeError):
+        loads_tolerant('not json')
@@ -0,0 +1,70 @@
+"""
+IncrementalJSONParser 테스트
+"""
+import json
+
+from utils.json_stream import IncrementalJSONParser
+
+DOC = {
+    'summary': '요약 "따옴표" 포함',
+    'risks': [{'severity': '높음', 'description': f'risk {n}', 'location': 'a.py:1'} for n in range(5)],
+    'suggestions': [],
+    'positive_points': ['good'],
+    'overall_rating': '7'
+}
+
+
+def feed_in_pieces(parser, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events += parser.feed(text[start:start + size])
+    return events
+
+
+def test_events_do_not_depend_on_chunk_boundaries():
+    text = '```json\n' + json.dumps(DOC, ensure_ascii=False) + '\n```'
+    for size in (1, 2, 7, 64, len(text)):
+        parser = IncrementalJSONParser()
+        events = feed_in_pieces(parser, text, size)
+
+        assert parser.complete
+        assert parser.text == text
+        assert parser.result() == DOC
+        assert [key for key, _ in events] == ['summary'] + ['risks'] * 5 + ['positive_points', 'overall_rating']
+
+
+def test_truncated_stream_keeps_completed_items():
+    text = json.dumps(DOC, ensure_ascii=False)
+    cut = text.index('risk 3') - 5
+    parser = IncrementalJSONParser()
+    feed_in_pieces(parser, text[:cut], 3)
+
+    assert not parser.complete
+    assert parser.result() == {'summary': DOC['summary'], 'risks': DOC['risks'][:3]}
+
+
+def test_broken_item_is_skipped():
+    parser = IncrementalJSONParser()
+    parser.feed('{"risks": [{"description": "ok"}, {"description": oops}, {"description": "ok2"}]}')
+
+    assert parser.result() == {'risks': [{'description': 'ok'}, {'description': 'ok2'}]}
+
+
+def test_malformed_key_marks_parser_failed():
+    parser = IncrementalJSONParser()
+    events = parser.feed('{"summary": "a", "bad\\x": 1, ')
+    events += parser.feed('"risks": [1]}')
+
+    assert parser.failed
+    assert events == [('summary', 'a')]
+    assert parser.text.endswith('"risks": [1]}')
+
+
+def test_pending_text_is_released_between_items():
+    parser = IncrementalJSONParser()
+    parser.feed('{"risks": [')
+    for n in range(100):
+        parser.feed(json.dumps({'description': 'x' * 100, 'n': n}) + ', ')
+
+    assert len(parser.result()['risks']) == 100
+    assert sum(len(chunk) for chunk in parser._pending) < 300
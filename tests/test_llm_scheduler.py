@@ -0,0 +1,170 @@
+"""
+LLMScheduler / LocalLimiter / SharedLimiter 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from utils.llm_limiter import LocalLimiter, SharedLimiter
+from utils.llm_scheduler import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, LLMScheduler, SchedulerTimeout
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'condition not met in time'
+        time.sleep(0.01)
+
+
+def start_waiters(scheduler, requests, order):
+    """(tenant, priority) 요청마다 acquire() 스레드를 하나씩 순서대로 대기시킴"""
+    threads = []
+    for n, (tenant, priority) in enumerate(requests):
+        def run(name=f"{tenant}{n}", tenant=tenant, priority=priority):
+            ticket = scheduler.acquire(tenant, priority, timeout=5)
+            order.append(name)
+            scheduler.release(ticket)
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda: len(scheduler._waiting) == n + 1)
+    return threads
+
+
+def test_local_limiter_caps_concurrency():
+    limiter = LocalLimiter(max_concurrency=2)
+    first, _ = limiter.try_acquire(0)
+    second, _ = limiter.try_acquire(0)
+
+    assert first and second
+    assert limiter.try_acquire(0) == (None, None)
+    limiter.release(first, 0)
+    assert limiter.try_acquire(0)[0]
+
+
+def test_local_limiter_waits_for_token_budget():
+    limiter = LocalLimiter(max_concurrency=4, tokens_per_minute=600)
+    lease, _ = limiter.try_acquire(600)
+
+    assert lease
+    lease, retry_in = limiter.try_acquire(60)
+    assert lease is None
+    assert 5 <= retry_in <= 6.1
+
+
+def test_throttle_halves_limit_and_pauses():
+    limiter = LocalLimiter(max_concurrency=8, rate_limit_pause=30)
+    lease, _ = limiter.try_acquire(0)
+    limiter.release(lease, 0, throttled=True)
+
+    stats = limiter.stats()
+    assert stats['limit'] == 4
+    assert stats['paused_for'] > 25
+    assert limiter.try_acquire(0)[0] is None
+
+
+def test_waiting_requests_are_granted_by_priority():
+    scheduler = LLMScheduler(max_concurrency=1, aging=0)
+    holder = scheduler.acquire('r', PRIORITY_NORMAL)
+    order = []
+    threads = start_waiters(scheduler, [('r', PRIORITY_LOW), ('r', PRIORITY_NORMAL), ('r', PRIORITY_HIGH)], order)
+
+    scheduler.release(holder)
+    for thread in threads:
+        thread.join(5)
+    assert order == ['r2', 'r1', 'r0']
+
+
+def test_busy_repository_does_not_starve_others():
+    scheduler = LLMScheduler(max_concurrency=1, aging=0)
+    holder = scheduler.acquire('big')
+    order = []
+    threads = start_waiters(scheduler, [('big', PRIORITY_NORMAL)] * 3 + [('small', PRIORITY_NORMAL)], order)
+
+    scheduler.release(holder)
+    for thread in threads:
+        thread.join(5)
+    assert order.index('small3') <= 1
+
+
+def test_try_acquire_does_not_jump_the_queue():
+    scheduler = LLMScheduler(max_concurrency=1, aging=0)
+    holder = scheduler.acquire('r')
+    assert scheduler.try_acquire('r') is None
+
+    order = []
+    threads = start_waiters(scheduler, [('r', PRIORITY_NORMAL)], order)
+    scheduler.release(holder)
+    # 슬롯이 비어도 대기 중이던 요청이 먼저
+    for thread in threads:
+        thread.join(5)
+    assert order == ['r0']
+    ticket = scheduler.try_acquire('r')
+    assert ticket is not None
+    scheduler.cancel(ticket)
+
+
+def test_acquire_times_out():
+    scheduler = LLMScheduler(max_concurrency=1)
+    scheduler.acquire('r')
+
+    with pytest.raises(SchedulerTimeout):
+        scheduler.acquire('r', timeout=0.1)
+    assert scheduler.stats()['timeouts'] == 1
+    assert scheduler.stats()['waiting']['normal'] == 0
+
+
+def test_shared_limiter_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'limiter.db')
+    first = SharedLimiter(path, max_concurrency=2)
+    second = SharedLimiter(path, max_concurrency=2)
+
+    lease_a, _ = first.try_acquire(0)
+    lease_b, _ = second.try_acquire(0)
+    assert lease_a and lease_b
+    assert first.try_acquire(0) == (None, None)
+
+    second.release(lease_b, 0)
+    assert first.try_acquire(0)[0] is not None
+
+
+def test_shared_limiter_throttle_pauses_every_instance(tmp_path):
+    path = str(tmp_path / 'limiter.db')
+    first = SharedLimiter(path, max_concurrency=4)
+    second = SharedLimiter(path, max_concurrency=4)
+
+    lease, _ = first.try_acquire(0)
+    first.release(lease, 0, throttled=True, retry_after=30)
+
+    lease, retry_in = second.try_acquire(0)
+    assert lease is None
+    assert retry_in > 25
+    assert second.stats()['limit'] == 2
+
+
+def test_shared_limiter_expires_abandoned_leases(tmp_path):
+    limiter = SharedLimiter(str(tmp_path / 'limiter.db'), max_concurrency=1, lease_ttl=0.1)
+    assert limiter.try_acquire(0)[0] is not None
+    assert limiter.try_acquire(0)[0] is None
+
+    time.sleep(0.2)
+    assert limiter.try_acquire(0)[0] is not None
+
+
+def test_scheduler_waiter_is_granted_after_release_in_other_process(tmp_path):
+    path = str(tmp_path / 'limiter.db')
+    web = LLMScheduler(limiter=SharedLimiter(path, max_concurrency=1))
+    worker = LLMScheduler(limiter=SharedLimiter(path, max_concurrency=1))
+    holder = web.acquire('r')
+
+    granted = []
+    thread = threading.Thread(target=lambda: granted.append(worker.acquire('r', timeout=5)), daemon=True)
+    thread.start()
+    time.sleep(0.3)
+    assert not granted
+
+    web.release(holder)
+    thread.join(5)
+    assert granted and granted[0].granted
+    assert worker.stats()['inflight_total'] == 1
@@ -0,0 +1,44 @@
+"""
+리뷰 단계별 소요 시간 측정 모듈
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+from utils.metrics import REVIEW_STAGE_SECONDS
+
+
+class StageTimer:
+    """
+    작업 하나의 단계별 소요 시간 기록
+
+    사용 예:
+        timer = StageTimer()
+        with timer.stage('diff'):
+            ...
+        timer.timings  # {'diff': 0.42}
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        블록 실행 시간을 name 단계에 누적하고 단계별 히스토그램에 기록 (예외가 나도 기록)
+
+        Args:
+            name: 단계 이름 (예: 'diff', 'llm', 'slack')
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            self.timings[name] = round(self.timings.get(name, 0.0) + elapsed, 3)
+            REVIEW_STAGE_SECONDS.observe(elapsed, stage=name)
+
+    def total(self) -> float:
+        """시작 후 경과 시간(초)"""
+        return round(time.monotonic() - self.started, 3)
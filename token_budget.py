@@ -0,0 +1,207 @@
+"""
+토큰 수 계산 및 프롬프트 예산 관리 모듈
+"""
+import fnmatch
+import logging
+from functools import lru_cache
+from typing import Optional
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ApproximateTokenCounter:
+    """
+    토크나이저 없이 쓰는 빠른 토큰 수 추정기
+
+    ASCII는 약 4글자당 1토큰, 한글 등 멀티바이트 문자는 글자당 1토큰으로 보고,
+    공백 없이 긴 라인(minified JS, base64 등)은 토큰화 효율이 낮으므로 더 높게 셉니다.
+    라인별 결과는 캐시되어 같은 라인이 반복되는 diff에서 다시 계산하지 않습니다.
+    """
+
+    # 공백 없이 이 길이를 넘는 라인은 minified/인코딩된 데이터로 간주
+    DENSE_LINE_LENGTH = 200
+
+    def count(self, text: str) -> int:
+        """
+        텍스트의 토큰 수 추정
+
+        Args:
+            text: 대상 텍스트
+
+        Returns:
+            int: 추정 토큰 수
+        """
+        if not text:
+            return 0
+        return sum(self.count_line(line) for line in text.split('\n'))
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def count_line(line: str) -> int:
+        """한 라인의 토큰 수 추정 (개행 1토큰 포함)"""
+        length = len(line)
+        if not length:
+            return 1
+
+        # UTF-8 바이트 수와 글자 수의 차이로 멀티바이트(대부분 3바이트) 문자 수 추정
+        multibyte = (len(line.encode('utf-8')) - length) // 2
+        ascii_chars = length - multibyte
+
+        if length > ApproximateTokenCounter.DENSE_LINE_LENGTH and ' ' not in line:
+            ascii_tokens = ascii_chars / 2.5
+        else:
+            ascii_tokens = ascii_chars / 4
+
+        return int(ascii_tokens + multibyte) + 1
+
+
+class TiktokenCounter:
+    """
+    tiktoken 기반 토큰 계산기 (선택 의존성)
+
+    Solar 토크나이저와 완전히 같지는 않지만 근사치보다 분포가 정확합니다.
+    """
+
+    def __init__(self, encoding: str = 'cl100k_base'):
+        import tiktoken
+        self._encoding = tiktoken.get_encoding(encoding)
+        self._count_line = lru_cache(maxsize=65536)(self._count_line_uncached)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return sum(self._count_line(line) for line in text.split('\n'))
+
+    def count_line(self, line: str) -> int:
+        return self._count_line(line)
+
+    def _count_line_uncached(self, line: str) -> int:
+        return len(self._encoding.encode(line, disallowed_special=())) + 1
+
+
+_counter = None
+
+
+def get_token_counter():
+    """
+    Config.TOKEN_COUNTER에 따른 토큰 계산기 반환
+
+    Returns:
+        ApproximateTokenCounter 또는 TiktokenCounter
+    """
+    global _counter
+    if _counter is None:
+        if Config.TOKEN_COUNTER == 'tiktoken':
+            try:
+                _counter = TiktokenCounter()
+            except ImportError:
+                logger.warning("⚠️ tiktoken이 설치되지 않아 근사 토큰 계산기를 사용합니다")
+                _counter = ApproximateTokenCounter()
+        else:
+            _counter = ApproximateTokenCounter()
+    return _counter
+
+
+# 파일 우선순위 (낮을수록 먼저 분석)
+PRIORITY_SOURCE = 0
+PRIORITY_TEST = 1
+PRIORITY_SUPPORT = 2
+PRIORITY_LOW = 3
+
+LOW_PRIORITY_PATTERNS = (
+    '*.lock', '*-lock.json', '*.lock.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'poetry.lock', 'Pipfile.lock', 'Cargo.lock', 'go.sum', 'composer.lock', 'Gemfile.lock',
+    '*.min.js', '*.min.css', '*.map', '*.snap', '*_pb2.py', '*.pb.go', '*.generated.*',
+    'dist/*', 'build/*', 'vendor/*', 'node_modules/*', '*/vendor/*', '*/node_modules/*',
+)
+TEST_PATTERNS = ('test_*', '*_test.*', '*.test.*', '*.spec.*', 'tests/*', '*/tests/*', '*/test/*')
+SUPPORT_PATTERNS = ('*.md', '*.rst', '*.txt', 'docs/*', '*.json', '*.yml', '*.yaml', '*.toml', '*.ini', '*.cfg')
+
+
+def file_priority(path: str) -> int:
+    """
+    diff 파일의 분석 우선순위
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        int: 소스(0) < 테스트(1) < 문서/설정(2) < lock/생성 파일(3)
+    """
+    name = path.rsplit('/', 1)[-1]
+
+    def matches(patterns) -> bool:
+        return any(fnmatch.fnmatch(path, p) or fnmatch.fnmatch(name, p) for p in patterns)
+
+    if matches(LOW_PRIORITY_PATTERNS):
+        return PRIORITY_LOW
+    if matches(TEST_PATTERNS):
+        return PRIORITY_TEST
+    if matches(SUPPORT_PATTERNS):
+        return PRIORITY_SUPPORT
+    return PRIORITY_SOURCE
+
+
+class PromptPacker:
+    """
+    모델 컨텍스트 윈도우 안에서 프롬프트와 응답 토큰을 배분
+
+    프롬프트 템플릿 자체의 토큰을 제외한 나머지를 diff와 응답이 나눠 쓰며,
+    응답 예산(max_tokens)은 diff 크기에 비례해 동적으로 정합니다.
+    """
+
+    def __init__(
+        self,
+        context_window: int = None,
+        min_response_tokens: int = None,
+        max_response_tokens: int = None,
+        counter=None
+    ):
+        """
+        Args:
+            context_window: 모델 컨텍스트 크기 (기본값: Config.LLM_CONTEXT_WINDOW)
+            min_response_tokens: 최소 응답 토큰 (기본값: Config.LLM_MIN_RESPONSE_TOKENS)
+            max_response_tokens: 최대 응답 토큰 (기본값: Config.LLM_MAX_RESPONSE_TOKENS)
+            counter: 토큰 계산기 (기본값: get_token_counter())
+        """
+        self.context_window = context_window or Config.LLM_CONTEXT_WINDOW
+        self.min_response_tokens = min_response_tokens or Config.LLM_MIN_RESPONSE_TOKENS
+        self.max_response_tokens = max_response_tokens or Config.LLM_MAX_RESPONSE_TOKENS
+        self.counter = counter or get_token_counter()
+
+    def diff_budget(self, prompt_overhead: int, limit: Optional[int] = None) -> int:
+        """
+        요청 하나에 넣을 수 있는 diff 토큰 수
+
+        Args:
+            prompt_overhead: diff를 제외한 프롬프트(시스템 + 템플릿 + PR 정보) 토큰 수
+            limit: 추가 상한 (예: 청크 크기 설정)
+
+        Returns:
+            int: diff 토큰 예산
+        """
+        budget = self.context_window - prompt_overhead - self.max_response_tokens
+        if limit:
+            budget = min(budget, limit)
+        return max(budget, 1)
+
+    def response_tokens(self, prompt_tokens: int, diff_tokens: int) -> int:
+        """
+        응답에 할당할 max_tokens 계산
+
+        작은 diff는 리뷰 항목이 적으므로 적게, 큰 diff는 많이 할당하되
+        컨텍스트 윈도우를 넘지 않도록 합니다.
+
+        Args:
+            prompt_tokens: 전체 프롬프트 토큰 수
+            diff_tokens: 그중 diff 토큰 수
+
+        Returns:
+            int: max_tokens
+        """
+        wanted = self.min_response_tokens + diff_tokens // 4
+        wanted = min(max(wanted, self.min_response_tokens), self.max_response_tokens)
+        available = self.context_window - prompt_tokens
+        return max(min(wanted, available), 1)
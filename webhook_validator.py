@@ -3,6 +3,15 @@ GitHub Webhook 서명 검증 모듈
 """
 import hmac
 import hashlib
+import re
+from typing import BinaryIO, Optional
+
+# 페이로드 맨 앞의 최상위 "action" 필드 (GitHub은 action을 첫 번째 키로 보냄)
+_LEADING_ACTION = re.compile(rb'^\s*\{\s*"action"\s*:\s*"([^"\\]{1,64})"')
+
+
+class PayloadTooLarge(Exception):
+    """요청 본문이 허용 크기를 넘은 경우"""
 
 
 def verify_github_signature(payload_body: bytes, signature_header: str, secret: str) -> bool:
@@ -36,3 +45,63 @@ def verify_github_signature(payload_body: bytes, signature_header: str, secret:
     
     # 타이밍 공격 방지를 위한 안전한 비교
     return hmac.compare_digest(expected_signature, github_signature)
+
+
+def scan_action(head: bytes) -> Optional[str]:
+    """
+    본문 앞부분에서 최상위 action 값을 파싱 없이 추출
+    
+    Args:
+        head: 요청 본문의 앞부분
+        
+    Returns:
+        str: action 값 (첫 번째 키가 action이 아니면 None → 전체 파싱 필요)
+    """
+    match = _LEADING_ACTION.match(head)
+    return match.group(1).decode('ascii', errors='replace') if match else None
+
+
+def read_signed_body(
+    stream: BinaryIO,
+    signature_header: str,
+    secret: str,
+    max_bytes: int,
+    head: bytes = b'',
+    chunk_size: int = 64 * 1024
+) -> Optional[bytes]:
+    """
+    본문을 청크 단위로 읽으면서 HMAC 계산 (본문 전체를 두 번 훑지 않음)
+    
+    Args:
+        stream: 요청 본문 스트림
+        signature_header: X-Hub-Signature-256 헤더 값
+        secret: Webhook Secret
+        max_bytes: 허용할 최대 본문 크기
+        head: 이미 읽은 본문 앞부분
+        chunk_size: 한 번에 읽을 크기
+        
+    Returns:
+        bytes: 서명이 유효하면 본문 전체 (유효하지 않으면 None)
+        
+    Raises:
+        PayloadTooLarge: 본문이 max_bytes를 넘는 경우 (그 시점에서 읽기 중단)
+    """
+    algorithm, _, github_signature = (signature_header or '').partition('=')
+    if algorithm != 'sha256' or not github_signature:
+        return None
+    
+    mac = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+    body = bytearray(head)
+    mac.update(head)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if len(body) + len(chunk) > max_bytes:
+            raise PayloadTooLarge(f"본문이 {max_bytes} bytes를 넘음")
+        mac.update(chunk)
+        body += chunk
+    
+    if not hmac.compare_digest(mac.hexdigest(), github_signature):
+        return None
+    return bytes(body)
@@ -0,0 +1,246 @@
+"""
+PR Review Agent - 큐 워커 프로세스 진입점
+
+HTTP 수신(gunicorn, PROCESS_ROLE=web)과 분리해서 작업 큐만 처리하는 프로세스를 실행합니다.
+감독 프로세스는 설정만 읽고 서비스는 만들지 않으며, fork된 워커 프로세스마다
+app 모듈을 새로 import해 HTTP 세션/SQLite 연결/스레드를 따로 만듭니다 (프로세스 간 공유 상태 없음).
+여러 프로세스는 같은 SQLite 큐 파일을 나눠 가져가므로 CPU 코어 수만큼 늘려 처리량을 높일 수 있습니다.
+
+사용법:
+    python worker.py                          # WORKER_PROCESSES개 (0이면 CPU 코어 수)
+    python worker.py --processes 4 --queues review
+    python worker.py --processes 1 --queues slack
+
+SIGTERM/SIGINT를 받으면 모든 워커에 SIGTERM을 전달하고, 워커는 새 작업을 가져가지 않은 채
+진행 중인 작업을 SHUTDOWN_GRACE_SECONDS 동안 마무리한 뒤 종료합니다.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Sequence
+
+from utils.config import Config
+
+logger = logging.getLogger('worker')
+
+# 워커가 연달아 죽을 때 재시작 간격(초)
+RESTART_BACKOFF = (1, 2, 5, 10, 30)
+# 이 시간 이상 살아 있었던 워커는 재시작 간격을 처음부터 다시 계산
+STABLE_SECONDS = 60
+
+
+def serve_metrics(port: int):
+    """
+    워커 프로세스의 메트릭을 별도 포트로 노출 (/metrics)
+
+    Args:
+        port: 수신 포트
+    """
+    from utils.metrics import REGISTRY
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = REGISTRY.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((Config.HOST, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='worker-metrics', daemon=True).start()
+    logger.info(f"📈 워커 메트릭: http://{Config.HOST}:{port}/metrics")
+
+
+def run_worker(index: int, queues: Sequence[str], grace: float):
+    """
+    워커 프로세스 본체 (fork 이후 실행)
+
+    Args:
+        index: 워커 번호 (메트릭 포트 계산에 사용)
+        queues: 처리할 큐 이름 목록
+        grace: SIGTERM 후 진행 중 작업 대기 시간(초)
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    # Ctrl+C는 감독 프로세스가 받아 SIGTERM으로 전달하므로 작업 도중 KeyboardInterrupt가 나지 않게 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # 큐 처리는 아래에서 직접 시작 (app import 시 자동 시작하지 않음)
+    Config.PROCESS_ROLE = 'worker'
+    import app as agent
+
+    if Config.WORKER_METRICS_PORT:
+        serve_metrics(Config.WORKER_METRICS_PORT + index)
+
+    agent.start_workers(queues)
+    logger.info(f"👷 워커 프로세스 #{index} 시작 (PID {os.getpid()}, 큐: {', '.join(queues)})")
+
+    stop.wait()
+    logger.info(f"🛑 워커 프로세스 #{index} 종료 중 (최대 {grace:.0f}초 대기)")
+    agent.shutdown(grace)
+
+
+class Supervisor:
+    """
+    워커 프로세스 감독
+
+    - 워커가 비정상 종료하면 점점 긴 간격으로 다시 띄움
+    - SIGTERM/SIGINT를 받으면 워커에 SIGTERM을 전달하고 종료를 기다림 (시간 초과 시 SIGKILL)
+    """
+
+    def __init__(self, processes: int, queues: Sequence[str], grace: float):
+        """
+        Args:
+            processes: 워커 프로세스 수
+            queues: 워커가 처리할 큐 이름 목록
+            grace: 워커별 진행 중 작업 대기 시간(초)
+        """
+        self.processes = processes
+        self.queues = tuple(queues)
+        self.grace = grace
+        self._context = multiprocessing.get_context('fork')
+        self._workers: Dict[int, multiprocessing.Process] = {}
+        self._started_at: Dict[int, float] = {}
+        self._failures: Dict[int, int] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = threading.Event()
+
+    def _spawn(self, index: int):
+        process = self._context.Process(
+            target=run_worker,
+            args=(index, self.queues, self.grace),
+            name=f"review-worker-process-{index}"
+        )
+        process.start()
+        self._workers[index] = process
+        self._started_at[index] = time.time()
+
+    def _reap(self):
+        """종료된 워커를 찾아 재시작 예약"""
+        now = time.time()
+        for index, process in list(self._workers.items()):
+            if process.is_alive():
+                continue
+            del self._workers[index]
+
+            if now - self._started_at[index] >= STABLE_SECONDS:
+                self._failures[index] = 0
+            failures = self._failures.get(index, 0)
+            delay = RESTART_BACKOFF[min(failures, len(RESTART_BACKOFF) - 1)]
+            self._failures[index] = failures + 1
+            self._restart_at[index] = now + delay
+            logger.error(
+                f"❌ 워커 프로세스 #{index} 종료 (exit code {process.exitcode}), {delay}초 후 재시작"
+            )
+
+    def _request_stop(self, signum, frame):
+        self._stopping.set()
+
+    def run(self) -> int:
+        """
+        워커를 띄우고 종료 신호를 받을 때까지 감독
+
+        Returns:
+            int: 프로세스 종료 코드
+        """
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        logger.info(
+            f"🚀 큐 워커 {self.processes}개 시작 (큐: {', '.join(self.queues)}, "
+            f"Pipeline: {Config.PIPELINE_MODE})"
+        )
+        for index in range(self.processes):
+            self._spawn(index)
+
+        while not self._stopping.wait(1):
+            self._reap()
+            now = time.time()
+            for index, restart_at in list(self._restart_at.items()):
+                if now >= restart_at:
+                    del self._restart_at[index]
+                    self._spawn(index)
+
+        return self._shutdown()
+
+    def _shutdown(self) -> int:
+        workers: List[multiprocessing.Process] = list(self._workers.values())
+        logger.info(f"🛑 워커 {len(workers)}개에 종료 신호 전달")
+        for process in workers:
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+        # 워커 자체 대기 시간에 프로세스 정리 여유를 더해 기다림
+        deadline = time.time() + self.grace + 5
+        for process in workers:
+            process.join(max(0.0, deadline - time.time()))
+
+        killed = 0
+        for process in workers:
+            if process.is_alive():
+                process.kill()
+                process.join()
+                killed += 1
+        if killed:
+            logger.warning(f"⚠️ 시간 안에 끝나지 않은 워커 {killed}개 강제 종료")
+            return 1
+        logger.info("👋 모든 워커 종료")
+        return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='PR Review Agent 큐 워커')
+    parser.add_argument(
+        '--processes', type=int, default=Config.WORKER_PROCESSES,
+        help='워커 프로세스 수 (0이면 CPU 코어 수, 기본값: WORKER_PROCESSES)'
+    )
+    parser.add_argument(
+        '--queues', default=Config.WORKER_QUEUES,
+        help="처리할 큐 (쉼표로 구분, 'review' | 'slack', 기본값: WORKER_QUEUES)"
+    )
+    parser.add_argument(
+        '--grace', type=float, default=Config.SHUTDOWN_GRACE_SECONDS,
+        help='SIGTERM 후 진행 중 작업 대기 시간(초, 기본값: SHUTDOWN_GRACE_SECONDS)'
+    )
+    args = parser.parse_args(argv)
+
+    # app.py와 같은 로그 설정 (fork된 워커도 그대로 사용)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('app.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+    try:
+        Config.validate()
+    except ValueError as e:
+        logger.error(f"❌ 환경변수 검증 실패: {e}")
+        return 1
+
+    queues = [name.strip() for name in args.queues.split(',') if name.strip()]
+    unknown = [name for name in queues if name not in ('review', 'slack')]
+    if not queues or unknown:
+        parser.error(f"알 수 없는 큐: {', '.join(unknown) or '(없음)'}")
+
+    processes = args.processes or os.cpu_count() or 1
+    return Supervisor(processes, queues, args.grace).run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())